@@ -1,88 +1,222 @@
 import numpy as np
-import shlex
+import loader
 
-def Day1_Part1(filename='Inputs/Day1_Inputs.txt'):
+def Day1_Part1(filename='Inputs/Day1_Inputs.txt', display=False):
     """
     Determine where the depth of a submarine, taken from an input file, increases
     or decreases at each measurement, and calculate how many times it increases.
-    
+
     Parameters
     ----------
-    filename : str
-        Input file containing a list of depths.
-        
+    filename : str or list of int
+        Input file containing a list of depths, or the list of depths itself.
+    display : bool, optional
+        Whether or not to print every measurement and whether it increased.
+        The default is False.
+
     Returns
     -------
     increased : int
         The number of times the depth increased over the previous measurement.
-        
+
     """
-    file = open(filename)
-    depths = []
-    for line in file:
-        line = line.strip()
-        line = shlex.split(line)
-        if len(line) > 0:
-            depths.append(int(line[0]))
-    file.close()
-
-    increased = 0
-    print(f'{depths[0]} (N/A - no previous measurement)')
-    for n, d in enumerate(depths):
-        if n == 0:
-            continue
-        if d > depths[n-1]:
-            print(f'{d} (increased)')
-            increased += 1
-        elif d == depths[n-1]:
-            print(f'{d} (no change)')
-        else:
-            print(f'{d} (decreased)')
-    
+    depths = loader.load(filename, loader.read_ints)
+
+    if display:
+        print_changes(depths, 'N/A - no previous measurement')
+
+    increased = count_increases(depths, 1)
     return increased
 
-def Day1_Part2(filename='Inputs/Day1_Inputs.txt'):
+def Day1_Part2(filename='Inputs/Day1_Inputs.txt', display=False):
     """
     Determine where the sum of a three-measurement sliding window of depths of a
     submarine, taken from an input file, increases or decreases at each measurement,
     and calculate how many times it increases.
-    
+
     Parameters
     ----------
-    filename : str
-        Input file containing a list of depths.
-        
+    filename : str or list of int
+        Input file containing a list of depths, or the list of depths itself.
+    display : bool, optional
+        Whether or not to print every sum and whether it increased.
+        The default is False.
+
     Returns
     -------
     increased : int
         The number of times the sum of a three-measurement sliding window of depths
         increased over the previous measurement.
-        
+
+    """
+    depths = loader.load(filename, loader.read_ints)
+
+    if display:
+        print_changes(window_sums(depths, 3), 'N/A - no previous sum')
+
+    increased = count_increases(depths, 3)
+    return increased
+
+def window_sums(depths, window):
+    """
+    Calculates the sum of every sliding window of a given width over a list of depths,
+    as the differences of a cumulative sum.
+
+    Parameters
+    ----------
+    depths : array of int
+        List of depths.
+    window : int
+        Width of the sliding window.
+
+    Returns
+    -------
+    sums : array of int
+        The sum of each window, with len(depths) - window + 1 entries.
+
+    """
+    cumulative = np.concatenate(([0], np.cumsum(depths, dtype=np.int64)))
+    return cumulative[window:] - cumulative[:-window]
+
+def count_increases(depths, window=1):
+    """
+    Calculates how many times the sum of a sliding window of depths of a given width
+    increases over the previous sum.
+
+    Parameters
+    ----------
+    depths : array of int
+        List of depths.
+    window : int, optional
+        Width of the sliding window.
+        The default is 1.
+
+    Returns
+    -------
+    increased : int
+        The number of times the sum of the sliding window increased.
+
+    """
+    increased = count_increases_batch(depths, [window])[window]
+    return increased
+
+def count_increases_batch(depths, windows, start=0, block_size=2**16):
+    """
+    Calculates how many times the sum of a sliding window of depths increases over the
+    previous sum, for many window widths in a single pass over the depths. Consecutive
+    windows of width k share all but their first and last depths, so the sum increases
+    exactly when depths[i+k] > depths[i], and no window sums need to be calculated. The
+    depths are processed in blocks small enough to stay in cache while every width is
+    compared.
+
+    Parameters
+    ----------
+    depths : array of int
+        List of depths.
+    windows : iterable of int
+        Widths of the sliding windows.
+    start : int, optional
+        Index of the first depth at which a window may end, with earlier depths only
+        used for comparison, e.g. when they were already counted in a previous chunk.
+        The default is 0.
+    block_size : int, optional
+        Number of depths to compare at a time.
+        The default is 2**16.
+
+    Returns
+    -------
+    increased : dict {int : int}
+        Dictionary mapping each window width to the number of times the sum of the
+        sliding window increased.
+
+    """
+    depths = np.asarray(depths, dtype=np.int64)
+    increased = {window: 0 for window in windows}
+    for low in range(start, len(depths), block_size):
+        high = min(low + block_size, len(depths))
+        for window in increased:
+            # Compare every depth ending a window in this block with the depth the
+            # window has just moved past
+            first = max(low, window)
+            if first < high:
+                increased[window] += int(np.count_nonzero(
+                    depths[first:high] > depths[first-window:high-window]))
+
+    return increased
+
+def stream_increases(filename, window=1, chunk_size=2**20):
+    """
+    Calculates how many times the sum of a sliding window of depths increases over the
+    previous sum, for one or many window widths, reading the depths in chunks so that
+    feeds of any length are processed in constant memory. The last few depths of each
+    chunk are carried over to the next, so windows spanning two chunks are still
+    compared.
+
+    Parameters
+    ----------
+    filename : str or iterable of arrays of int
+        Input file containing a list of depths, or an iterable giving successive chunks
+        of depths, e.g. from a live feed.
+    window : int or iterable of int, optional
+        Width of the sliding window, or widths of several sliding windows.
+        The default is 1.
+    chunk_size : int, optional
+        Number of bytes to read from the input file at a time.
+        The default is 2**20.
+
+    Returns
+    -------
+    increased : int or dict {int : int}
+        The number of times the sum of the sliding window increased, or a dictionary
+        mapping each window width to this if several widths were given.
+
+    """
+    if loader.is_filename(filename):
+        chunks = loader.iter_int_chunks(filename, chunk_size)
+    else:
+        chunks = filename
+    windows = [window] if isinstance(window, (int, np.integer)) else list(window)
+    # Depths needed from previous chunks to compare against the widest window
+    max_window = max(windows)
+
+    increased = dict.fromkeys(windows, 0)
+    carry = np.zeros(0, dtype=np.int64)
+    for chunk in chunks:
+        depths = np.concatenate((carry, np.asarray(chunk, dtype=np.int64)))
+        # Only count windows ending in this chunk, as the rest were counted already
+        for w, n in count_increases_batch(depths, windows, len(carry)).items():
+            increased[w] += n
+        carry = depths[-max_window:]
+
+    if isinstance(window, (int, np.integer)):
+        return increased[window]
+    return increased
+
+def print_changes(values, first_label):
+    """
+    Prints every value in a list and whether it increased, decreased or stayed the same
+    compared to the previous value.
+
+    Parameters
+    ----------
+    values : array of int
+        List of values.
+    first_label : str
+        Label to print for the first value, which has no previous value.
+
+    Returns
+    -------
+    None.
+
     """
-    file = open(filename)
-    depths = []
-    for line in file:
-        line = line.strip()
-        line = shlex.split(line)
-        if len(line) > 0:
-            depths.append(int(line[0]))
-    file.close()
-    
-    combined_depths = []
-    for n in range(len(depths)-2):
-        combined_depths.append(np.sum(depths[n:n+3]))
-        
-    increased = 0
-    print(f'{combined_depths[0]} (N/A - no previous sum)')
-    for m, c in enumerate(combined_depths):
-        if m == 0:
-            continue
-        if c > combined_depths[m-1]:
-            print(f'{c} (increased)')
-            increased += 1
-        elif c == combined_depths[m-1]:
-            print(f'{c} (no change)')
+    values = np.asarray(values).tolist()
+    if not values:
+        return
+    print(f'{values[0]} ({first_label})')
+    for previous, value in zip(values, values[1:]):
+        if value > previous:
+            print(f'{value} (increased)')
+        elif value == previous:
+            print(f'{value} (no change)')
         else:
-            print(f'{c} (decreased)')
-    
-    return increased
\ No newline at end of file
+            print(f'{value} (decreased)')
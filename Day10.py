@@ -1,4 +1,4 @@
-import shlex
+import loader
 
 def Day10_Part1(filename='Inputs/Day10_Inputs.txt'):
     """
@@ -11,8 +11,8 @@ def Day10_Part1(filename='Inputs/Day10_Inputs.txt'):
 
     Parameters
     ----------
-    filename : str, optional
-        Input file containing the lines of characters.
+    filename : str or list of str, optional
+        Input file containing the lines of characters, or the list of lines itself.
         The default is 'Inputs/Day10_Inputs.txt'.
 
     Returns
@@ -21,14 +21,7 @@ def Day10_Part1(filename='Inputs/Day10_Inputs.txt'):
         Total syntax error score of all corrupted lines in the input file.
 
     """
-    file = open(filename)
-    lines = []
-    for line in file:
-        line = line.strip()
-        line = shlex.split(line)
-        if len(line) > 0:
-            lines.append(line)
-    file.close()
+    lines = loader.load(filename, loader.read_lines)
     
     start_chars = ['(', '[', '{', '<']
     end_chars = [')', ']', '}', '>']
@@ -37,13 +30,13 @@ def Day10_Part1(filename='Inputs/Day10_Inputs.txt'):
     corrupted_chunks, unexpected_chars, syntax_error_score = [], [], 0
     for chunks in lines:
         openers = []
-        for char in chunks[0]:            
+        for char in chunks:            
             if char == '(' or char == '[' or char == '{' or char == '<':
                 openers.append(char)
                 
             else:
                 if len(openers) == 0:
-                    corrupted_chunks.append(chunks[0])
+                    corrupted_chunks.append(chunks)
                     unexpected_chars.append(char)
                     syntax_error_score += scores[end_chars.index(char)]
                     break
@@ -53,7 +46,7 @@ def Day10_Part1(filename='Inputs/Day10_Inputs.txt'):
                     continue
                 
                 else:
-                    corrupted_chunks.append(chunks[0])
+                    corrupted_chunks.append(chunks)
                     unexpected_chars.append(char)
                     syntax_error_score += scores[end_chars.index(char)]
                     break
@@ -74,8 +67,8 @@ def Day10_Part2(filename='Inputs/Day10_Inputs.txt'):
 
     Parameters
     ----------
-    filename : str, optional
-        Input file containing the lines of characters.
+    filename : str or list of str, optional
+        Input file containing the lines of characters, or the list of lines itself.
         The default is 'Inputs/Day10_Inputs.txt'.
 
     Returns
@@ -84,14 +77,7 @@ def Day10_Part2(filename='Inputs/Day10_Inputs.txt'):
         Median autocorrect score of all incomplete lines in the input file.
 
     """
-    file = open(filename)
-    lines = []
-    for line in file:
-        line = line.strip()
-        line = shlex.split(line)
-        if len(line) > 0:
-            lines.append(line)
-    file.close()
+    lines = loader.load(filename, loader.read_lines)
     
     start_chars = ['(', '[', '{', '<']
     end_chars = [')', ']', '}', '>']
@@ -100,7 +86,7 @@ def Day10_Part2(filename='Inputs/Day10_Inputs.txt'):
     completion_string_scores = []
     for chunks in lines:
         counts, openers, corrupted = [0, 0, 0, 0], [], False
-        for char in chunks[0]:
+        for char in chunks:
             if char == '(' or char == '[' or char == '{' or char == '<':
                 openers.append(char)
                 
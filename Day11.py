@@ -1,5 +1,6 @@
-import shlex
 import numpy as np
+import loader
+from grid import Grid
 
 def Day11_Part1(steps, filename='Inputs/Day11_Inputs.txt'):
     """
@@ -16,9 +17,9 @@ def Day11_Part1(steps, filename='Inputs/Day11_Inputs.txt'):
     ----------
     steps : int
         Total number of steps from the initital starting point to simulate.
-    filename : str, optional
+    filename : str or array of int, optional
         Input file containing the initial energy levels of all octupi in the grid of
-        octupi.
+        octupi, or a 2D array of these energy levels.
         The default is 'Inputs/Day11_Inputs.txt'.
 
     Returns
@@ -27,80 +28,68 @@ def Day11_Part1(steps, filename='Inputs/Day11_Inputs.txt'):
         The total number of times an octopus flashes in the given number of steps.
 
     """
-    file = open(filename)
-    octupi = []
-    for line in file:
-        line = line.strip()
-        line = shlex.split(line)
-        if len(line) > 0:
-            octupi.append(line[0])
-    file.close()
-    
-    energy = []
-    coordinates = []
-    for row, octopus_row in enumerate(octupi):
-        for column, octopus in enumerate(octopus_row):
-            energy.append(int(octopus))
-            coordinates.append([row, column])
-    
-    print('Before any steps:')
-    for row in range(10):
-        row_str = ''
-        for column in range(10):
-            row_str += str(energy[coordinates.index([row, column])])
-        print(row_str)
-    print('')
-    
+    energy = Grid(loader.load(filename, loader.read_digit_grid), dtype=np.int64)
+
+    print_octupi('Before any steps:', energy)
+
     flashes = 0
     for step in range(steps):
-    
-        energy = list(np.array(energy) + 1)
-        try:
-            energy.index(10)
-            max_energy = True
-            
-        except:
-            max_energy = False
-            
-        while max_energy:
-            max_coords = coordinates[energy.index(10)]
-            energy[coordinates.index(max_coords)] = -1
-            for row in range(max_coords[0]-1, max_coords[0]+2):
-                for column in range(max_coords[1]-1, max_coords[1]+2):
-                    try:
-                        energy_here = energy[coordinates.index([row, column])]
-                        if energy_here < 10 and energy_here > -1:
-                            energy[coordinates.index([row, column])] += 1
-                    
-                    except:
-                        pass
-            
-            try:
-                energy.index(10)
-                max_energy = True
-            
-            except:
-                max_energy = False
-        
-        while True:
-            try:
-                energy[energy.index(-1)] = 0
-            
-            except:
-                break
-        
-        flashes += energy.count(0)
-        
-        print(f'After step {step + 1}:')
-        for row in range(10):
-            row_str = ''
-            for column in range(10):
-                row_str += str(energy[coordinates.index([row, column])])
-            print(row_str)
-        print('')
-        
+        flashes += int(step_octupi(energy).sum())
+        print_octupi(f'After step {step + 1}:', energy)
+
     return flashes
 
+def step_octupi(energy):
+    """
+    Performs a single step for a grid of octupi, in place. The energy level of every octopus
+    increases by 1, then any octupi with an energy level above 9 flash, increasing the energy
+    levels of all adjacent octupi by 1, including diagonally adjacent octupi. This repeats for
+    any octupi pushed above 9 until no more octupi flash, as each octopus can flash at most once
+    per step. Every octopus which flashed then has its energy level reset to 0.
+
+    Parameters
+    ----------
+    energy : Grid
+        Grid of the energy levels of all octupi, which is updated in place.
+
+    Returns
+    -------
+    flashed : array of bool
+        Which octupi flashed during the step.
+
+    """
+    levels = energy.values
+    levels += 1
+    flashed = np.zeros(levels.shape, dtype=bool)
+    # Flash every octopus above 9 which has not yet flashed, in waves
+    while (flashing := (levels > 9) & ~flashed).any():
+        flashed |= flashing
+        levels += Grid(flashing, fill=False).count_neighbours(8)
+    levels[flashed] = 0
+    return flashed
+
+def print_octupi(title, energy):
+    """
+    Prints the energy levels of the top left 10x10 corner of a grid of octupi, under a given
+    title, which is the whole grid for the puzzle input.
+
+    Parameters
+    ----------
+    title : str
+        Title to print above the grid.
+    energy : Grid
+        Grid of the energy levels of all octupi.
+
+    Returns
+    -------
+    None.
+
+    """
+    print(title)
+    for row in energy.values[:10, :10].tolist():
+        print(''.join(str(level) for level in row))
+    print('')
+
 def Day11_Part2(filename='Inputs/Day11_Inputs.txt'):
     """
     Calculates the number of steps required before all octupi in a grid, given in an input
@@ -114,9 +103,9 @@ def Day11_Part2(filename='Inputs/Day11_Inputs.txt'):
 
     Parameters
     ----------
-    filename : str, optional
+    filename : str or array of int, optional
         Input file containing the initial energy levels of all octupi in the grid of
-        octupi.
+        octupi, or a 2D array of these energy levels.
         The default is 'Inputs/Day11_Inputs.txt'.
 
     Returns
@@ -125,77 +114,16 @@ def Day11_Part2(filename='Inputs/Day11_Inputs.txt'):
         The number of steps required before all octupi flash simulataneously.
 
     """
-    file = open(filename)
-    octupi = []
-    for line in file:
-        line = line.strip()
-        line = shlex.split(line)
-        if len(line) > 0:
-            octupi.append(line[0])
-    file.close()
-    
-    energy = []
-    coordinates = []
-    for row, octopus_row in enumerate(octupi):
-        for column, octopus in enumerate(octopus_row):
-            energy.append(int(octopus))
-            coordinates.append([row, column])
-    
-    print('Before any steps:')
-    for row in range(10):
-        row_str = ''
-        for column in range(10):
-            row_str += str(energy[coordinates.index([row, column])])
-        print(row_str)
-    print('')
-    
+    energy = Grid(loader.load(filename, loader.read_digit_grid), dtype=np.int64)
+
+    print_octupi('Before any steps:', energy)
+
     step = 0
     while True:
         step += 1
-        energy = list(np.array(energy) + 1)
-        try:
-            energy.index(10)
-            max_energy = True
-            
-        except:
-            max_energy = False
-            
-        while max_energy:
-            max_coords = coordinates[energy.index(10)]
-            energy[coordinates.index(max_coords)] = -1
-            for row in range(max_coords[0]-1, max_coords[0]+2):
-                for column in range(max_coords[1]-1, max_coords[1]+2):
-                    try:
-                        energy_here = energy[coordinates.index([row, column])]
-                        if energy_here < 10 and energy_here > -1:
-                            energy[coordinates.index([row, column])] += 1
-                    
-                    except:
-                        pass
-            
-            try:
-                energy.index(10)
-                max_energy = True
-            
-            except:
-                max_energy = False
-        
-        while True:
-            try:
-                energy[energy.index(-1)] = 0
-            
-            except:
-                break
-        
-        if all(energy_here == 0 for energy_here in energy):
+        if step_octupi(energy).all():
             break
-        
-    print(f'After step {step}:')
-    for row in range(10):
-        row_str = ''
-        for column in range(10):
-            row_str += str(energy[coordinates.index([row, column])])
-        print(row_str)
-    print('')
-        
-    return step
\ No newline at end of file
+
+    print_octupi(f'After step {step}:', energy)
+
+    return step
@@ -1,4 +1,4 @@
-import shlex
+import loader
 
 def check_paths(first, links, path, paths):
     """
@@ -51,8 +51,9 @@ def Day12_Part1(filename='Inputs/Day12_Inputs.txt', printout=False):
 
     Parameters
     ----------
-    filename : str
-        The input file containing every link between two caves.
+    filename : str or list of str
+        The input file containing every link between two caves, or the list of links in
+        the form 'first-second'.
         The default is 'Inputs/Day12_Inputs.txt'.
     printout : bool
         Whether or not to print out every path found.
@@ -64,14 +65,7 @@ def Day12_Part1(filename='Inputs/Day12_Inputs.txt', printout=False):
         The number of possible paths throught the caves from 'start' to 'end'.
 
     """
-    file = open(filename)
-    connections = []
-    for line in file:
-        line = line.strip()
-        line = shlex.split(line)
-        if len(line) > 0:
-            connections.append(line[0])
-    file.close()
+    connections = loader.load(filename, loader.read_lines)
      
     links = {}
     for connection in connections:
@@ -152,8 +146,9 @@ def Day12_Part2(filename='Inputs/Day12_Inputs.txt', printout=False):
 
     Parameters
     ----------
-    filename : str
-        The input file containing every link between two caves.
+    filename : str or list of str
+        The input file containing every link between two caves, or the list of links in
+        the form 'first-second'.
         The default is 'Inputs/Day12_Inputs.txt'.
     printout : bool
         Whether or not to print out every path found.
@@ -165,14 +160,7 @@ def Day12_Part2(filename='Inputs/Day12_Inputs.txt', printout=False):
         The number of possible paths throught the caves from 'start' to 'end'.
 
     """
-    file = open(filename)
-    connections = []
-    for line in file:
-        line = line.strip()
-        line = shlex.split(line)
-        if len(line) > 0:
-            connections.append(line[0])
-    file.close()
+    connections = loader.load(filename, loader.read_lines)
      
     links = {}
     for connection in connections:
@@ -1,4 +1,4 @@
-import shlex
+import loader
 
 def Day14_Part1(stepmax, filename='Inputs/Day14_Inputs.txt', printout=False):
     """
@@ -11,8 +11,9 @@ def Day14_Part1(stepmax, filename='Inputs/Day14_Inputs.txt', printout=False):
     ----------
     stepmax : int
         The number of rounds of insertion to perform on the initial string.
-    filename : str, optional
-        Input files giving the initial string and pair insertion rules.
+    filename : str or list of lists of str, optional
+        Input files giving the initial string and pair insertion rules, or the
+        whitespace-separated tokens on each non-empty line of such a file.
         The default is 'Inputs/Day14_Inputs.txt'.
     printout : bool, optional
         Whether or not to print the result of each round of insertion.
@@ -25,17 +26,11 @@ def Day14_Part1(stepmax, filename='Inputs/Day14_Inputs.txt', printout=False):
          the initial string after 'stepmax' rounds of insertions.
 
     """
-    file = open(filename)
-    instructions = []
-    for line in file:
-        line = line.strip()
-        line = shlex.split(line)
-        instructions.append(line)
-    file.close()
+    instructions = loader.load(filename, loader.read_tokens)
     
     template = instructions[0][0]
-    doubles = [instruction[0] for instruction in instructions[2:]]
-    insertions = [instruction[2] for instruction in instructions[2:]]
+    doubles = [instruction[0] for instruction in instructions[1:]]
+    insertions = [instruction[2] for instruction in instructions[1:]]
     
     if printout:
         print('Template:     ' + template)
@@ -83,8 +78,9 @@ def Day14_Part2(stepmax, filename='Inputs/Day14_Inputs.txt'):
     ----------
     stepmax : int
         The number of rounds of insertion to perform on the initial string.
-    filename : str, optional
-        Input files giving the initial string and pair insertion rules.
+    filename : str or list of lists of str, optional
+        Input files giving the initial string and pair insertion rules, or the
+        whitespace-separated tokens on each non-empty line of such a file.
         The default is 'Inputs/Day14_Inputs.txt'.
 
     Returns
@@ -94,17 +90,11 @@ def Day14_Part2(stepmax, filename='Inputs/Day14_Inputs.txt'):
          the initial string after 'stepmax' rounds of insertions.
 
     """
-    file = open(filename)
-    instructions = []
-    for line in file:
-        line = line.strip()
-        line = shlex.split(line)
-        instructions.append(line)
-    file.close()
+    instructions = loader.load(filename, loader.read_tokens)
     
     template = instructions[0][0]
-    doubles = [instruction[0] for instruction in instructions[2:]]
-    insertions = [instruction[2] for instruction in instructions[2:]]
+    doubles = [instruction[0] for instruction in instructions[1:]]
+    insertions = [instruction[2] for instruction in instructions[1:]]
     
     counts = {template[0] : 1, template[-1] : 1}
     
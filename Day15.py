@@ -1,91 +1,9 @@
-import shlex
+import heapq
 import numpy as np
+import loader
+import instrument
+from grid import Grid
 
-class Coordinates:
-    """
-    Class to define a pair of coordinates (x, y)
-    """
-    def __init__(self, pos):
-        """
-        Initialise the class with one parameter.
-
-        Parameters
-        ----------
-        pos : list of int
-            Coordinates in the form [x, y].
-            
-        Returns
-        -------
-        None.
-
-        """
-        self.x = pos[0]
-        self.y = pos[1]
-    
-    def __repr__(self):
-        """
-        Return the representation of a Coordinates object.
-
-        Returns
-        -------
-        str
-            Representation.
-
-        """
-        return f'{self.__class__.__name__}({self.x}, {self.y})'
-    
-    def __hash__(self):
-        """
-        Override the hash function for a Coordinates object.
-
-        Returns
-        -------
-        int
-            The hash of the Coordinates.
-
-        """
-        return hash((self.x, self.y))
-
-    def __eq__(self, other):
-        """
-        Overrides the == operator for a Coordinates object.
-
-        Parameters
-        ----------
-        other : Coordinates
-            The Coordinates object to which we are comparing.
-
-        Returns
-        -------
-        bool
-            Whether the two Coordinates are equivalent or not.
-
-        """
-        return (self.x, self.y) == (other.x, other.y)
-
-    def __ne__(self, other):
-        """
-        Overrides the != operator for a Coordinates object.
-
-        Parameters
-        ----------
-        other : Coordinates
-            The Coordinates object to which we are comparing.
-
-        Returns
-        -------
-        bool
-            Whether the two Coordinates are different or not.
-
-        """
-        return not(self == other)
-    
-    def __pos__(self):
-        """
-        Return a copy of the Coordinates.
-        """
-        return self.__class__([self.x, self.y])
-    
 def Day15_Part1(filename='Inputs/Day15_Inputs.txt'):
     """
     Uses Dijkstra's algorithm to calculate the minimum total risk of any path from the top
@@ -94,8 +12,8 @@ def Day15_Part1(filename='Inputs/Day15_Inputs.txt'):
 
     Parameters
     ----------
-    filename : str, optional
-        Input file giving the risk level of every point.
+    filename : str or array of int, optional
+        Input file giving the risk level of every point, or a 2D array of these risk levels.
         The default is 'Inputs/Day15_Inputs.txt'.
 
     Returns
@@ -105,67 +23,65 @@ def Day15_Part1(filename='Inputs/Day15_Inputs.txt'):
         grid.
 
     """
-    file = open(filename)
-    unvisited, points, tentatives, line_num = {}, [], [], 0
-    for line in file:
-        line = line.strip()
-        line = shlex.split(line)
-        if len(line) > 0:
-            for n, risk in enumerate(line[0]):
-                unvisited[Coordinates([n, line_num])] = [int(risk), 9e99]
-                xmax = n
-            line_num += 1
-    ymax = line_num - 1
-    file.close()
-    
-    points = [point for point in unvisited]
-    tentatives = [9e99 for point in unvisited]
-    
-    current = Coordinates([0, 0])
-    unvisited[current][1] = 0
-    tentatives[points.index(current)] = 0
-    while current != Coordinates([xmax, ymax]):
-        for neighbour in adjacent(current):
-            try:
-                dist_curr = unvisited[current][1] + unvisited[neighbour][0]
-                if dist_curr < unvisited[neighbour][1]:
-                    unvisited[neighbour][1] = dist_curr
-                    tentatives[points.index(neighbour)] = dist_curr
-            except:
-                continue
-            
-        unvisited.pop(current)
-        index = points.index(current)
-        points.pop(index)
-        tentatives.pop(index)
-        current = +points[np.argmin(tentatives)]
-    
-    min_risk = unvisited[current][1]
+    with instrument.span('parse'):
+        risks = np.asarray(loader.load(filename, loader.read_digit_grid))
+    with instrument.span('solve'):
+        min_risk = find_min_risk(risks)
     return min_risk
-    
-    
-def adjacent(point):
+
+def find_min_risk(risks):
     """
-    Calculates the four Coordinates immediately adjacent to a given pair of Coordinates.
+    Uses Dijkstra's algorithm, with a binary heap as the priority queue, to calculate the
+    minimum total risk of any path from the top left to the bottom right of a grid of points.
+    The grid is padded with a border of points which are marked as already visited, so the
+    neighbours of every point can be found from fixed offsets in the flattened grid without
+    checking whether they are on the grid. When instrumented, counts the points visited and the
+    pushes onto the heap.
 
     Parameters
     ----------
-    point : Coordinates
-        The initial Coordinates.
+    risks : array of int
+        2D array of the risk level of every point on the grid.
 
     Returns
     -------
-    next_points : list of Coordinates
-        The four adjacent Coordinates.
+    min_risk : int
+        The minimum total risk of any path from the top left to the bottom right of the
+        grid.
 
     """
-    x, y = point.x, point.y
-    next_points = []
-    for x_next in [x-1, x+1]:
-        next_points.append(Coordinates([x_next, y]))
-    for y_next in [y-1, y+1]:
-        next_points.append(Coordinates([x, y_next]))
-    return next_points
+    grid = Grid(risks, dtype=np.int64)
+    rows, columns = grid.shape
+    risk = grid.data.ravel().tolist()
+    # Tentative distance to every point, starting at -1 for the padding so it is never entered
+    padding = np.pad(np.zeros(grid.shape, dtype=bool), grid.pad, constant_values=True)
+    tentatives = np.where(padding, -1, np.iinfo(np.int64).max).ravel().tolist()
+    offsets = grid.flat_offsets()
+
+    start, end = grid.flat_index(0, 0), grid.flat_index(rows-1, columns-1)
+    tentatives[start] = 0
+    queue = [(0, start)]
+    # Count locally, as the loop is too hot to call the instrumentation every time
+    visited, pushes = 0, 1
+    while queue:
+        dist_curr, current = heapq.heappop(queue)
+        if current == end:
+            break
+        # Skip outdated queue entries for points already reached by a shorter path
+        if dist_curr > tentatives[current]:
+            continue
+        visited += 1
+        for offset in offsets:
+            neighbour = current + offset
+            if (dist_next := dist_curr + risk[neighbour]) < tentatives[neighbour]:
+                tentatives[neighbour] = dist_next
+                heapq.heappush(queue, (dist_next, neighbour))
+                pushes += 1
+
+    instrument.count('points_visited', visited)
+    instrument.count('heap_pushes', pushes)
+    min_risk = dist_curr
+    return min_risk
 
 def Day15_Part2(filename='Inputs/Day15_Inputs.txt'):
     """
@@ -180,8 +96,9 @@ def Day15_Part2(filename='Inputs/Day15_Inputs.txt'):
 
     Parameters
     ----------
-    filename : str, optional
-        Input file giving the risk level of every point in the initial grid.
+    filename : str or array of int, optional
+        Input file giving the risk level of every point in the initial grid, or a 2D array of
+        these risk levels.
         The default is 'Inputs/Day15_Inputs.txt'.
 
     Returns
@@ -191,45 +108,13 @@ def Day15_Part2(filename='Inputs/Day15_Inputs.txt'):
         extended grid.
 
     """
-    file = open(filename)
-    unvisited, points, tentatives, line_num = {}, [], [], 0
-    for line in file:
-        line = line.strip()
-        line = shlex.split(line)
-        if len(line) > 0:
-            for n, risk in enumerate(line[0]):
-                unvisited[Coordinates([n, line_num])] = [int(risk), 9e99]
-                xmax = n
-            line_num += 1
-    ymax = line_num - 1
-    file.close()
-    
-    unvisited = extend_grid(unvisited, xmax, ymax)    
-    points = [point for point in unvisited]
-    tentatives = [9e99 for point in unvisited]
-    
-    current = Coordinates([0, 0])
-    unvisited[current][1] = 0
-    tentatives[points.index(current)] = 0
-    while current != Coordinates([(5*(xmax+1))-1, (5*(ymax+1))-1]):
-        for neighbour in adjacent(current):
-            try:
-                dist_curr = unvisited[current][1] + unvisited[neighbour][0]
-                if dist_curr < unvisited[neighbour][1]:
-                    unvisited[neighbour][1] = dist_curr
-                    tentatives[points.index(neighbour)] = dist_curr
-            except:
-                continue
-            
-        unvisited.pop(current)
-        index = points.index(current)
-        points.pop(index)
-        tentatives.pop(index)
-        current = +points[np.argmin(tentatives)]
-    
-    return unvisited[current][1]
+    with instrument.span('parse'):
+        risks = np.asarray(loader.load(filename, loader.read_digit_grid))
+    with instrument.span('solve'):
+        min_risk = find_min_risk(extend_grid(risks))
+    return min_risk
 
-def extend_grid(unvisited, xmax, ymax):
+def extend_grid(risks):
     """
     Calculates an extended grid from an initial grid, where the initial grid forms the top
     left tile in a 5x5 tile area that forms the full map, with the original map tile
@@ -239,28 +124,16 @@ def extend_grid(unvisited, xmax, ymax):
 
     Parameters
     ----------
-    unvisited : dict {Coordinates : [int, int]}
-        Map of every point on the initial grid to its assigned risk level and current
-        tentative distance to the starting point (as in Dijkstra's algorithm).
-    xmax : int
-        The maximum x-coordinate of the initial grid.
-    ymax : int
-        The maximum y-coordinate of the initial grid.
+    risks : array of int
+        2D array of the risk level of every point on the initial grid.
 
     Returns
     -------
-    unvisited_new : dict {Coordinates : [int, int]}
-        Map of every point on the extended grid to its assigned risk level and current
-        tentative distance to the starting point (as in Dijkstra's algorithm).
+    risks_new : array of int
+        2D array of the risk level of every point on the extended grid.
 
     """
-    unvisited_new = dict()
-    for point in unvisited:
-        for n_x, x in enumerate(range(point.x, point.x + (5*(xmax+1)), xmax+1)):
-            for n_y, y in enumerate(range(point.y, point.y + (5*(ymax+1)), ymax+1)):
-                risk = unvisited[point][0] + n_x + n_y
-                if risk > 9:
-                    risk %= 9
-                unvisited_new[Coordinates([x, y])] = [risk, 9e99]
-                
-    return unvisited_new
+    risks = np.asarray(risks, dtype=np.int64)
+    risks_new = np.block([[(risks + n_x + n_y - 1) % 9 + 1 for n_x in range(5)]
+                          for n_y in range(5)])
+    return risks_new
@@ -1,4 +1,4 @@
-import shlex
+import loader
 
 def Day16_Part1(filename='Inputs/Day16_Inputs.txt'):
     """
@@ -7,8 +7,9 @@ def Day16_Part1(filename='Inputs/Day16_Inputs.txt'):
 
     Parameters
     ----------
-    filename : str, optional
-        Input file giving the encoded transmission.
+    filename : str or list of str, optional
+        Input file giving the encoded transmission, or a list whose last element is the
+        encoded transmission.
         The default is 'Inputs/Day16_Inputs.txt'.
 
     Returns
@@ -17,13 +18,7 @@ def Day16_Part1(filename='Inputs/Day16_Inputs.txt'):
         The sum of the version numbers in all packets.
 
     """
-    file = open(filename)
-    for line in file:
-        line = line.strip()
-        line = shlex.split(line)
-        if len(line) > 0:
-            data = line[0]
-    file.close()
+    data = loader.load(filename, loader.read_lines)[-1]
     
     binary_data = ''
     for hexa in data:
@@ -58,8 +53,9 @@ def Day16_Part2(filename='Inputs/Day16_Inputs.txt'):
 
     Parameters
     ----------
-    filename : str, optional
-        Input file giving the encoded transmission.
+    filename : str or list of str, optional
+        Input file giving the encoded transmission, or a list whose last element is the
+        encoded transmission.
         The default is 'Inputs/Day16_Inputs.txt'.
 
     Returns
@@ -68,13 +64,7 @@ def Day16_Part2(filename='Inputs/Day16_Inputs.txt'):
         The result of evaluating the decoded expression.
 
     """
-    file = open(filename)
-    for line in file:
-        line = line.strip()
-        line = shlex.split(line)
-        if len(line) > 0:
-            data = line[0]
-    file.close()
+    data = loader.load(filename, loader.read_lines)[-1]
     
     binary_data = ''
     for hexa in data:
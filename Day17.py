@@ -1,4 +1,4 @@
-import shlex
+import loader
 
 def Day17_Part1(filename='Inputs/Day17_Inputs.txt'):
     """
@@ -10,8 +10,9 @@ def Day17_Part1(filename='Inputs/Day17_Inputs.txt'):
 
     Parameters
     ----------
-    filename : str, optional
-        Input file giving the target area.
+    filename : str or list of lists of str, optional
+        Input file giving the target area, or the whitespace-separated tokens on each line
+        of such a file.
         The default is 'Inputs/Day17_Inputs.txt'.
 
     Returns
@@ -21,13 +22,7 @@ def Day17_Part1(filename='Inputs/Day17_Inputs.txt'):
         through the target area.
 
     """
-    file = open(filename)
-    for line in file:
-        line = line.strip()
-        line = shlex.split(line)
-        if len(line) > 0:
-            data = line
-    file.close()
+    data = loader.load(filename, loader.read_tokens)[-1]
     x_data = data[2].split('..')
     y_data = data[3].split('..')
     limits = [[int(x_data[0][2:]), int(x_data[1][:-1])], [int(y_data[0][2:]), int(y_data[1])]]
@@ -130,8 +125,9 @@ def Day17_Part2(filename='Inputs/Day17_Inputs.txt'):
 
     Parameters
     ----------
-    filename : str, optional
-        Input file giving the target area.
+    filename : str or list of lists of str, optional
+        Input file giving the target area, or the whitespace-separated tokens on each line
+        of such a file.
         The default is 'Inputs/Day17_Inputs.txt'.
 
     Returns
@@ -141,13 +137,7 @@ def Day17_Part2(filename='Inputs/Day17_Inputs.txt'):
         pass through the target area.
 
     """
-    file = open(filename)
-    for line in file:
-        line = line.strip()
-        line = shlex.split(line)
-        if len(line) > 0:
-            data = line
-    file.close()
+    data = loader.load(filename, loader.read_tokens)[-1]
     x_data = data[2].split('..')
     y_data = data[3].split('..')
     limits = [[int(x_data[0][2:]), int(x_data[1][:-1])], [int(y_data[0][2:]), int(y_data[1])]]
@@ -1,4 +1,4 @@
-import shlex
+import loader
 
 def snail_mag(snail_num):
     """
@@ -46,8 +46,9 @@ def Day18_Part1(filename='Inputs/Day18_Inputs.txt', printout=False):
 
     Parameters
     ----------
-    filename : str, optional
-        The input file giving the list of snail numbers to be added.
+    filename : str or list of str, optional
+        The input file giving the list of snail numbers to be added, or the list of snail
+        numbers as strings.
         The default is 'Inputs/Day18_Inputs.txt'.
     printout : bool, optional
         Whether or not to print every steps of the addition and possible reduction.
@@ -62,34 +63,29 @@ def Day18_Part1(filename='Inputs/Day18_Inputs.txt', printout=False):
 
     """
 
-    file = open(filename)
     data = []
-    for line in file:
-        line = line.strip()
-        line = shlex.split(line)
-        if len(line) > 0:
-            snail_num, i, level = [], 0, 0
-            while i < len(line[0]):
-                if line[0][i] == '[':
-                    level += 1
-                    i += 1
-                elif line[0][i] == ']':
-                    level -= 1
+    for line in loader.load(filename, loader.read_lines):
+        snail_num, i, level = [], 0, 0
+        while i < len(line):
+            if line[i] == '[':
+                level += 1
+                i += 1
+            elif line[i] == ']':
+                level -= 1
+                i += 1
+            elif line[i].isnumeric():
+                reg_num = ''
+                while line[i].isnumeric():
+                    reg_num += line[i]
                     i += 1
-                elif line[0][i].isnumeric():
-                    reg_num = ''
-                    while line[0][i].isnumeric():
-                        reg_num += line[0][i]
-                        i += 1
-                    if line[0][i] == ',':
-                        index = 0
-                    else:
-                        index = 1
-                    snail_num.append([level, index, int(reg_num)])
+                if line[i] == ',':
+                    index = 0
                 else:
-                    i += 1
-            data.append(snail_num)
-    file.close()
+                    index = 1
+                snail_num.append([level, index, int(reg_num)])
+            else:
+                i += 1
+        data.append(snail_num)
     
     snail_sum = data[0]
     for snail_num in data[1:]:
@@ -218,8 +214,9 @@ def Day18_Part2(filename='Inputs/Day18_Inputs.txt'):
 
     Parameters
     ----------
-    filename : str, optional
-        The input file giving the list of snail numbers to be added.
+    filename : str or list of str, optional
+        The input file giving the list of snail numbers to be added, or the list of snail
+        numbers as strings.
         The default is 'Inputs/Day18_Inputs.txt'.
 
     Returns
@@ -229,34 +226,29 @@ def Day18_Part2(filename='Inputs/Day18_Inputs.txt'):
         the input snail numbers.
 
     """
-    file = open(filename)
     data = []
-    for line in file:
-        line = line.strip()
-        line = shlex.split(line)
-        if len(line) > 0:
-            snail_num, i, level = [], 0, 0
-            while i < len(line[0]):
-                if line[0][i] == '[':
-                    level += 1
-                    i += 1
-                elif line[0][i] == ']':
-                    level -= 1
+    for line in loader.load(filename, loader.read_lines):
+        snail_num, i, level = [], 0, 0
+        while i < len(line):
+            if line[i] == '[':
+                level += 1
+                i += 1
+            elif line[i] == ']':
+                level -= 1
+                i += 1
+            elif line[i].isnumeric():
+                reg_num = ''
+                while line[i].isnumeric():
+                    reg_num += line[i]
                     i += 1
-                elif line[0][i].isnumeric():
-                    reg_num = ''
-                    while line[0][i].isnumeric():
-                        reg_num += line[0][i]
-                        i += 1
-                    if line[0][i] == ',':
-                        index = 0
-                    else:
-                        index = 1
-                    snail_num.append([level, index, int(reg_num)])
+                if line[i] == ',':
+                    index = 0
                 else:
-                    i += 1
-            data.append(snail_num)
-    file.close()
+                    index = 1
+                snail_num.append([level, index, int(reg_num)])
+            else:
+                i += 1
+        data.append(snail_num)
     
     max_magnitude = 0
     for snail_sum in data:
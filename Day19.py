@@ -1,5 +1,6 @@
-import shlex
 import numpy as np
+import loader
+from coordinates import Coordinates
 
 # define the 24 rotation matices in 3D with 0 determinant
 rotations = [np.array([[1, 0, 0], [0, 1, 0], [0, 0, 1]]),
@@ -27,89 +28,6 @@ rotations = [np.array([[1, 0, 0], [0, 1, 0], [0, 0, 1]]),
              np.array([[0, 0, -1], [0, 1, 0], [1, 0, 0]]),
              np.array([[0, 0, -1], [0, -1, 0], [-1, 0, 0]])]
 
-class Coordinates:
-    """
-    Class to define a set of coordinates (x, y, z)
-    """
-    def __init__(self, pos):
-        """
-        Initialise the class with one parameter.
-
-        Parameters
-        ----------
-        pos : list of int
-            Coordinates in the form [x, y, z].
-
-        """
-        self.pos = pos
-        self.x = pos[0]
-        self.y = pos[1]
-        self.z = pos[2]
-    
-    def __repr__(self):
-        """
-        Return the representation of a Coordinates object.
-
-        Returns
-        -------
-        str
-            Representation.
-
-        """
-        return f'{self.__class__.__name__}({self.x}, {self.y}, {self.z})'
-    
-    def __hash__(self):
-        """
-        Override the hash function for a Coordinates object.
-
-        Returns
-        -------
-        int
-            The hash of the Coordinates.
-
-        """
-        return hash((self.x, self.y, self.z))
-
-    def __eq__(self, other):
-        """
-        Overrides the == operator for a Coordinates object.
-
-        Parameters
-        ----------
-        other : Coordinates
-            The Coordinates object to which we are comparing.
-
-        Returns
-        -------
-        bool
-            Whether the two Coordinates are equivalent or not.
-
-        """
-        return (self.x, self.y, self.z) == (other.x, other.y, other.z)
-
-    def __ne__(self, other):
-        """
-        Overrides the != operator for a Coordinates object.
-
-        Parameters
-        ----------
-        other : Coordinates
-            The Coordinates object to which we are comparing.
-
-        Returns
-        -------
-        bool
-            Whether the two Coordinates are different or not.
-
-        """
-        return not(self == other)
-    
-    def __pos__(self):
-        """
-        Return a copy of the Coordinates.
-        """
-        return self.__class__([self.x, self.y, self.z])
-
 def Day19_Part1(filename='Inputs/Day19_Inputs.txt'):
     """
     Calculates the total number of unique beacons in a 3D area of water, given the
@@ -122,9 +40,9 @@ def Day19_Part1(filename='Inputs/Day19_Inputs.txt'):
 
     Parameters
     ----------
-    filename : str, optional
+    filename : str or list of lists of str, optional
         Input file giving every scanner and the relative coordinates of the beacons it
-        detects.
+        detects, or the sections of such a file as returned by loader.read_sections.
         The default is 'Inputs/Day19_Inputs.txt'.
 
     Returns
@@ -134,24 +52,15 @@ def Day19_Part1(filename='Inputs/Day19_Inputs.txt'):
 
     """
 
-    file = open(filename)
-    data = []
-    for line in file:
-        line = line.strip()
-        line = shlex.split(line)
-        if len(line) > 0:
-            data.append(line)
-    file.close()
+    data = loader.load(filename, loader.read_sections)
 
     scanners = []
-    for line in data:
-        if 'scanner' in line:
-            scanners.append(['Scanner ' + line[2]])
-        else:
-            scanners[-1].append(np.array([int(i) for i in line[0].split(',')]))
+    for section in data:
+        beacons = np.array(','.join(section[1:]).split(','), dtype=np.int64).reshape(-1, 3)
+        scanners.append(['Scanner ' + section[0].split()[2]] + list(beacons))
 
     corrected_scanners = [scanners.pop(0)]
-    beacons = {Coordinates(beacon) for beacon in corrected_scanners[0][1:]}
+    beacons = {Coordinates(beacon.tolist()) for beacon in corrected_scanners[0][1:]}
     searched_scanners = dict()
     while len(scanners) > 0:
         print(len(corrected_scanners))
@@ -166,7 +75,7 @@ def Day19_Part1(filename='Inputs/Day19_Inputs.txt'):
                             rotated_scanner.append(rotation.dot(coord))
                         for coord in rotated_scanner:
                             for corrected_coord in corrected_scanner[1:]:
-                                offset = Coordinates(corrected_coord - coord)
+                                offset = Coordinates((corrected_coord - coord).tolist())
                                 try:
                                     offsets[offset] += 1
                                     if offsets[offset] >= 12:
@@ -188,8 +97,8 @@ def Day19_Part1(filename='Inputs/Day19_Inputs.txt'):
             if match_found:
                 new_corrected_scanner = [scanner[0]]
                 for beacon in rotated_scanner:
-                    new_corrected_scanner.append(beacon + np.array(offset.pos))
-                    beacons.add(Coordinates(new_corrected_scanner[-1]))
+                    new_corrected_scanner.append(beacon + np.array(offset))
+                    beacons.add(Coordinates(new_corrected_scanner[-1].tolist()))
                 corrected_scanners.append(new_corrected_scanner)
                 scanners.pop(n)
                 break
@@ -208,9 +117,9 @@ def Day19_Part2(filename='Inputs/Day19_Inputs.txt'):
 
     Parameters
     ----------
-    filename : str, optional
+    filename : str or list of lists of str, optional
         Input file giving every scanner and the relative coordinates of the beacons it
-        detects.
+        detects, or the sections of such a file as returned by loader.read_sections.
         The default is 'Inputs/Day19_Inputs.txt'.
 
     Returns
@@ -219,24 +128,15 @@ def Day19_Part2(filename='Inputs/Day19_Inputs.txt'):
         The largest Manhattan distance between any two scanners.
 
     """
-    file = open(filename)
-    data = []
-    for line in file:
-        line = line.strip()
-        line = shlex.split(line)
-        if len(line) > 0:
-            data.append(line)
-    file.close()
+    data = loader.load(filename, loader.read_sections)
 
     scanners = []
-    for line in data:
-        if 'scanner' in line:
-            scanners.append(['Scanner ' + line[2]])
-        else:
-            scanners[-1].append(np.array([int(i) for i in line[0].split(',')]))
+    for section in data:
+        beacons = np.array(','.join(section[1:]).split(','), dtype=np.int64).reshape(-1, 3)
+        scanners.append(['Scanner ' + section[0].split()[2]] + list(beacons))
 
     corrected_scanners = [scanners.pop(0)]
-    beacons = {Coordinates(beacon) for beacon in corrected_scanners[0][1:]}
+    beacons = {Coordinates(beacon.tolist()) for beacon in corrected_scanners[0][1:]}
     scanner_positions = [[0, 0, 0]]
     searched_scanners = dict()
     while len(scanners) > 0:
@@ -252,7 +152,7 @@ def Day19_Part2(filename='Inputs/Day19_Inputs.txt'):
                             rotated_scanner.append(rotation.dot(coord))
                         for coord in rotated_scanner:
                             for corrected_coord in corrected_scanner[1:]:
-                                offset = Coordinates(corrected_coord - coord)
+                                offset = Coordinates((corrected_coord - coord).tolist())
                                 try:
                                     offsets[offset] += 1
                                     if offsets[offset] >= 12:
@@ -274,9 +174,9 @@ def Day19_Part2(filename='Inputs/Day19_Inputs.txt'):
             if match_found:
                 new_corrected_scanner = [scanner[0]]
                 for beacon in rotated_scanner:
-                    scanner_positions.append([-1*pos for pos in offset.pos])
-                    new_corrected_scanner.append(beacon + np.array(offset.pos))
-                    beacons.add(Coordinates(new_corrected_scanner[-1]))
+                    scanner_positions.append(list(-offset))
+                    new_corrected_scanner.append(beacon + np.array(offset))
+                    beacons.add(Coordinates(new_corrected_scanner[-1].tolist()))
                 corrected_scanners.append(new_corrected_scanner)
                 scanners.pop(n)
                 break
@@ -1,4 +1,5 @@
-import shlex
+import numpy as np
+import loader
 
 class Submarine:
     """
@@ -80,19 +81,150 @@ class Submarine:
         self.x += dx
         self.depth += dx*self.aim
         
-def Day2_Part1and2(filename='Inputs/Day2_Inputs.txt', submarine=Submarine(0, 0, 0)):
+# Opcodes for each direction of movement in an encoded command stream
+OPCODES = {'forward': 0, 'down': 1, 'up': 2}
+
+def encode_commands(directions):
+    """
+    Encode a series of instructions as arrays of opcodes and magnitudes, so that they can
+    be run in bulk.
+
+    Parameters
+    ----------
+    directions : list of lists of str
+        The instructions, split into [direction, magnitude] pairs.
+
+    Raises
+    ------
+    Exception
+        If an unknown direction is given.
+
+    Returns
+    -------
+    opcodes : array of int
+        The opcode of each instruction, as given in OPCODES.
+    magnitudes : array of int
+        The magnitude of each instruction.
+
+    """
+    try:
+        opcodes = np.array([OPCODES[d[0]] for d in directions], dtype=np.int8)
+    except KeyError:
+        raise Exception("Unknown direction!")
+    magnitudes = np.array([d[1] for d in directions], dtype=np.int64)
+    return opcodes, magnitudes
+
+def run_commands(opcodes, magnitudes, x=0, depth=0, aim=0, trajectory=False):
+    """
+    Move a submarine according to a series of encoded instructions, as vectorised
+    operations over the whole series rather than one instruction at a time. The aim after
+    each instruction is the cumulative sum of the up and down movements, and each forward
+    movement changes the depth by its magnitude times the current aim, so the positions
+    are cumulative sums too.
+
+    Parameters
+    ----------
+    opcodes : array of int
+        The opcode of each instruction, as given in OPCODES.
+    magnitudes : array of int
+        The magnitude of each instruction.
+    x : int, optional
+        Initial horizontal position of the submarine.
+        The default is 0.
+    depth : int, optional
+        Initial depth of the submarine.
+        The default is 0.
+    aim : int, optional
+        Initial aim of the submarine.
+        The default is 0.
+    trajectory : bool, optional
+        Whether to return the state after every instruction, rather than just the final
+        state.
+        The default is False.
+
+    Returns
+    -------
+    tuple (int, int, int) or tuple (array of int, array of int, array of int)
+        Horizontal position, depth and aim of the submarine, either after the final
+        instruction or after every instruction.
+
+    """
+    opcodes = np.asarray(opcodes)
+    magnitudes = np.asarray(magnitudes, dtype=np.int64)
+    forward = np.where(opcodes == OPCODES['forward'], magnitudes, 0)
+    aims = aim + np.cumsum(np.where(opcodes == OPCODES['down'], magnitudes, 0) -
+                           np.where(opcodes == OPCODES['up'], magnitudes, 0))
+    xs = x + np.cumsum(forward)
+    depths = depth + np.cumsum(forward*aims)
+
+    if trajectory:
+        return xs, depths, aims
+    if len(opcodes) == 0:
+        return x, depth, aim
+    return int(xs[-1]), int(depths[-1]), int(aims[-1])
+
+def run_fleet(opcodes, magnitudes, initial_states, trajectory=False):
+    """
+    Move a fleet of submarines with different initial states according to the same series
+    of encoded instructions, as vectorised operations over both the fleet and the series.
+    The cumulative sums of the instructions are shared by every submarine, as a submarine
+    starting with aim a0 has its depth changed by an extra a0 times each forward movement.
+
+    Parameters
+    ----------
+    opcodes : array of int
+        The opcode of each instruction, as given in OPCODES.
+    magnitudes : array of int
+        The magnitude of each instruction.
+    initial_states : array of int
+        Initial state of every submarine, in the form [[x, depth, aim], ...].
+    trajectory : bool, optional
+        Whether to return the states of every submarine after every instruction, rather
+        than just the final states. This needs memory proportional to the number of
+        submarines times the number of instructions.
+        The default is False.
+
+    Returns
+    -------
+    states : array of int
+        Final state of every submarine in the form [[x, depth, aim], ...], or if trajectory
+        is True, the state of every submarine after every instruction in the form
+        states[submarine][instruction] = [x, depth, aim].
+
+    """
+    opcodes = np.asarray(opcodes)
+    magnitudes = np.asarray(magnitudes, dtype=np.int64)
+    x, depth, aim = np.asarray(initial_states, dtype=np.int64).reshape(-1, 3).T[:, :, None]
+    # Cumulative movements for a submarine starting with zero aim
+    forward = np.where(opcodes == OPCODES['forward'], magnitudes, 0)
+    aims = np.cumsum(np.where(opcodes == OPCODES['down'], magnitudes, 0) -
+                     np.where(opcodes == OPCODES['up'], magnitudes, 0))
+    xs = np.cumsum(forward)
+    depths = np.cumsum(forward*aims)
+
+    if not trajectory:
+        # Only the final totals are needed, or zeros if there are no instructions
+        xs, depths, aims = (a[-1:] if len(a) else np.zeros(1, dtype=np.int64) \
+                            for a in (xs, depths, aims))
+    states = np.stack(np.broadcast_arrays(x + xs, depth + depths + aim*xs, aim + aims), axis=-1)
+    return states if trajectory else states[:, 0]
+
+def Day2_Part1and2(filename='Inputs/Day2_Inputs.txt', submarine=None):
     """
     Move a submarine, starting at a horizontal position of 0 and a depth of 0, according
     to a series of instructions given in an input file.
 
     Parameters
     ----------
-    filename : str, optional
-        The input file containing the instructions.
+    filename : str or list of lists of str, optional
+        The input file containing the instructions, or the instructions already split into
+        [direction, magnitude] pairs.
         The default is 'Inputs/Day2_Inputs.txt'.
-    submarine : Submarine, optional
-        The submarine object which will be moved according to the instructions.
-        The default is Submarine(0, 0, 0) (starting at the origin).
+    submarine : Submarine or None, optional
+        The submarine object which will be moved according to the instructions, which
+        starts from the origin whatever its current state, or None to create a new
+        submarine. Use Day2_Fleet to start from other states.
+        The default is None.
 
     Raises
     ------
@@ -107,29 +239,47 @@ def Day2_Part1and2(filename='Inputs/Day2_Inputs.txt', submarine=Submarine(0, 0,
         Product of the final horizontal position and depth of the submarine.
 
     """
-    file = open(filename)
-    directions = []
-    for line in file:
-        line = line.strip()
-        line = shlex.split(line)
-        if len(line) > 0:
-            directions.append(line)
-    file.close()
-
-    submarine.x, submarine.depth, submarine.aim = 0, 0, 0
-    
-    for d in directions:
-        if d[0] == 'forward':
-            submarine.forward(int(d[1]))
-            
-        elif d[0] == 'down':
-            submarine.down(int(d[1]))
-            
-        elif d[0] == 'up':
-            submarine.up(int(d[1]))
-            
-        else:
-            raise Exception("Unknown direction!")
-    
+    directions = loader.load(filename, loader.read_tokens)
+
+    # Run every instruction at once, then update the submarine with its final state. The
+    # methods of Submarine give the equivalent step-by-step movement.
+    if submarine is None:
+        submarine = Submarine(0, 0, 0)
+    submarine.x, submarine.depth, submarine.aim = run_commands(*encode_commands(directions))
+
     return (submarine.x, submarine.depth), submarine.x*submarine.depth
-        
\ No newline at end of file
+        
+def Day2_Fleet(initial_states, filename='Inputs/Day2_Inputs.txt', trajectory=False):
+    """
+    Move a fleet of submarines with different initial states according to the same series
+    of instructions given in an input file, which is only parsed once.
+
+    Parameters
+    ----------
+    initial_states : array of int
+        Initial state of every submarine, in the form [[x, depth, aim], ...].
+    filename : str or list of lists of str, optional
+        The input file containing the instructions, or the instructions already split into
+        [direction, magnitude] pairs.
+        The default is 'Inputs/Day2_Inputs.txt'.
+    trajectory : bool, optional
+        Whether to return the states of every submarine after every instruction, rather
+        than just the final states.
+        The default is False.
+
+    Raises
+    ------
+    Exception
+        If an unknown direction is given.
+
+    Returns
+    -------
+    states : array of int
+        Final state of every submarine in the form [[x, depth, aim], ...], or if trajectory
+        is True, the state of every submarine after every instruction in the form
+        states[submarine][instruction] = [x, depth, aim].
+
+    """
+    directions = loader.load(filename, loader.read_tokens)
+    states = run_fleet(*encode_commands(directions), initial_states, trajectory)
+    return states
@@ -1,86 +1,6 @@
-import shlex
-
-class Coordinates:
-    """
-    Class to define a set of coordinates (x, y)
-    """
-    def __init__(self, pos):
-        """
-        Initialise the class with one parameter.
-
-        Parameters
-        ----------
-        pos : list of int
-            Coordinates in the form [x, y].
-
-        """
-        self.pos = pos
-        self.x = pos[0]
-        self.y = pos[1]
-    
-    def __repr__(self):
-        """
-        Return the representation of a Coordinates object.
-
-        Returns
-        -------
-        str
-            Representation.
-
-        """
-        return f'{self.__class__.__name__}({self.x}, {self.y})'
-    
-    def __hash__(self):
-        """
-        Override the hash function for a Coordinates object.
-
-        Returns
-        -------
-        int
-            The hash of the Coordinates.
-
-        """
-        return hash((self.x, self.y))
-
-    def __eq__(self, other):
-        """
-        Overrides the == operator for a Coordinates object.
-
-        Parameters
-        ----------
-        other : Coordinates
-            The Coordinates object to which we are comparing.
-
-        Returns
-        -------
-        bool
-            Whether the two Coordinates are equivalent or not.
-
-        """
-        return (self.x, self.y) == (other.x, other.y)
-
-    def __ne__(self, other):
-        """
-        Overrides the != operator for a Coordinates object.
-
-        Parameters
-        ----------
-        other : Coordinates
-            The Coordinates object to which we are comparing.
-
-        Returns
-        -------
-        bool
-            Whether the two Coordinates are different or not.
-
-        """
-        return not(self == other)
-    
-    def __pos__(self):
-        """
-        Return a copy of the Coordinates.
-        """
-        return self.__class__([self.x, self.y])
+import numpy as np
+import loader
+from grid import Grid
 
 def Day20_Part1and2(steps, filename='Inputs/Day20_Inputs.txt', display=False,
                     displayresult=False):
@@ -98,8 +18,9 @@ def Day20_Part1and2(steps, filename='Inputs/Day20_Inputs.txt', display=False,
     ----------
     steps : int
         The number of steps of enhancement to apply to the input image.
-    filename : str, optional
-        The input file containing the image enhancement algorithm and and the input image.
+    filename : str or list of str, optional
+        The input file containing the image enhancement algorithm and and the input image,
+        or the non-empty lines of such a file.
         The default is 'Inputs/Day20_Inputs.txt'.
     display : bool, optional
         Whether or not to print the image after each step of enhancement.
@@ -115,66 +36,31 @@ def Day20_Part1and2(steps, filename='Inputs/Day20_Inputs.txt', display=False,
 
     """
 
-    file = open(filename)
-    data = []
-    for line in file:
-        line = line.strip()
-        line = shlex.split(line)
-        if len(line) > 0:
-            data.append(line)
-    file.close()
+    data = loader.load(filename, loader.read_lines)
 
-    algorithm = data[0][0]
-    input_image = dict()
-    for column, line in enumerate(data[1:]):
-        for row, char in enumerate(line[0]):
-            input_image[Coordinates([row, column])] = char
+    # Convert the algorithm and image to arrays of 0 for dark pixels and 1 for light pixels
+    algorithm = Grid.from_lines([data[0]], '.#', pad=0).values[0]
+    image = Grid.from_lines(data[1:], '.#', pad=0).values
+    # Every pixel beyond the image starts dark, but may change with each step
+    background = 0
+    # Weight of the pixel at each offset in the 3x3 square, read left to right then top to bottom
+    weights = [(dr, dc, 2**(8 - 3*(dr+1) - (dc+1))) for dr in (-1, 0, 1) for dc in (-1, 0, 1)]
 
     for step in range(0, steps):
         print(f'Step {step}')
-        xmax = max([coord.x for coord in input_image]) + 1
-        xmin = min([coord.x for coord in input_image]) - 1
-        ymax = max([coord.y for coord in input_image]) + 1
-        ymin = min([coord.y for coord in input_image]) - 1
-
         if display:
-            for y in range(ymin+1, ymax, 1):
-                row = ''
-                for x in range(xmin+1, xmax, 1):
-                    row += input_image[Coordinates([x, y])]
-                print(row)
+            print('\n'.join(Grid(image, pad=0).to_lines('.#')))
         print()
 
-        enhanced_image = dict()
-        for y in range(ymin, ymax+1, 1):
-            for x in range(xmin, xmax+1, 1):
-                binary = ''
-                for y_ext in [y-1, y, y+1]:
-                    for x_ext in [x-1, x, x+1]:
-                        try:
-                            if input_image[Coordinates([x_ext, y_ext])] == '.':
-                                binary += '0'
-                            elif input_image[Coordinates([x_ext, y_ext])] == '#':
-                                binary += '1'
-                        except:
-                            if algorithm[0] == '.':
-                                binary += '0'
-                            else:
-                                if step%2 == 0:
-                                    binary += '0'
-                                else:
-                                    binary += '1'
-
-                enhanced_image[Coordinates([x, y])] = algorithm[int(binary, base=2)]
-
-        input_image = enhanced_image.copy()
+        # Grow the image by one pixel on every side, as far as the enhancement can reach, then
+        # pad it with the background to read the 3x3 square around every pixel
+        grid = Grid(np.pad(image, 1, constant_values=background), fill=background)
+        index = sum(grid.shifted(dr, dc).astype(np.int64) * weight for dr, dc, weight in weights)
+        image = algorithm[index]
+        background = int(algorithm[511*background])
 
     if displayresult:
-        for y in range(ymin, ymax+1, 1):
-            row = ''
-            for x in range(xmin, xmax+1, 1):
-                row += input_image[Coordinates([x, y])]
-            print(row)
+        print('\n'.join(Grid(image, pad=0).to_lines('.#')))
 
-    light_num = sum([input_image[coords] == '#' for coords in input_image])
+    light_num = int(image.sum(dtype=np.int64))
     return light_num
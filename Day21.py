@@ -1,4 +1,5 @@
-import shlex
+import loader
+import instrument
 import itertools
 
 def Day21_Part1(filename='Inputs/Day21_Inputs.txt'):
@@ -18,8 +19,9 @@ def Day21_Part1(filename='Inputs/Day21_Inputs.txt'):
 
     Parameters
     ----------
-    filename : str, optional
-        Input file giving the starting position of each player.
+    filename : str or list of lists of str, optional
+        Input file giving the starting position of each player, or the whitespace-separated
+        tokens on each line of such a file.
         The default is 'Inputs/Day21_Inputs.txt'.
 
     Returns
@@ -30,14 +32,7 @@ def Day21_Part1(filename='Inputs/Day21_Inputs.txt'):
 
     """
 
-    file = open(filename)
-    positions = []
-    for line in file:
-        line = line.strip()
-        line = shlex.split(line)
-        if len(line) > 0:
-            positions.append(int(line[-1]))
-    file.close()
+    positions = [int(line[-1]) for line in loader.load(filename, loader.read_tokens)]
 
     dice, dice_rolls, player, scores = 1, 0, 0, [0, 0]
     while not any(score >= 1000 for score in scores):
@@ -146,8 +141,9 @@ def Day21_Part2(filename='Inputs/Day21_Inputs.txt'):
 
     Parameters
     ----------
-    filename : str, optional
-        Input file giving the starting position of each player.
+    filename : str or list of lists of str, optional
+        Input file giving the starting position of each player, or the whitespace-separated
+        tokens on each line of such a file.
         The default is 'Inputs/Day21_Inputs.txt'.
 
     Returns
@@ -158,33 +154,31 @@ def Day21_Part2(filename='Inputs/Day21_Inputs.txt'):
 
     """
 
-    file = open(filename)
-    positions = []
-    for line in file:
-        line = line.strip()
-        line = shlex.split(line)
-        if len(line) > 0:
-            positions.append(int(line[-1]))
-    file.close()
-
-    possible_rolls = dict()
-    for rolls in set(itertools.combinations([1, 2, 3]*3, 3)):
-        try:
-            possible_rolls[sum(rolls)] += 1
-        except:
-            possible_rolls[sum(rolls)] = 1
-
-    # status = [position1, position2, score1, score2]
-    all_states, wins = {GameState([positions[0], positions[1], 0, 0]) : 1}, [0, 0]
-    while len(all_states) > 0:
-        new_states = dict()
-        for state in all_states:
-            new_states, wins = possible_outcomes(state, all_states[state], possible_rolls, new_states, wins)
-    
-        all_states = new_states.copy()
+    with instrument.span('parse'):
+        positions = [int(line[-1]) for line in loader.load(filename, loader.read_tokens)]
 
-    wins[0] = int(wins[0]/27)
-    most_wins = max(wins)
+    with instrument.span('solve'):
+        possible_rolls = dict()
+        for rolls in set(itertools.combinations([1, 2, 3]*3, 3)):
+            try:
+                possible_rolls[sum(rolls)] += 1
+            except:
+                possible_rolls[sum(rolls)] = 1
+
+        # status = [position1, position2, score1, score2]
+        all_states, wins = {GameState([positions[0], positions[1], 0, 0]) : 1}, [0, 0]
+        while len(all_states) > 0:
+            # Count the states passed to possible_outcomes, when instrumented
+            instrument.count('states', len(all_states))
+            new_states = dict()
+            for state in all_states:
+                new_states, wins = possible_outcomes(state, all_states[state], possible_rolls,
+                                                     new_states, wins)
+
+            all_states = new_states.copy()
+
+        wins[0] = int(wins[0]/27)
+        most_wins = max(wins)
     return most_wins
 
 def possible_outcomes(state, number, possible_rolls, new_states, wins):
@@ -1,5 +1,6 @@
 from functools import reduce
 import operator
+import loader
 
 class RangeException(Exception):
     """
@@ -132,8 +133,9 @@ def get_input(input_file: str='Inputs/Day22_Inputs.txt', limited_volume=None) ->
 
     Parameters
     ----------
-    input_file : str, optional
-        Input file containing the reboot steps.
+    input_file : str or list(tuple(str, Cuboid)), optional
+        Input file containing the reboot steps, or the already-parsed reboot steps in the form
+        (instruction, Cuboid).
         The default is 'Inputs/Day22_Inputs.txt'.
     limited_volume : Cuboid or None, optional
         If not None then the Cuboid describing the limited volume to consider, ignoring the rest
@@ -146,19 +148,22 @@ def get_input(input_file: str='Inputs/Day22_Inputs.txt', limited_volume=None) ->
         List of reboot steps in the form (instruction, Cuboid).
 
     """
-    # Parse input file
-    with open(input_file) as f:
-        cuboids = []
-        for line in f.readlines():
-            line = line.strip().split()
-            # Extract axis ranges and build corresponding Cuboid
-            cuboid = Cuboid([int(i) for i in re.findall('[-\d]+', line[1])])
-            # If a limited volume is defined, only consider the overlap with this volume
-            if limited_volume:
-                cuboid = cuboid.find_overlap(limited_volume)
-                if cuboid is None:
-                    continue
-            cuboids.append((line[0], cuboid))
+    # Parse input file, extracting axis ranges and building the corresponding Cuboids, unless the
+    # reboot steps have already been parsed
+    if loader.is_filename(input_file):
+        steps = [(line[0], Cuboid([int(i) for i in re.findall('[-\d]+', line[1])])) \
+                 for line in loader.read_tokens(input_file)]
+    else:
+        steps = input_file
+
+    cuboids = []
+    for state, cuboid in steps:
+        # If a limited volume is defined, only consider the overlap with this volume
+        if limited_volume:
+            cuboid = cuboid.find_overlap(limited_volume)
+            if cuboid is None:
+                continue
+        cuboids.append((state, cuboid))
 
     return cuboids
 
@@ -171,8 +176,9 @@ def Day22_Part1(input_file: str='Inputs/Day22_Inputs.txt') -> int:
 
     Parameters
     ----------
-    input_file : str, optional
-        Input file containing the reboot steps.
+    input_file : str or list(tuple(str, Cuboid)), optional
+        Input file containing the reboot steps, or the already-parsed reboot steps in the form
+        (instruction, Cuboid).
         The default is 'Inputs/Day22_Inputs.txt'.
 
     Returns
@@ -211,8 +217,9 @@ def Day22_Part2(input_file: str='Inputs/Day22_Inputs.txt') -> None:
 
     Parameters
     ----------
-    input_file : str, optional
-        Input file containing the reboot steps.
+    input_file : str or list(tuple(str, Cuboid)), optional
+        Input file containing the reboot steps, or the already-parsed reboot steps in the form
+        (instruction, Cuboid).
         The default is 'Inputs/Day22_Inputs.txt'.
 
     Returns
@@ -1,3 +1,6 @@
+import loader
+import instrument
+
 # Set up required destinations for each amphipod type, column numbers of corridor-only columns
 # (no side room attached) and the costs of moving each amphipod type
 DESTINATIONS = {'A': 2, 'B': 4, 'C': 6, 'D': 8}
@@ -276,7 +279,7 @@ def move_amphipod(amphipod: str, new_col: int, columns: dict, places: dict, not_
 
 def find_cheapest_route(columns: dict, places: dict, not_at_dest: set, energy_spent: int=0,
                         curr_min: int=100000, room_size: int=2, route: list=[], min_route: list=[],
-                        columns_cache: dict={}) -> tuple:
+                        columns_cache: dict={}, stats: dict=None) -> tuple:
     """
     Performs a recursive depth-first search to find the method for organising a given layout of
     amphipods in a burrow into their required destinations which uses the least energy. The burrow
@@ -314,6 +317,10 @@ def find_cheapest_route(columns: dict, places: dict, not_at_dest: set, energy_sp
         A cache of the minimum cost to reach every burrow layout found so far, in the form
         {columns: min_cost}. Columns are converted from lists to strings to allow for hashing.
         The default is {}.
+    stats : dict(str: int) or None, optional
+        Counters of the search, in the form {'nodes_expanded': int}, which are updated in place,
+        or None to not count. The caller passes the totals to the instrumentation once.
+        The default is None.
 
     Returns
     -------
@@ -324,6 +331,10 @@ def find_cheapest_route(columns: dict, places: dict, not_at_dest: set, energy_sp
         form (amphipod_that_moved, column_moved_to).
 
     """
+    # Count every node of the search tree visited locally, as this is too hot to call the
+    # instrumentation every time
+    if stats is not None:
+        stats['nodes_expanded'] += 1
     # Group relevant parameters for tidiness
     params = (columns, places, not_at_dest, energy_spent)
 
@@ -380,7 +391,7 @@ def find_cheapest_route(columns: dict, places: dict, not_at_dest: set, energy_sp
         return find_cheapest_route(*new_params, curr_min, room_size,
                                    route + [(can_move_to_dest[0],
                                              DESTINATIONS[can_move_to_dest[0][0]])],
-                                   min_route, columns_cache)
+                                   min_route, columns_cache, stats)
 
     # Else if there are no amphipods which can move straight to their destinations
     else:
@@ -404,7 +415,7 @@ def find_cheapest_route(columns: dict, places: dict, not_at_dest: set, energy_sp
                 # not change if no cheaper route is found
                 curr_min, min_route = find_cheapest_route(*new_params, curr_min, room_size,
                                                           route + [(amphipod, move)], min_route,
-                                                          columns_cache)
+                                                          columns_cache, stats)
 
     return curr_min, min_route
 
@@ -412,7 +423,8 @@ from time import perf_counter
 
 def time_function(func):
     """
-    Decorator function to measure runtime of given function.
+    Decorator function to measure runtime of given function, which is also recorded as a span
+    when instrumented.
 
     Parameters
     ----------
@@ -422,7 +434,8 @@ def time_function(func):
     """
     def wrapper(*args, **kwargs):
         t1 = perf_counter()
-        out = func(*args, **kwargs)
+        with instrument.span(func.__name__):
+            out = func(*args, **kwargs)
         t2 = perf_counter() - t1
         print(f'{func.__name__} ran in {t2:.7f} seconds')
         return out
@@ -456,8 +469,9 @@ def Day23_Part1(input_file: str='Inputs/Day23_Inputs.txt') -> tuple:
 
     Parameters
     ----------
-    input_file : str, optional
-        Inupt file giving the initial layout of the amphipods in the burrow.
+    input_file : str or tuple, optional
+        Inupt file giving the initial layout of the amphipods in the burrow, or the layout as
+        returned by get_input.
         The default is 'Inputs/Day23_Inputs.txt'.
 
     Returns
@@ -471,15 +485,20 @@ def Day23_Part1(input_file: str='Inputs/Day23_Inputs.txt') -> tuple:
     """
     # Parse input file to extract amphipod position information, including which are not already
     # in their destinations
-    columns, places, not_at_dest = get_input(input_file)
+    with instrument.span('parse'):
+        columns, places, not_at_dest = loader.load(input_file, get_input)
 
     # Draw the initial burrow layout
-    draw_columns(columns, 2, True)
+    with instrument.span('output'):
+        draw_columns(columns, 2, True)
 
     # Perform a recursive depth-first search through potential routes to find the minimum possible
     # energy cost, and corresponding route
-    min_energy, min_route = find_cheapest_route(columns, places, not_at_dest, 0, 100000,
-                                                2, [], [], {})
+    with instrument.span('solve'):
+        stats = {'nodes_expanded': 0}
+        min_energy, min_route = find_cheapest_route(columns, places, not_at_dest, 0, 100000,
+                                                    2, [], [], {}, stats)
+        instrument.count('nodes_expanded', stats['nodes_expanded'])
 
     return min_energy, min_route
 
@@ -515,8 +534,9 @@ def Day23_Part2(input_file: str='Inputs/Day23_Inputs.txt') -> tuple:
 
     Parameters
     ----------
-    input_file : str, optional
-        Inupt file giving the initial layout of the amphipods in the burrow.
+    input_file : str or tuple, optional
+        Inupt file giving the initial layout of the amphipods in the burrow, or the layout as
+        returned by get_input.
         The default is 'Inputs/Day23_Inputs.txt'.
 
     Returns
@@ -530,14 +550,19 @@ def Day23_Part2(input_file: str='Inputs/Day23_Inputs.txt') -> tuple:
     """
     # Parse input file to extract amphipod position information, including which are not already
     # in their destinations
-    columns, places, not_at_dest = get_input(input_file, unfolded=True)
+    with instrument.span('parse'):
+        columns, places, not_at_dest = loader.load(input_file, get_input, unfolded=True)
 
     # Draw the initial burrow layout, now with 4 amphipods per side room
-    draw_columns(columns, 4, True)
+    with instrument.span('output'):
+        draw_columns(columns, 4, True)
 
     # Perform a recursive depth-first search through potential routes to find the minimum possible
     # energy cost, and corresponding route
-    min_energy, min_route = find_cheapest_route(columns, places, not_at_dest, 0, 100000,
-                                                4, [], [], {})
+    with instrument.span('solve'):
+        stats = {'nodes_expanded': 0}
+        min_energy, min_route = find_cheapest_route(columns, places, not_at_dest, 0, 100000,
+                                                    4, [], [], {}, stats)
+        instrument.count('nodes_expanded', stats['nodes_expanded'])
 
     return min_energy, min_route
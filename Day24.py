@@ -1,3 +1,5 @@
+import loader
+
 def get_input(input_file: str='Inputs/Day24_Inputs.txt') -> list:
     """
     Parse an input file to extract a program consisting of a list of instructions, one per line.
@@ -14,9 +16,8 @@ def get_input(input_file: str='Inputs/Day24_Inputs.txt') -> list:
         List of instructions contained in the program.
 
     """
-    # Parse input file, strip and split each line
-    with open(input_file) as f:
-        program = [line.strip().split() for line in f.readlines()]
+    # Parse input file, splitting each line into its instruction and arguments
+    program = loader.read_tokens(input_file)
 
     return program
 
@@ -334,8 +335,8 @@ def Day24_Part1(input_file: str='Inputs/Day24_Inputs.txt') -> int:
 
     Parameters
     ----------
-    input_file : str, optional
-        Input file containing the MONAD program.
+    input_file : str or list(list(str)), optional
+        Input file containing the MONAD program, or the program as returned by get_input.
         The default is 'Inputs/Day24_Inputs.txt'.
 
     Returns
@@ -345,7 +346,7 @@ def Day24_Part1(input_file: str='Inputs/Day24_Inputs.txt') -> int:
 
     """
     # Parse the input file to extract the program
-    program = get_input(input_file)
+    program = loader.load(input_file, get_input)
 
     # Use the logic described above to extract the 7 conditions constraining the input values
     links = get_links(program)
@@ -379,8 +380,8 @@ def Day24_Part2(input_file: str='Inputs/Day24_Inputs.txt') -> int:
 
     Parameters
     ----------
-    input_file : str, optional
-        Input file containing the MONAD program.
+    input_file : str or list(list(str)), optional
+        Input file containing the MONAD program, or the program as returned by get_input.
         The default is 'Inputs/Day24_Inputs.txt'.
 
     Returns
@@ -390,7 +391,7 @@ def Day24_Part2(input_file: str='Inputs/Day24_Inputs.txt') -> int:
 
     """
     # Parse the input file to extract the program
-    program = get_input(input_file)
+    program = loader.load(input_file, get_input)
     
     # Use the logic described above to extract the 7 conditions constraining the input values
     links = get_links(program)
@@ -1,4 +1,5 @@
-import shlex
+import os
+import loader
 import math
 import numpy as np
 
@@ -17,14 +18,146 @@ def bin_to_dec(n):
         Converted base 10 number.
 
     """
-    n, out, power = str(n), 0, 0
-    while len(n) > 0:
-        curr = int(n[-1])
-        out += curr*(2**power)
-        n = n[:-1]
-        power += 1
+    out = int(str(n), 2)
     return out
 
+def pack_bits(bits):
+    """
+    Pack rows of bits into one unsigned 64-bit integer per row.
+
+    Parameters
+    ----------
+    bits : array of np.uint8
+        2D array of the bits of every binary number, most significant bit first, with at
+        most 64 bits per number.
+
+    Returns
+    -------
+    values : array of np.uint64
+        The value of every binary number.
+
+    """
+    num, width = bits.shape
+    # Pack every row into bytes, padded at the end, and right-align them in 8 bytes so that
+    # they can be read as a big-endian integer shifted left by the padding
+    packed = np.packbits(bits, axis=1)
+    rows = np.zeros((num, 8), dtype=np.uint8)
+    rows[:, 8-packed.shape[1]:] = packed
+    values = rows.view('>u8').ravel().astype(np.uint64) >> np.uint64(8*packed.shape[1] - width)
+    return values
+
+def pack_report(binary, chunk_size=2**20):
+    """
+    Pack a diagnostic report into one unsigned 64-bit integer per binary number, which
+    holds tens of millions of numbers in a fraction of the memory of a list of strings.
+    Input files are mapped into memory rather than read, and split into lines by their
+    fixed length, and the numbers are packed a chunk at a time, so only the packed values
+    and one chunk of bits are ever held in memory.
+
+    Parameters
+    ----------
+    binary : str or list of str or array of int
+        Input file containing the diagnostic report, the list of binary numbers in the
+        report, or a 2D array of the bits of every number, most significant bit first.
+    chunk_size : int, optional
+        Number of binary numbers to pack at a time, bounding the memory used.
+        The default is 2**20.
+
+    Raises
+    ------
+    ValueError
+        If the binary numbers have more than 64 bits, not all the same number of bits, or
+        any digits other than 0 and 1.
+
+    Returns
+    -------
+    values : array of np.uint64
+        The value of every binary number in the report.
+    width : int
+        The number of bits in each binary number.
+
+    """
+    bits = None
+    if loader.is_filename(binary):
+        if os.path.getsize(binary) == 0:
+            return np.zeros(0, dtype=np.uint64), 0
+        data = np.memmap(binary, dtype=np.uint8, mode='r')
+        # Every line is the binary number then '\n' or '\r\n'
+        newlines = np.flatnonzero(data[:66] == ord('\n'))
+        stride = int(newlines[0]) + 1 if len(newlines) else len(data)
+        width = stride - 1 - int(stride > 1 and data[stride-2] == ord('\r'))
+        # Ignore whitespace at the end of the file, including a final newline
+        end = len(data)
+        while end and data[end-1] in b' \t\r\n':
+            end -= 1
+    elif len(binary) and isinstance(binary[0], str):
+        data = np.frombuffer(''.join(binary).encode(), dtype=np.uint8)
+        stride = width = len(binary[0])
+        end = len(data)
+        if any(len(number) != width for number in binary):
+            raise ValueError('Binary numbers must all have the same number of bits')
+    else:
+        bits = np.asarray(binary, dtype=np.uint8).reshape(len(binary), -1)
+        width = bits.shape[1]
+
+    if width > 64:
+        raise ValueError(f'Binary numbers of {width} bits do not fit in 64 bits')
+    if bits is None:
+        if width == 0 or (end - width) % stride:
+            raise ValueError('Binary numbers must all have the same number of bits')
+        num = (end - width)//stride + 1
+        # Every line must end the same way as the first, so lines of other lengths are caught
+        ending = np.array(data[width:stride])
+    else:
+        num = len(bits)
+
+    values = np.empty(num, dtype=np.uint64)
+    for start in range(0, num, chunk_size):
+        stop = min(start + chunk_size, num)
+        if bits is None:
+            # The last line has no line ending after it, so copy the chunk into full rows
+            text = data[start*stride:min(stop*stride, end)]
+            rows = np.empty((stop - start, stride), dtype=np.uint8)
+            rows[:, width:] = ending
+            rows.ravel()[:len(text)] = text
+            if not (rows[:, width:] == ending).all():
+                raise ValueError('Binary numbers must all have the same number of bits')
+            chunk = rows[:, :width] - ord('0')
+        else:
+            chunk = bits[start:stop]
+        # Any other character wraps around to above 1
+        if (chunk > 1).any():
+            raise ValueError('Binary numbers must only contain the digits 0 and 1')
+        values[start:stop] = pack_bits(chunk)
+    return values, width
+
+def column_counts(values, width, chunk_size=2**20):
+    """
+    Count the number of 1 bits in every bit position of a packed diagnostic report, by
+    unpacking it a chunk of numbers at a time and summing each column.
+
+    Parameters
+    ----------
+    values : array of np.uint64
+        The value of every binary number in the report.
+    width : int
+        The number of bits in each binary number.
+    chunk_size : int, optional
+        Number of binary numbers to unpack at a time, bounding the memory used.
+        The default is 2**20.
+
+    Returns
+    -------
+    ones : array of int
+        The number of 1 bits in each bit position, most significant bit first.
+
+    """
+    ones = np.zeros(width, dtype=np.int64)
+    for start in range(0, len(values), chunk_size):
+        chunk = values[start:start+chunk_size].astype('>u8').view(np.uint8).reshape(-1, 8)
+        ones += np.unpackbits(chunk, axis=1)[:, 64-width:].sum(axis=0, dtype=np.int64)
+    return ones
+
 def Day3_Part1(filename='Inputs/Day3_Inputs.txt'):
     """
     Determines the power consumption of the submarine, calculated as the product
@@ -35,8 +168,9 @@ def Day3_Part1(filename='Inputs/Day3_Inputs.txt'):
 
     Parameters
     ----------
-    filename : str, optional
-        Input file containing the diagnostic report.
+    filename : str or list of str or array of int, optional
+        Input file containing the diagnostic report, the list of binary numbers in the
+        report, or a 2D array of the bits of every number.
         The default is 'Inputs/Day3_Inputs.txt'.
 
     Returns
@@ -50,36 +184,111 @@ def Day3_Part1(filename='Inputs/Day3_Inputs.txt'):
         format).
 
     """
-    file = open(filename)
-    binary = []
-    for line in file:
-        line = line.strip()
-        line = shlex.split(line)
-        if len(line) > 0:
-            binary.append(line[0])
-    file.close()
-    
-    gamma, epsilon = "", ""
-    for i in range(len(binary[0])):
-        zero_count, one_count = 0, 0
-        for b in binary:
-            if b[i] == '0':
-                zero_count += 1
-            if b[i] == '1':
-                one_count += 1
-        if zero_count > one_count:
-            gamma += '0'
-            epsilon += '1'
-        else:
-            gamma += '1'
-            epsilon += '0'
-    
+    values, width = pack_report(filename)
+
+    # The most common bit is 1 unless there are more 0s than 1s
+    ones = column_counts(values, width)
+    most_common = ones >= len(values) - ones
+    gamma = ''.join('1' if bit else '0' for bit in most_common)
+    epsilon = ''.join('0' if bit else '1' for bit in most_common)
+
     dec_gamma = bin_to_dec(gamma)
     dec_epsilon = bin_to_dec(epsilon)
     power_consumption = dec_gamma*dec_epsilon
     return (gamma, epsilon), (dec_gamma, dec_epsilon), power_consumption
 
-def Day3_Part2(filename='Inputs/Day3_Inputs.txt'):
+class ReportIndex:
+    """
+    Class defining a sorted index of the binary numbers in a diagnostic report. As the
+    numbers are sorted, those sharing any prefix of bits form a contiguous range, which
+    splits into the numbers with a 0 or a 1 as the next bit at a single binary search, so
+    ratings can be found by narrowing a range without copying any numbers.
+    The index can be reused to find any number of ratings of the same report.
+    """
+    def __init__(self, values, width):
+        """
+        Initialise the class with two parameters, the packed values of the binary numbers
+        in the report and the number of bits in each.
+
+        Parameters
+        ----------
+        values : array of np.uint64
+            The value of every binary number in the report.
+        width : int
+            The number of bits in each binary number.
+
+        Returns
+        -------
+        None.
+
+        """
+        self.values = np.sort(np.asarray(values, dtype=np.uint64))
+        self.width = width
+
+    def split(self, low, high, prefix, bit):
+        """
+        Find where a range of numbers sharing all bits above a given bit changes from a 0
+        to a 1 in that bit.
+
+        Parameters
+        ----------
+        low, high : int
+            Start and (exclusive) end of the range in the index.
+        prefix : int
+            The bits shared by every number in the range, with all lower bits 0.
+        bit : int
+            Position of the bit, counted from the least significant bit.
+
+        Returns
+        -------
+        middle : int
+            Index of the first number in the range with a 1 in the bit.
+
+        """
+        ones = np.uint64(prefix | (1 << bit))
+        middle = low + int(self.values[low:high].searchsorted(ones))
+        return middle
+
+    def rating(self, most_common=True):
+        """
+        Determine a rating by repeatedly keeping only the numbers with the most (least)
+        common value of each bit, starting with the first bit, until one number remains.
+        Ties keep the numbers with a 1 (0), and a bit shared by every remaining number
+        keeps them all.
+
+        Parameters
+        ----------
+        most_common : bool, optional
+            Whether to keep the most common value of each bit, as for the oxygen
+            generator rating, or the least common, as for the CO2 scrubber rating.
+            The default is True.
+
+        Returns
+        -------
+        rating : int
+            The rating in decimal format.
+
+        """
+        low, high, prefix = 0, len(self.values), 0
+        for bit in range(self.width - 1, -1, -1):
+            if high - low == 1:
+                break
+            middle = self.split(low, high, prefix, bit)
+            zeros, ones = middle - low, high - middle
+            if zeros == 0 or ones == 0:
+                keep_ones = ones > 0
+            elif most_common:
+                keep_ones = ones >= zeros
+            else:
+                keep_ones = ones < zeros
+            if keep_ones:
+                low, prefix = middle, prefix | (1 << bit)
+            else:
+                high = middle
+        rating = int(self.values[low])
+        return rating
+
+def Day3_Part2(filename='Inputs/Day3_Inputs.txt', index=None):
     """
     Determines the life support rating of the submarine, calculated as the product
     of the oxygen generator rating and the CO2 scrubber rating, which are determined
@@ -90,9 +299,14 @@ def Day3_Part2(filename='Inputs/Day3_Inputs.txt'):
 
     Parameters
     ----------
-    filename : str, optional
-        Input file containing the diagnostic report.
+    filename : str or list of str or array of int, optional
+        Input file containing the diagnostic report, the list of binary numbers in the
+        report, or a 2D array of the bits of every number.
         The default is 'Inputs/Day3_Inputs.txt'.
+    index : ReportIndex or None, optional
+        Index of the report already built by a previous call, in which case the report
+        is not read again.
+        The default is None.
 
     Returns
     -------
@@ -104,71 +318,12 @@ def Day3_Part2(filename='Inputs/Day3_Inputs.txt'):
         Product of oxygen and CO2 ratings in decimal format.
 
     """
-    file = open(filename)
-    binary = []
-    for line in file:
-        line = line.strip()
-        line = shlex.split(line)
-        if len(line) > 0:
-            binary.append(line[0])
-    file.close()
-
-    # calculate oxygen generator rating
-    binary_oxygen, binary_co2 = 1*binary, 1*binary
-    oxygen, co2 = False, False
-    for i in range(len(binary_oxygen[0])):
-        zero_count, one_count = 0, 0
-        for b in binary_oxygen:
-            if b[i] == '0':
-                zero_count += 1
-            if b[i] == '1':
-                one_count += 1
-        if zero_count > one_count:
-            most_common = '0'
-            least_common = '1'
-        else:
-            most_common = '1'
-            least_common = '0'
-        binary_oxygen_keep = []
-        if not oxygen:
-            for b in binary_oxygen:
-                if b[i] == most_common:
-                    binary_oxygen_keep.append(b)
-            binary_oxygen = 1*binary_oxygen_keep
-            if len(binary_oxygen) == 1:
-                oxygen = binary_oxygen[0]
-        if oxygen:
-            break
-                
-    # calculate C02 scrubber rating
-    for i in range(len(binary_co2[0])):
-        zero_count, one_count = 0, 0
-        for b in binary_co2:
-            if b[i] == '0':
-                zero_count += 1
-            if b[i] == '1':
-                one_count += 1
-        if zero_count > one_count:
-            most_common = '0'
-            least_common = '1'
-        else:
-            most_common = '1'
-            least_common = '0'
-        binary_co2_keep = []
-        if not co2:
-            for b in binary_co2:
-                if b[i] == least_common:
-                    binary_co2_keep.append(b)
-            binary_co2 = 1*binary_co2_keep
-            if len(binary_co2) == 1:
-                    co2 = binary_co2[0]
-        if co2:
-            break
-    
-    dec_oxygen = bin_to_dec(oxygen)
-    dec_co2 = bin_to_dec(co2)
+    if index is None:
+        index = ReportIndex(*pack_report(filename))
+
+    dec_oxygen = index.rating(most_common=True)
+    dec_co2 = index.rating(most_common=False)
+    oxygen = format(dec_oxygen, f'0{index.width}b')
+    co2 = format(dec_co2, f'0{index.width}b')
     life_support_rating = dec_oxygen*dec_co2
     return (oxygen, co2), (dec_oxygen, dec_co2), life_support_rating
-                
-                
-    
\ No newline at end of file
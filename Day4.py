@@ -1,4 +1,5 @@
-import shlex
+import numpy as np
+import loader
 
 class Bingo:
     """
@@ -41,10 +42,11 @@ class Bingo:
             Whether bingo has been achieved or not.
 
         """
+        numbers_called = set(numbers_called)
         for row in self.rows:
             bingo = True
             for num in row:
-                if numbers_called.count(num) == 0:
+                if num not in numbers_called:
                     bingo = False
                     break
             if bingo:
@@ -52,7 +54,7 @@ class Bingo:
         for column in self.columns:
             bingo = True
             for num in column:
-                if numbers_called.count(num) == 0:
+                if num not in numbers_called:
                     bingo = False
                     break
             if bingo:
@@ -76,14 +78,150 @@ class Bingo:
             Sum of the unmarked numbers on the card.
 
         """
+        numbers_called = set(numbers_called)
         uncalled_sum = 0
         for row in self.rows:
             for num in row:
-                if numbers_called.count(num) == 0:
+                if num not in numbers_called:
                     uncalled_sum += num
         return uncalled_sum
         
 
+def get_input(filename):
+    """
+    Parse the numbers called and the bingo cards from an input file.
+
+    Parameters
+    ----------
+    filename : str or list of lists of str
+        Input file containing the numbers called and the bingo cards, or the sections of
+        such a file as returned by loader.read_sections.
+
+    Returns
+    -------
+    numbers_called : list of int
+        The numbers called, in order.
+    bingo_cards : list of Bingo
+        The bingo cards.
+
+    """
+    bingo = loader.load(filename, loader.read_sections)
+
+    numbers_called = [int(num) for num in bingo[0][0].split(',')]
+    bingo_cards = [Bingo([[int(i) for i in row.split()] for row in card]) for card in bingo[1:]]
+    return numbers_called, bingo_cards
+
+def play_bingo(numbers_called, bingo_cards):
+    """
+    Play bingo with a set of cards in a single pass over the numbers called, returning
+    every card which achieves bingo in the order they do so. A reverse index maps each
+    number to the cells containing it, and every row and column counts how many of its
+    numbers are still unmarked, so each call only touches the cells it marks and a card
+    achieves bingo when any of its counters reaches 0.
+
+    Parameters
+    ----------
+    numbers_called : list of int
+        The numbers called, in order.
+    bingo_cards : list of Bingo
+        The bingo cards.
+
+    Returns
+    -------
+    winners : list of tuple (int, int, int)
+        (card number, last number called, score) of every card to achieve bingo, in the
+        order they do so, where cards achieving bingo on the same call are in card order.
+        The score is the last number called multiplied by the sum of the unmarked numbers
+        on the card at this point.
+
+    """
+    # Reverse index {number: [(card number, row, column)]}, in card order
+    cells = {}
+    rows_left, columns_left, unmarked = [], [], []
+    for card_num, card in enumerate(bingo_cards):
+        for row, numbers in enumerate(card.rows):
+            for column, num in enumerate(numbers):
+                cells.setdefault(num, []).append((card_num, row, column))
+        rows_left.append([len(row) for row in card.rows])
+        columns_left.append([len(column) for column in card.columns])
+        unmarked.append(sum(sum(row) for row in card.rows))
+
+    won = [False]*len(bingo_cards)
+    winners, called = [], set()
+    for call in numbers_called:
+        # Calling a number again marks nothing new
+        if call in called:
+            continue
+        called.add(call)
+
+        # Mark every cell with this number before checking for bingo, as a card may hold the
+        # number more than once
+        marked = [cell for cell in cells.get(call, ()) if not won[cell[0]]]
+        for card_num, row, column in marked:
+            unmarked[card_num] -= call
+            rows_left[card_num][row] -= 1
+            columns_left[card_num][column] -= 1
+        completed = []
+        for card_num, row, column in marked:
+            if not won[card_num] and (rows_left[card_num][row] == 0
+                                      or columns_left[card_num][column] == 0):
+                won[card_num] = True
+                completed.append(card_num)
+        # Score once every cell with this number is marked
+        winners.extend((card_num, call, call*unmarked[card_num]) for card_num in completed)
+        if len(winners) == len(bingo_cards):
+            break
+
+    return winners
+
+def rank_cards(numbers_called, bingo_cards):
+    """
+    Rank every bingo card by when it achieves bingo, all at once with numpy. Each number
+    on the cards is replaced by the turn on which it is called, so a row or column is
+    complete on the latest turn of its numbers, and a card achieves bingo on the earliest
+    turn any of its rows or columns is complete. All cards must be the same size.
+
+    Parameters
+    ----------
+    numbers_called : list of int
+        The numbers called, in order.
+    bingo_cards : list of Bingo or array of int
+        The bingo cards, or a (cards, rows, columns) array of the numbers on them.
+
+    Returns
+    -------
+    winners : list of tuple (int, int, int)
+        (card number, last number called, score) of every card to achieve bingo, in the
+        order they do so, where cards achieving bingo on the same call are in card order.
+        The score is the last number called multiplied by the sum of the unmarked numbers
+        on the card at this point.
+
+    """
+    if len(bingo_cards) and isinstance(bingo_cards[0], Bingo):
+        bingo_cards = [card.rows for card in bingo_cards]
+    cards = np.asarray(bingo_cards, dtype=np.int64)
+    calls = np.asarray(numbers_called, dtype=np.int64)
+    never = len(calls)
+
+    # Turn on which every number is first called, with uncalled numbers never called
+    values, inverse = np.unique(cards, return_inverse=True)
+    first = np.full(len(values), never, dtype=np.int64)
+    called = np.isin(calls, values)
+    np.minimum.at(first, np.searchsorted(values, calls[called]), np.flatnonzero(called))
+    turns = first[inverse.reshape(cards.shape)]
+
+    # Each row (column) is complete once all of its numbers are called
+    wins = np.minimum(turns.max(axis=2).min(axis=1), turns.max(axis=1).min(axis=1))
+    order = np.argsort(wins, kind='stable')
+    order = order[wins[order] < never]
+
+    # Numbers called after the winning turn are still unmarked
+    unmarked = np.where(turns > wins[:, None, None], cards, 0).sum(axis=(1, 2))
+    last_calls = calls[wins[order]]
+    scores = last_calls*unmarked[order]
+    winners = list(zip(order.tolist(), last_calls.tolist(), scores.tolist()))
+    return winners
+
 def Day4_Part1(filename='Inputs/Day4_Inputs.txt'):
     """
     Determine the score of the first bingo card to achieve bingo out of a set given in
@@ -93,8 +231,9 @@ def Day4_Part1(filename='Inputs/Day4_Inputs.txt'):
 
     Parameters
     ----------
-    filename : str, optional
-        Input file containing the numbers called and the bingo cards.
+    filename : str or list of lists of str, optional
+        Input file containing the numbers called and the bingo cards, or the sections of
+        such a file as returned by loader.read_sections.
         The default is 'Inputs/Day4_Inputs.txt'.
 
     Returns
@@ -105,44 +244,12 @@ def Day4_Part1(filename='Inputs/Day4_Inputs.txt'):
         numbers on the card at this point.
 
     """
-    file = open(filename)
-    bingo = []
-    for line in file:
-        line = line.strip()
-        line = shlex.split(line)
-        if len(line) > 0:
-            bingo.append(line)
-    file.close()
-    
-    numbers_called, i = [], 0
-    while i < len(bingo[0][0]):
-        curr_num = ''
-        while i < len(bingo[0][0]) and bingo[0][0][i] != ',':
-            curr_num += bingo[0][0][i]
-            i += 1
-        numbers_called.append(int(curr_num))
-        i += 1
-        
-    bingo_cards = []
-    for n, row in enumerate(bingo[1:]):
-        int_row = []
-        for i in row:
-            int_row.append(int(i))
-        if n%5 == 0:
-            bingo_cards.append([int_row])
-        else:
-            bingo_cards[-1].append(int_row)
-    for n, card in enumerate(bingo_cards):
-        bingo_cards[n] = Bingo(card)
-    
-    called = []
-    for call in numbers_called:
-        called.append(call)
-        for card_num, card in enumerate(bingo_cards):
-            if card.check_bingo(called):
-                score = call*card.check_unmarked(called)
-                return score
-                
+    numbers_called, bingo_cards = get_input(filename)
+
+    winners = play_bingo(numbers_called, bingo_cards)
+    score = winners[0][2]
+    return score
+
 def Day4_Part2(filename='Inputs/Day4_Inputs.txt'):
     """
     Determine the score of the last bingo card to achieve bingo out of a set given in
@@ -152,8 +259,9 @@ def Day4_Part2(filename='Inputs/Day4_Inputs.txt'):
 
     Parameters
     ----------
-    filename : str, optional
-        Input file containing the numbers called and the bingo cards.
+    filename : str or list of lists of str, optional
+        Input file containing the numbers called and the bingo cards, or the sections of
+        such a file as returned by loader.read_sections.
         The default is 'Inputs/Day4_Inputs.txt'.
 
     Returns
@@ -164,44 +272,57 @@ def Day4_Part2(filename='Inputs/Day4_Inputs.txt'):
         numbers on the card at this point.
 
     """
-    file = open(filename)
-    bingo = []
-    for line in file:
-        line = line.strip()
-        line = shlex.split(line)
-        if len(line) > 0:
-            bingo.append(line)
-    file.close()
-    
-    numbers_called, i = [], 0
-    while i < len(bingo[0][0]):
-        curr_num = ''
-        while i < len(bingo[0][0]) and bingo[0][0][i] != ',':
-            curr_num += bingo[0][0][i]
-            i += 1
-        numbers_called.append(int(curr_num))
-        i += 1
-        
-    bingo_cards = []
-    for n, row in enumerate(bingo[1:]):
-        int_row = []
-        for i in row:
-            int_row.append(int(i))
-        if n%5 == 0:
-            bingo_cards.append([int_row])
-        else:
-            bingo_cards[-1].append(int_row)
-    for n, card in enumerate(bingo_cards):
-        bingo_cards[n] = Bingo(card)
-    
-    i, called, completed = 0, [], []
-    while len(bingo_cards) > 0 and i < len(numbers_called):
-        called.append(numbers_called[i])
-        for card_num, card in enumerate(bingo_cards):
-            if card.check_bingo(called):
-                bingo_cards.remove(card)
-                completed.append(card)
-        i += 1
-    score = called[-1]*completed[-1].check_unmarked(called)
+    numbers_called, bingo_cards = get_input(filename)
+
+    winners = play_bingo(numbers_called, bingo_cards)
+    score = winners[-1][2]
     return score
-                
\ No newline at end of file
+
+def Day4_Rounds(filename='Inputs/Day4_Inputs.txt'):
+    """
+    Determine the first and last bingo cards to achieve bingo out of a set given in an
+    input file, and their scores, from a single game.
+
+    Parameters
+    ----------
+    filename : str or list of lists of str, optional
+        Input file containing the numbers called and the bingo cards, or the sections of
+        such a file as returned by loader.read_sections.
+        The default is 'Inputs/Day4_Inputs.txt'.
+
+    Returns
+    -------
+    first : tuple (int, int, int)
+        (card number, last number called, score) of the first card to achieve bingo.
+    last : tuple (int, int, int)
+        (card number, last number called, score) of the last card to achieve bingo.
+
+    """
+    numbers_called, bingo_cards = get_input(filename)
+
+    winners = play_bingo(numbers_called, bingo_cards)
+    return winners[0], winners[-1]
+
+def Day4_Ranking(filename='Inputs/Day4_Inputs.txt'):
+    """
+    Determine the order in which every bingo card out of a set given in an input file
+    achieves bingo, for called numbers as given in the same input file, and their scores.
+
+    Parameters
+    ----------
+    filename : str or list of lists of str, optional
+        Input file containing the numbers called and the bingo cards, or the sections of
+        such a file as returned by loader.read_sections.
+        The default is 'Inputs/Day4_Inputs.txt'.
+
+    Returns
+    -------
+    winners : list of tuple (int, int, int)
+        (card number, last number called, score) of every card to achieve bingo, in the
+        order they do so. Cards which never achieve bingo are left out.
+
+    """
+    numbers_called, bingo_cards = get_input(filename)
+
+    winners = rank_cards(numbers_called, bingo_cards)
+    return winners
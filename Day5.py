@@ -1,5 +1,427 @@
-import shlex
 import numpy as np
+import loader
+
+def get_input(filename):
+    """
+    Parse the start and end coordinates of the lines of vents from an input file.
+
+    Parameters
+    ----------
+    filename : str or array of int
+        Input file containing the start and end coordinates of the lines of vents, or an
+        array of these coordinates with one row [x1, y1, x2, y2] per line of vents.
+
+    Returns
+    -------
+    coords : array of int
+        Array of the coordinates with one row [x1, y1, x2, y2] per line of vents.
+
+    """
+    coords = np.asarray(loader.load(filename, loader.read_int_table), dtype=np.int64)
+    return coords.reshape(-1, 4)
+
+def select_lines(coords, diagonals=True):
+    """
+    Select the horizontal and vertical lines of vents, and optionally the diagonal lines
+    at 45 degrees.
+
+    Parameters
+    ----------
+    coords : array of int
+        Array of the coordinates with one row [x1, y1, x2, y2] per line of vents.
+    diagonals : bool, optional
+        Whether to include diagonal lines.
+        The default is True.
+
+    Returns
+    -------
+    coords : array of int
+        Coordinates of the selected lines of vents.
+
+    """
+    x1, y1, x2, y2 = coords.T
+    keep = (x1 == x2) | (y1 == y2)
+    if diagonals:
+        keep |= np.abs(x2 - x1) == np.abs(y2 - y1)
+    return coords[keep]
+
+def expand_lines(coords):
+    """
+    Expand lines of vents into the coordinates of every point on them, all at once.
+    Each point is the start of its line plus a number of unit steps along it.
+
+    Parameters
+    ----------
+    coords : array of int
+        Array of the coordinates with one row [x1, y1, x2, y2] per line of vents, which
+        must be horizontal, vertical or diagonal at 45 degrees.
+
+    Returns
+    -------
+    x, y : array of int
+        Coordinates of every point on every line, including the start and end points.
+
+    """
+    x1, y1, x2, y2 = coords.T
+    dx, dy = np.sign(x2 - x1), np.sign(y2 - y1)
+    lengths = np.maximum(np.abs(x2 - x1), np.abs(y2 - y1)) + 1
+
+    line = np.repeat(np.arange(len(coords)), lengths)
+    # Number of steps from the start of its line for every point
+    steps = np.arange(len(line)) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+    x = x1[line] + dx[line]*steps
+    y = y1[line] + dy[line]*steps
+    return x, y
+
+# Default number of points rasterize expands at a time, and the bytes of temporary arrays used
+# for every point in a batch
+BATCH_SIZE = 2**22
+BATCH_BYTES_PER_POINT = 64
+
+def rasterize(coords, batch_size=BATCH_SIZE):
+    """
+    Count the number of lines of vents covering every point of a map spanning all of the
+    lines. Lines are expanded into points in batches, and the points of each batch are
+    added to a single 2D array of counts in place, with np.bincount when the map is no
+    larger than the batch, or otherwise by counting the distinct points of the batch with
+    np.unique, so no temporary array is ever the size of the map. Besides the map itself,
+    at most about BATCH_BYTES_PER_POINT*batch_size bytes are used.
+
+    Parameters
+    ----------
+    coords : array of int
+        Array of the coordinates with one row [x1, y1, x2, y2] per line of vents, which
+        must be horizontal, vertical or diagonal at 45 degrees.
+    batch_size : int, optional
+        Approximate number of points to expand at a time, bounding the memory used.
+        The default is BATCH_SIZE.
+
+    Returns
+    -------
+    counts : array of int
+        2D array of the number of lines covering each point, indexed [y - ymin, x - xmin].
+    origin : tuple (int, int)
+        (xmin, ymin), the coordinates of the top left point of the map.
+
+    """
+    if len(coords) == 0:
+        return np.zeros((0, 0), dtype=np.int32), (0, 0)
+    xmin, xmax = int(coords[:, ::2].min()), int(coords[:, ::2].max())
+    ymin, ymax = int(coords[:, 1::2].min()), int(coords[:, 1::2].max())
+    width, height = xmax - xmin + 1, ymax - ymin + 1
+    counts = np.zeros(width*height, dtype=np.int32)
+
+    lengths = np.maximum(np.abs(coords[:, 2] - coords[:, 0]),
+                         np.abs(coords[:, 3] - coords[:, 1])) + 1
+    # Split the lines into batches of about batch_size points each
+    ends = np.searchsorted(np.cumsum(lengths), np.arange(batch_size, lengths.sum(), batch_size))
+    for batch in np.split(coords, np.unique(ends)):
+        x, y = expand_lines(batch)
+        points = (y - ymin)*width + (x - xmin)
+        if len(points) >= len(counts):
+            np.add(counts, np.bincount(points, minlength=len(counts)), out=counts,
+                   casting='unsafe')
+        else:
+            distinct, repeats = np.unique(points, return_counts=True)
+            counts[distinct] += repeats.astype(np.int32)
+
+    return counts.reshape(height, width), (xmin, ymin)
+
+# Families of lines, each described by a key which is constant along a line and a position
+# which increases along it, e.g. horizontal lines have key y and position x
+FAMILIES = ('horizontal', 'vertical', 'diagonal', 'antidiagonal')
+
+def to_point(family, key, pos):
+    """
+    Convert the key and position of points on lines of a given family to coordinates.
+
+    Parameters
+    ----------
+    family : str
+        Family of the lines, one of FAMILIES.
+    key, pos : array of int
+        Key of the line and position along it of every point.
+
+    Returns
+    -------
+    x, y : array of int
+        Coordinates of every point.
+
+    """
+    if family == 'horizontal':
+        return pos, key
+    if family == 'vertical':
+        return key, pos
+    if family == 'diagonal':
+        return pos, pos - key
+    return pos, key - pos
+
+def to_key_pos(family, x, y):
+    """
+    Convert the coordinates of points to their key and position on lines of a given
+    family, the inverse of to_point.
+
+    Parameters
+    ----------
+    family : str
+        Family of the lines, one of FAMILIES.
+    x, y : array of int
+        Coordinates of every point.
+
+    Returns
+    -------
+    key, pos : array of int
+        Key of the line and position along it of every point.
+
+    """
+    if family == 'horizontal':
+        return y, x
+    if family == 'vertical':
+        return x, y
+    if family == 'diagonal':
+        return x - y, x
+    return x + y, x
+
+def split_families(coords):
+    """
+    Split lines of vents into families of parallel lines, described by the key of each
+    line and the range of positions it covers. Single points count as horizontal lines.
+
+    Parameters
+    ----------
+    coords : array of int
+        Array of the coordinates with one row [x1, y1, x2, y2] per line of vents, which
+        must be horizontal, vertical or diagonal at 45 degrees.
+
+    Returns
+    -------
+    families : dict {str : tuple (array of int, array of int, array of int)}
+        Dictionary mapping each family to the (key, first position, last position) of
+        every line in it.
+
+    """
+    x1, y1, x2, y2 = coords.T
+    horizontal = y1 == y2
+    vertical = (x1 == x2) & ~horizontal
+    diagonal = (x2 - x1 == y2 - y1) & ~horizontal
+    masks = {'horizontal': horizontal, 'vertical': vertical, 'diagonal': diagonal,
+             'antidiagonal': ~(horizontal | vertical | diagonal)}
+
+    families = {}
+    for family, mask in masks.items():
+        key, pos1 = to_key_pos(family, x1[mask], y1[mask])
+        _, pos2 = to_key_pos(family, x2[mask], y2[mask])
+        families[family] = (key, np.minimum(pos1, pos2), np.maximum(pos1, pos2))
+    return families
+
+def sweep_lines(key, low, high):
+    """
+    Sweep along parallel lines of vents, finding the ranges of positions on each line
+    covered by the same number of lines. Every line adds 1 to the coverage at its first
+    position and removes it after its last, so the coverage between consecutive events
+    on the same line is the cumulative sum of these changes.
+
+    Parameters
+    ----------
+    key, low, high : array of int
+        Key, first position and last position of every line.
+
+    Returns
+    -------
+    key, low, high, count : array of int
+        Key, first position, last position and number of covering lines of every range
+        covered by at least one line, sorted by key then position. Ranges do not overlap.
+
+    """
+    keys = np.concatenate((key, key))
+    positions = np.concatenate((low, high + 1))
+    changes = np.concatenate((np.ones(len(key), dtype=np.int64), -np.ones(len(key), dtype=np.int64)))
+    order = np.lexsort((positions, keys))
+    keys, positions = keys[order], positions[order]
+    # Every line ends, so the coverage is back to 0 at the end of each key
+    coverage = np.cumsum(changes[order])
+
+    valid = ((keys[:-1] == keys[1:]) & (positions[:-1] < positions[1:])
+             & (coverage[:-1] > 0))
+    return (keys[:-1][valid], positions[:-1][valid], positions[1:][valid] - 1,
+            coverage[:-1][valid])
+
+def in_ranges(key, low, high, query_key, query_pos):
+    """
+    Determine whether points lie in any of a set of non-overlapping ranges on parallel
+    lines, by merging the points into the ranges sorted by key and position and finding
+    the last range starting at or before each point.
+
+    Parameters
+    ----------
+    key, low, high : array of int
+        Key, first position and last position of every range, which must not overlap.
+    query_key, query_pos : array of int
+        Key and position of every point.
+
+    Returns
+    -------
+    inside : array of bool
+        Whether each point lies in a range.
+
+    """
+    keys = np.concatenate((key, query_key))
+    positions = np.concatenate((low, query_pos))
+    # Ranges starting at a point sort before it
+    is_query = np.concatenate((np.zeros(len(key), dtype=bool), np.ones(len(query_key), dtype=bool)))
+    order = np.lexsort((is_query, positions, keys))
+
+    starts = np.where(is_query[order], -1, order)
+    last = np.maximum.accumulate(starts) if len(starts) else starts
+    last = last[is_query[order]]
+    queries = order[is_query[order]] - len(key)
+
+    inside = np.zeros(len(query_key), dtype=bool)
+    found = last >= 0
+    last = np.where(found, last, 0)
+    if len(key):
+        inside[queries] = found & (key[last] == query_key[queries]) & (high[last] >= query_pos[queries])
+    return inside
+
+def crossings(first, second, ranges, batch_size=2**22):
+    """
+    Find every point where a range covered on lines of one family crosses a range covered
+    on lines of another. Along a line of the first family, the key of the crossing line of
+    the second family changes linearly with position, so each range crosses the lines of
+    the second family with keys in a range, found by binary search of the sorted keys.
+
+    Parameters
+    ----------
+    first, second : str
+        Families of lines, as in FAMILIES.
+    ranges : dict {str : tuple (array of int, array of int, array of int)}
+        Dictionary mapping each family to the (key, first position, last position) of
+        every covered range, sorted by key, as returned by sweep_lines.
+    batch_size : int, optional
+        Approximate number of candidate pairs of ranges to check at a time, bounding the
+        memory used.
+        The default is 2**22.
+
+    Returns
+    -------
+    x, y : array of int
+        Coordinates of every crossing.
+
+    """
+    key, low, high = ranges[first]
+    other_key, other_low, other_high = ranges[second]
+    # Key of the second family at positions 0 and 1 along each line of the first
+    offset = np.broadcast_to(to_key_pos(second, *to_point(first, key, 0))[0], key.shape)
+    slope = int(to_key_pos(second, *to_point(first, np.int64(0), np.int64(1)))[0]
+                - to_key_pos(second, *to_point(first, np.int64(0), np.int64(0)))[0])
+    ends = np.sort([slope*low + offset, slope*high + offset], axis=0)
+    start = np.searchsorted(other_key, ends[0], 'left')
+    stop = np.searchsorted(other_key, ends[1], 'right')
+    candidates = stop - start
+
+    x, y = [np.zeros(0, dtype=np.int64)], [np.zeros(0, dtype=np.int64)]
+    splits = np.searchsorted(np.cumsum(candidates),
+                             np.arange(batch_size, candidates.sum(), batch_size))
+    for batch in np.array_split(np.arange(len(key)), np.unique(splits)):
+        counts = candidates[batch]
+        ranges_first = np.repeat(batch, counts)
+        ranges_second = (np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+                         + np.repeat(start[batch], counts))
+
+        # Position along the first line where the key of the second is reached
+        difference = other_key[ranges_second] - offset[ranges_first]
+        exact = difference % slope == 0
+        ranges_first, ranges_second = ranges_first[exact], ranges_second[exact]
+        pos = difference[exact] // slope
+
+        points = to_point(first, key[ranges_first], pos)
+        other_pos = to_key_pos(second, *points)[1]
+        hit = (other_low[ranges_second] <= other_pos) & (other_pos <= other_high[ranges_second])
+        x.append(points[0][hit])
+        y.append(points[1][hit])
+
+    return np.concatenate(x), np.concatenate(y)
+
+def count_dangerous_sparse(coords):
+    """
+    Count the dangerous points, where at least 2 lines of vents intersect, without
+    building a map, so memory scales with the number of lines and crossings rather than
+    the area they span. Points covered twice by parallel lines are counted from a sweep
+    along each family of lines, and the remaining dangerous points are where ranges on
+    lines of different families cross.
+
+    Parameters
+    ----------
+    coords : array of int
+        Array of the coordinates with one row [x1, y1, x2, y2] per line of vents, which
+        must be horizontal, vertical or diagonal at 45 degrees.
+
+    Returns
+    -------
+    dangerous : int
+        The number of dangerous points.
+
+    """
+    ranges, doubled = {}, {}
+    for family, lines in split_families(coords).items():
+        key, low, high, count = sweep_lines(*lines)
+        ranges[family] = (key, low, high)
+        doubled[family] = (key[count >= 2], low[count >= 2], high[count >= 2])
+
+    # Points covered twice by one family
+    dangerous = sum(int((high - low + 1).sum()) for _, low, high in doubled.values())
+
+    # Points covered by several families, each of which is counted once, less the number of
+    # times it was already counted above
+    points = [crossings(first, second, ranges)
+              for i, first in enumerate(FAMILIES) for second in FAMILIES[i+1:]]
+    x = np.concatenate([x for x, _ in points])
+    y = np.concatenate([y for _, y in points])
+    if len(x):
+        x, y = np.unique(np.stack((x, y), axis=1), axis=0).T
+    counted = sum(in_ranges(*doubled[family], *to_key_pos(family, x, y)).astype(np.int64)
+                  for family in FAMILIES)
+    dangerous += int((1 - counted).sum())
+    return dangerous
+
+def count_dangerous(coords, diagonals=True, max_map_bytes=2**30):
+    """
+    Count the dangerous points, where at least 2 lines of vents intersect. Lines are
+    rasterized onto a map whenever the map and the batches of points added to it fit in
+    max_map_bytes, which takes time linear in the
+    area and the number of points on the lines, and otherwise the points are counted
+    without one, which takes time growing with the number of crossings between lines.
+
+    Parameters
+    ----------
+    coords : array of int
+        Array of the coordinates with one row [x1, y1, x2, y2] per line of vents.
+    diagonals : bool, optional
+        Whether to include diagonal lines at 45 degrees, as well as horizontal and
+        vertical lines.
+        The default is True.
+    max_map_bytes : int, optional
+        Largest number of bytes to use rasterizing the lines, for the int32 map spanning
+        them and the temporary arrays of each batch of points.
+        The default is 2**30, which holds maps of over 14k x 14k points.
+
+    Returns
+    -------
+    dangerous : int
+        The number of dangerous points.
+
+    """
+    coords = select_lines(coords, diagonals)
+    if len(coords) == 0:
+        return 0
+    area = ((int(coords[:, ::2].max()) - int(coords[:, ::2].min()) + 1)
+            * (int(coords[:, 1::2].max()) - int(coords[:, 1::2].min()) + 1))
+    if 4*area + BATCH_BYTES_PER_POINT*BATCH_SIZE > max_map_bytes:
+        return count_dangerous_sparse(coords)
+
+    counts, _ = rasterize(coords)
+    dangerous = int(np.count_nonzero(counts >= 2))
+    return dangerous
 
 def Day5_Part1(filename='Inputs/Day5_Inputs.txt'):
     """
@@ -11,8 +433,9 @@ def Day5_Part1(filename='Inputs/Day5_Inputs.txt'):
 
     Parameters
     ----------
-    filename : str, optional
-        Input file containing the start and end coordinates of the lines of vents.
+    filename : str or array of int, optional
+        Input file containing the start and end coordinates of the lines of vents, or an
+        array of these coordinates with one row [x1, y1, x2, y2] per line of vents.
         The default is 'Inputs/Day5_Inputs.txt'.
 
     Returns
@@ -21,56 +444,9 @@ def Day5_Part1(filename='Inputs/Day5_Inputs.txt'):
         The number of dangerous points, where at least 2 lines of vents intersect.
 
     """
-    file = open(filename)
-    coords = []
-    for line in file:
-        line = line.strip()
-        line = shlex.split(line)
-        if len(line) > 0:
-            coords.append(line)
-    file.close()
-    
-    formatted_coords = []
-    for line in coords:
-        i = line[0].find(',')
-        start = [int(line[0][:i]), int(line[0][i+1:])]
-        j = line[2].find(',')
-        end = [int(line[2][:j]), int(line[2][j+1:])]
-        formatted_coords.append([start, end])
-    
-    x_coords, y_coords = [], []
-    for coords in formatted_coords:
-        x_coords.append(coords[0][0])
-        x_coords.append(coords[1][0])
-        y_coords.append(coords[0][1])
-        y_coords.append(coords[1][1])
-    xmin, xmax = min(x_coords), max(x_coords)
-    ymin, ymax = min(y_coords), max(y_coords)
-    
-    whole_map = []
-    for y in range(ymin, ymax+1):
-        whole_map.append(np.zeros((xmax-xmin)+1))
-            
-    for n, coords in enumerate(formatted_coords):
-        x1, x2 = coords[0][0], coords[1][0]
-        y1, y2 = coords[0][1], coords[1][1]
-        if x1 == x2 or y1 == y2:
-            all_points = []
-            if x1 != x2:
-                gradient = (y2 - y1)/(x2 - x1)
-                intercept = y1 - (gradient*x1)
-                for x in np.arange(x1, x2+(-1)**(x1>x2), (-1)**(x1>x2)):
-                    all_points.append([int(x), int((gradient*x)+intercept)])
-            else:
-                for y in np.arange(y1, y2+(-1)**(y1>y2), (-1)**(y1>y2)):
-                    all_points.append([int(x1), int(y)])
-            for point in all_points:
-                whole_map[point[1]-ymin][point[0]-xmin] += 1
-                
-    dangerous = 0
-    for y_line in whole_map:
-        dangerous += sum(x >= 2 for x in y_line)
-        
+    coords = get_input(filename)
+
+    dangerous = count_dangerous(coords, diagonals=False)
     return dangerous
 
 def Day5_Part2(filename='Inputs/Day5_Inputs.txt'):
@@ -83,8 +459,9 @@ def Day5_Part2(filename='Inputs/Day5_Inputs.txt'):
 
     Parameters
     ----------
-    filename : str, optional
-        Input file containing the start and end coordinates of the lines of vents.
+    filename : str or array of int, optional
+        Input file containing the start and end coordinates of the lines of vents, or an
+        array of these coordinates with one row [x1, y1, x2, y2] per line of vents.
         The default is 'Inputs/Day5_Inputs.txt'.
 
     Returns
@@ -93,53 +470,7 @@ def Day5_Part2(filename='Inputs/Day5_Inputs.txt'):
         The number of dangerous points, where at least 2 lines of vents intersect.
 
     """
-    file = open(filename)
-    coords = []
-    for line in file:
-        line = line.strip()
-        line = shlex.split(line)
-        if len(line) > 0:
-            coords.append(line)
-    file.close()
-    
-    formatted_coords = []
-    for line in coords:
-        i = line[0].find(',')
-        start = [int(line[0][:i]), int(line[0][i+1:])]
-        j = line[2].find(',')
-        end = [int(line[2][:j]), int(line[2][j+1:])]
-        formatted_coords.append([start, end])
-    
-    x_coords, y_coords = [], []
-    for coords in formatted_coords:
-        x_coords.append(coords[0][0])
-        x_coords.append(coords[1][0])
-        y_coords.append(coords[0][1])
-        y_coords.append(coords[1][1])
-    xmin, xmax = min(x_coords), max(x_coords)
-    ymin, ymax = min(y_coords), max(y_coords)
-    
-    whole_map = []
-    for y in range(ymin, ymax+1):
-        whole_map.append(np.zeros((xmax-xmin)+1))
-            
-    for n, coords in enumerate(formatted_coords):
-        x1, x2 = coords[0][0], coords[1][0]
-        y1, y2 = coords[0][1], coords[1][1]
-        all_points = []
-        if x1 != x2:
-            gradient = (y2 - y1)/(x2 - x1)
-            intercept = y1 - (gradient*x1)
-            for x in np.arange(x1, x2+(-1)**(x1>x2), (-1)**(x1>x2)):
-                all_points.append([int(x), int((gradient*x)+intercept)])
-        else:
-            for y in np.arange(y1, y2+(-1)**(y1>y2), (-1)**(y1>y2)):
-                all_points.append([int(x1), int(y)])
-        for point in all_points:
-            whole_map[point[1]-ymin][point[0]-xmin] += 1
-                
-    dangerous = 0
-    for y_line in whole_map:
-        dangerous += sum(x >= 2 for x in y_line)
-        
+    coords = get_input(filename)
+
+    dangerous = count_dangerous(coords, diagonals=True)
     return dangerous
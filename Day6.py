@@ -1,4 +1,175 @@
-import shlex
+import functools
+import numpy as np
+import loader
+
+# Matrix advancing the number of fish with each internal timer by one day, acting on a column
+# vector of these numbers: timers count down by 1, and fish at 0 reset to 6 and spawn a fish at 8
+TRANSITION = [[1 if (new + 1 == old) or (old == 0 and new in (6, 8)) else 0
+               for old in range(9)] for new in range(9)]
+# TRANSITION**9 == TRANSITION**2 + I, so every power of TRANSITION is a combination of its first
+# nine powers, given by the remainder of x**days divided by x**9 - x**2 - 1. This is the linear
+# recurrence fish(n) = fish(n-7) + fish(n-9) followed by the population.
+
+# Maximum number of population weights kept by population_weights, which for days near 1e9 take
+# about 9 x 1.2e8 bits, or 140 MB, each
+MAX_CACHED_WEIGHTS = 16
+
+def mat_mul(a, b):
+    """
+    Multiply two matrices of Python ints exactly.
+
+    Parameters
+    ----------
+    a, b : list of lists of int
+        Matrices to multiply, with as many columns in a as rows in b.
+
+    Returns
+    -------
+    product : list of lists of int
+        The matrix product a b.
+
+    """
+    columns = list(zip(*b))
+    product = [[sum(x*y for x, y in zip(row, column) if x and y) for column in columns]
+               for row in a]
+    return product
+
+# Population weights for 0 to 8 days, the rows of ones times TRANSITION**k
+BASE_WEIGHTS = [[1]*9]
+for _ in range(8):
+    BASE_WEIGHTS.append(mat_mul([BASE_WEIGHTS[-1]], TRANSITION)[0])
+
+def reduce_polynomial(coefficients):
+    """
+    Reduce a polynomial modulo the characteristic polynomial x**9 - x**2 - 1 of TRANSITION,
+    by repeatedly replacing x**9 with x**2 + 1 from the highest power down.
+
+    Parameters
+    ----------
+    coefficients : list of int
+        Coefficients of the polynomial, lowest power first, updated in place.
+
+    Returns
+    -------
+    remainder : list of int
+        The 9 coefficients of the remainder, lowest power first.
+
+    """
+    for power in range(len(coefficients) - 1, 8, -1):
+        coefficient = coefficients[power]
+        if coefficient:
+            coefficients[power - 9] += coefficient
+            coefficients[power - 7] += coefficient
+    return coefficients[:9]
+
+def power_remainder(days):
+    """
+    Calculates the remainder of x**days divided by x**9 - x**2 - 1, by binary exponentiation
+    from the highest bit of days down. Each step squares the remainder, needing only 45
+    products of its coefficients, and multiplies it by x if the bit is set, which is only a
+    shift, far fewer big integer products than squaring the 9x9 TRANSITION matrix.
+
+    Parameters
+    ----------
+    days : int
+        The number of days.
+
+    Returns
+    -------
+    remainder : list of int
+        The 9 coefficients of the remainder, lowest power first.
+
+    """
+    remainder = [1] + [0]*8
+    for bit in bin(days)[2:]:
+        square = [0]*17
+        for i, a in enumerate(remainder):
+            if a:
+                square[2*i] += a*a
+                for j in range(i + 1, 9):
+                    if remainder[j]:
+                        square[i + j] += 2*a*remainder[j]
+        remainder = reduce_polynomial(square)
+        if bit == '1':
+            remainder = reduce_polynomial([0] + remainder)
+    return remainder
+
+@functools.lru_cache(maxsize=MAX_CACHED_WEIGHTS)
+def population_weights(days):
+    """
+    Calculates the number of fish that a single fish with each internal timer becomes
+    after a given number of days, as the column sums of TRANSITION**days. As
+    TRANSITION**days is the combination of the first nine powers of TRANSITION given by
+    power_remainder, this is the same combination of BASE_WEIGHTS, so any number of days
+    costs a logarithmic number of small polynomial products. The weights for the
+    MAX_CACHED_WEIGHTS most recently queried numbers of days are kept.
+
+    Parameters
+    ----------
+    days : int
+        The number of days.
+
+    Returns
+    -------
+    weights : tuple of int
+        The number of fish descended from a single fish with each internal timer after
+        'days' days, including itself.
+
+    """
+    if days < 0:
+        raise ValueError('The number of days cannot be negative')
+
+    remainder = power_remainder(days)
+    weights = tuple(sum(c*base[timer] for c, base in zip(remainder, BASE_WEIGHTS) if c)
+                    for timer in range(9))
+    return weights
+
+def age_histogram(filename):
+    """
+    Count the number of fish with each internal timer in an initial population.
+
+    Parameters
+    ----------
+    filename : str or list of int
+        Input file containing the internal timers of the initial population of fish, or
+        the list of these internal timers.
+
+    Returns
+    -------
+    fish_ages : list of int
+        The number of fish with each internal timer from 0 to 8.
+
+    """
+    ages = loader.load(filename, loader.read_comma_ints)
+    fish_ages = np.bincount(ages, minlength=9).tolist()
+    return fish_ages
+
+def population_table(histograms, horizons):
+    """
+    Calculates the population of many schools of fish after many numbers of days at once.
+    The population weights for each number of days come from population_weights, so are
+    shared by every school and cached between calls, and each school then costs one
+    product with the matrix of these weights.
+
+    Parameters
+    ----------
+    histograms : list of lists of int or array of int
+        The number of fish with each internal timer from 0 to 8 in the initial population
+        of each school, one row per school.
+    horizons : list of int
+        The numbers of days after which to calculate the populations.
+
+    Returns
+    -------
+    populations : list of lists of int
+        The population of each school (row) after each number of days (column).
+
+    """
+    histograms = np.asarray(histograms, dtype=object).reshape(-1, 9)
+    weights = np.array([population_weights(int(days)) for days in horizons],
+                       dtype=object).reshape(-1, 9)
+    populations = (histograms @ weights.T).tolist()
+    return populations
 
 def Day6_Part1and2(daymax, filename='Inputs/Day6_Inputs.txt'):
     """
@@ -11,9 +182,9 @@ def Day6_Part1and2(daymax, filename='Inputs/Day6_Inputs.txt'):
     ----------
     daymax : int
         The number of days after which we want to known the resulting fish population.
-    filename : str, optional
+    filename : str or list of int, optional
         Input file containing the internal timers of the initial population of fish at
-        Day 0.
+        Day 0, or the list of these internal timers.
         The default is 'Inputs/Day6_Inputs.txt'.
 
     Returns
@@ -22,32 +193,8 @@ def Day6_Part1and2(daymax, filename='Inputs/Day6_Inputs.txt'):
         The number of fish in the population after 'daymax' days have passed.
 
     """
-    file = open(filename)
-    ages = []
-    for line in file:
-        line = line.strip()
-        line = shlex.split(line)
-        if len(line) > 0:
-            ages.append(line)
-    file.close()
-    
-    fish_ages, i = [0]*9, 0
-    while i < len(ages[0][0]):
-        curr_age = ''
-        while i < len(ages[0][0]) and ages[0][0][i] != ',':
-            curr_age += ages[0][0][i]
-            i += 1
-        fish_ages[int(curr_age)] += 1
-        i += 1
-    
-    day = 0
-    while day < daymax:
-        day += 1
-        reproducing = fish_ages[0]
-        fish_ages.pop(0)
-        fish_ages.append(reproducing)
-        fish_ages[6] += reproducing
-    
-    population_size = sum(fish_ages)
+    fish_ages = age_histogram(filename)
+
+    population_size = sum(weight*fish for weight, fish in
+                          zip(population_weights(int(daymax)), fish_ages))
     return population_size
-        
@@ -1,5 +1,194 @@
-import shlex
 import numpy as np
+import loader
+
+class CrabSwarm:
+    """
+    Class describing a swarm of crab submarines by their sorted positions, with prefix sums
+    of the positions so that the total fuel needed to move every submarine to any common
+    position can be found with a single binary search, whatever the size of the swarm.
+    """
+    def __init__(self, positions):
+        """
+        Initialise the class with one parameter, the positions of every submarine.
+
+        Parameters
+        ----------
+        positions : list of int or array of int
+            The position of every crab submarine.
+
+        Returns
+        -------
+        None.
+
+        """
+        positions = np.sort(np.asarray(positions, dtype=np.int64))
+        self.origin = int(positions[0]) if len(positions) else 0
+        # Positions relative to the leftmost submarine, so the sums below fit in int64
+        self.offsets = positions - self.origin
+        self.prefix = np.concatenate(([0], np.cumsum(self.offsets)))
+        self.size = len(positions)
+        # Distinct offsets and the number of submarines at each, for general cost functions
+        self.values, self.counts = np.unique(self.offsets, return_counts=True)
+
+        # Exact sum of the squared offsets as a Python int, from the squares of their high and
+        # low 15 bits which cannot overflow int64
+        high, low = self.offsets >> 15, self.offsets & 0x7fff
+        self.sum_squares = ((int((high*high).sum()) << 30) + (int((high*low).sum()) << 16)
+                            + int((low*low).sum()))
+
+    def linear_cost(self, position):
+        """
+        Calculates the total fuel spent to move every submarine to a common position, where
+        each movement of a submarine by 1 position costs 1 fuel. The submarines left of the
+        position each spend the position less their own, and those right of it the reverse,
+        so the total follows from the prefix sum up to the position.
+
+        Parameters
+        ----------
+        position : int
+            The common position.
+
+        Returns
+        -------
+        fuel_spent : int
+            The total fuel spent.
+
+        """
+        x = int(position) - self.origin
+        left = int(np.searchsorted(self.offsets, x, 'right'))
+        below, total = int(self.prefix[left]), int(self.prefix[-1])
+        fuel_spent = x*left - below + (total - below) - x*(self.size - left)
+        return fuel_spent
+
+    def triangular_cost(self, position):
+        """
+        Calculates the total fuel spent to move every submarine to a common position, where
+        each movement of a given submarine by 1 position costs 1 more fuel than the previous
+        movement of that submarine, starting at 1 fuel for the first movement. Moving a
+        distance d costs d(d+1)/2, so the total is half of the sum of the squared distances,
+        found from the sums of the positions and their squares, plus the linear cost.
+
+        Parameters
+        ----------
+        position : int
+            The common position.
+
+        Returns
+        -------
+        fuel_spent : int
+            The total fuel spent.
+
+        """
+        x = int(position) - self.origin
+        squares = self.sum_squares - 2*x*int(self.prefix[-1]) + self.size*x*x
+        fuel_spent = (squares + self.linear_cost(position)) // 2
+        return fuel_spent
+
+    def min_linear_cost(self):
+        """
+        Calculates the minimum total fuel spent with the linear cost, which is at the median
+        position.
+
+        Returns
+        -------
+        minimum_fuel_spent : int
+            The minimum total fuel spent to get every submarine to a common position.
+
+        """
+        median = self.origin + int(self.offsets[(self.size - 1)//2])
+        return self.linear_cost(median)
+
+    def min_triangular_cost(self):
+        """
+        Calculates the minimum total fuel spent with the triangular cost, which is within
+        half a position of the mean position, so only the integer positions either side of
+        the mean need to be tried.
+
+        Returns
+        -------
+        minimum_fuel_spent : int
+            The minimum total fuel spent to get every submarine to a common position.
+
+        """
+        mean = self.origin + int(self.prefix[-1])//self.size
+        return min(self.triangular_cost(x) for x in range(mean - 1, mean + 3))
+
+    def total_cost(self, fuel, position):
+        """
+        Calculates the total fuel spent to move every submarine to a common position, for
+        any cost of moving a submarine a given distance, evaluated once for each distinct
+        position of the submarines. The total is exact, summing the high and low 32 bits of
+        the costs separately so that it cannot overflow int64.
+
+        Parameters
+        ----------
+        fuel : callable or array of int
+            Function giving the fuel used to move a submarine each of an array of
+            distances, or a table of the fuel used for every distance up to the size of
+            the swarm's range. Costs must be integers, either fitting in int64 or as an
+            object array of Python ints.
+        position : int
+            The common position.
+
+        Returns
+        -------
+        fuel_spent : int
+            The total fuel spent.
+
+        """
+        distances = np.abs(self.values - (int(position) - self.origin))
+        costs = np.asarray(fuel(distances) if callable(fuel) else fuel[distances])
+        if costs.dtype == object:
+            return int(np.dot(self.counts.astype(object), costs))
+        if costs.dtype.kind not in 'biu':
+            raise TypeError(f'Fuel costs must be integers, not {costs.dtype}')
+
+        costs = costs.astype(np.int64)
+        high, low = costs >> 32, costs & 0xffffffff
+        fuel_spent = (int(np.dot(self.counts, high)) << 32) + int(np.dot(self.counts, low))
+        return fuel_spent
+
+    def min_cost(self, fuel):
+        """
+        Calculates the minimum total fuel spent to move every submarine to a common
+        position, for any cost of moving a submarine a given distance which is convex and
+        increasing. The total is then convex in the common position, with its minimum
+        between the leftmost and rightmost submarines, so it is found by a binary search
+        for the first position from which the total stops decreasing.
+
+        Parameters
+        ----------
+        fuel : callable or array of int
+            Function giving the fuel used to move a submarine each of an array of
+            distances, e.g. linear_fuel or cumulative_fuel, or a table of the fuel used
+            for every distance up to the size of the swarm's range. Costs must be integers,
+            as in total_cost.
+
+        Returns
+        -------
+        minimum_fuel_spent : int
+            The minimum total fuel spent to get every submarine to a common position.
+        position : int
+            A common position with this minimum total fuel spent.
+
+        """
+        if not callable(fuel):
+            fuel = np.asarray(fuel)
+        costs = {}
+        def cost(x):
+            if x not in costs:
+                costs[x] = self.total_cost(fuel, self.origin + x)
+            return costs[x]
+
+        low, high = 0, int(self.values[-1])
+        while low < high:
+            middle = (low + high)//2
+            if cost(middle + 1) >= cost(middle):
+                high = middle
+            else:
+                low = middle + 1
+
+        return cost(low), self.origin + low
 
 def Day7_Part1(filename='Inputs/Day7_Inputs.txt'):
     """
@@ -9,8 +198,9 @@ def Day7_Part1(filename='Inputs/Day7_Inputs.txt'):
 
     Parameters
     ----------
-    filename : str, optional
-        Input file giving the initial positions of every crab submarine.
+    filename : str or list of int, optional
+        Input file giving the initial positions of every crab submarine, or the list of
+        these positions.
         The default is 'Inputs/Day7_Inputs.txt'.
 
     Returns
@@ -19,52 +209,49 @@ def Day7_Part1(filename='Inputs/Day7_Inputs.txt'):
         The minimum possible fuel spent to get every submarine to a common position.
 
     """
-    file = open(filename)
-    positions_input = []
-    for line in file:
-        line = line.strip()
-        line = shlex.split(line)
-        if len(line) > 0:
-            positions_input.append(line)
-    file.close()
-    
-    positions, i = [], 0
-    while i < len(positions_input[0][0]):
-        curr_pos = ''
-        while i < len(positions_input[0][0]) and positions_input[0][0][i] != ',':
-            curr_pos += positions_input[0][0][i]
-            i += 1
-        positions.append(int(curr_pos))
-        i += 1
-    
-    positions = np.array(positions)
-    fuel_spent, end_points = [], np.arange(min(positions), max(positions)+1, 1)
-    for end_point in end_points:
-        fuel_spent.append(sum(abs(positions - end_point)))
-    
-    minimum_fuel_spent = min(fuel_spent)
+    swarm = CrabSwarm(loader.load(filename, loader.read_comma_ints))
+
+    minimum_fuel_spent = swarm.min_linear_cost()
     return minimum_fuel_spent
 
-def cumulative_fuel(dx_max):
+def linear_fuel(distance):
     """
-    Calculates the total fuel used to move a crab submarine 'dx_max' positions given that
+    Calculates the total fuel used to move a crab submarine a given distance, where each
+    movement of a submarine by 1 position costs 1 fuel.
+
+    Parameters
+    ----------
+    distance : int or array of int
+        The total movement in position of a submarine.
+
+    Returns
+    -------
+    fuel_used : int or array of int
+        Total fuel used to move 'distance' positions.
+
+    """
+    fuel_used = distance
+    return fuel_used
+
+def cumulative_fuel(distance):
+    """
+    Calculates the total fuel used to move a crab submarine a given distance, given that
     each movement of a given submarine by 1 position costs 1 more fuel than the
     previous movement of that submarine, starting at 1 fuel for the first movement.
+    This is the triangular number distance*(distance + 1)/2.
 
     Parameters
     ----------
-    dx_max : int
+    distance : int or array of int
         The total movement in position of a submarine.
 
     Returns
     -------
-    fuel_used : int
-        Total fuel used to move 'dx_max' positions.
+    fuel_used : int or array of int
+        Total fuel used to move 'distance' positions.
 
     """
-    fuel_used = [0]
-    for i in range(1, dx_max):
-        fuel_used.append(fuel_used[-1] + i)
+    fuel_used = distance*(distance + 1)//2
     return fuel_used
     
 def Day7_Part2(filename='Inputs/Day7_Inputs.txt'):
@@ -76,8 +263,9 @@ def Day7_Part2(filename='Inputs/Day7_Inputs.txt'):
 
     Parameters
     ----------
-    filename : str, optional
-        Input file giving the initial positions of every crab submarine.
+    filename : str or list of int, optional
+        Input file giving the initial positions of every crab submarine, or the list of
+        these positions.
         The default is 'Inputs/Day7_Inputs.txt'.
 
     Returns
@@ -86,32 +274,35 @@ def Day7_Part2(filename='Inputs/Day7_Inputs.txt'):
         The minimum possible fuel spent to get every submarine to a common position.
 
     """
-    file = open(filename)
-    positions_input = []
-    for line in file:
-        line = line.strip()
-        line = shlex.split(line)
-        if len(line) > 0:
-            positions_input.append(line)
-    file.close()
-    
-    positions, i = [], 0
-    while i < len(positions_input[0][0]):
-        curr_pos = ''
-        while i < len(positions_input[0][0]) and positions_input[0][0][i] != ',':
-            curr_pos += positions_input[0][0][i]
-            i += 1
-        positions.append(int(curr_pos))
-        i += 1
-    
-    positions = np.array(positions)
-    fuel_spent, end_points = [], np.arange(min(positions), max(positions)+1, 1)
-    cum_fuel = cumulative_fuel(max(positions)+1 - min(positions))
-    for end_point in end_points:
-        fuel_used = 0
-        for position in positions:
-            fuel_used += cum_fuel[abs(position - end_point)]
-        fuel_spent.append(fuel_used)
-    
-    minimum_fuel_spent = min(fuel_spent)
+    swarm = CrabSwarm(loader.load(filename, loader.read_comma_ints))
+
+    minimum_fuel_spent = swarm.min_triangular_cost()
+    return minimum_fuel_spent
+
+def Day7_Models(fuels, filename='Inputs/Day7_Inputs.txt'):
+    """
+    Calculates the minimum possible fuel spent to move every crab submarine to a common
+    position, for each of several costs of moving a submarine a given distance, where the
+    initial positions of each submarine are given in an input file.
+
+    Parameters
+    ----------
+    fuels : list of callable or arrays of int
+        Functions giving the fuel used to move a submarine each of an array of distances,
+        or tables of the fuel used for every distance, which must be convex and increasing.
+    filename : str or list of int, optional
+        Input file giving the initial positions of every crab submarine, or the list of
+        these positions.
+        The default is 'Inputs/Day7_Inputs.txt'.
+
+    Returns
+    -------
+    minimum_fuel_spent : list of int
+        The minimum possible fuel spent to get every submarine to a common position, for
+        each cost.
+
+    """
+    swarm = CrabSwarm(loader.load(filename, loader.read_comma_ints))
+
+    minimum_fuel_spent = [swarm.min_cost(fuel)[0] for fuel in fuels]
     return minimum_fuel_spent
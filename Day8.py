@@ -1,4 +1,211 @@
-import shlex
+import concurrent.futures
+import os
+import numpy as np
+import loader
+
+# Segments lit for each digit on a seven-segment display with the segments correctly wired
+SEGMENTS = ['abcefg', 'cf', 'acdeg', 'acdfg', 'bcdf', 'abdfg', 'abdefg', 'acf', 'abcdefg', 'abcdfg']
+# Number of segments lit by every 7-bit mask of segments, with segment 'a' as bit 0
+POPCOUNT = np.array([bin(mask).count('1') for mask in range(128)], dtype=np.uint8)
+
+def segment_mask(pattern):
+    """
+    Encode a pattern of segments as a 7-bit mask, with segment 'a' as bit 0.
+
+    Parameters
+    ----------
+    pattern : str
+        Letters of the lit segments.
+
+    Returns
+    -------
+    mask : int
+        Mask of the lit segments.
+
+    """
+    mask = 0
+    for char in pattern:
+        mask |= 1 << (ord(char) - ord('a'))
+    return mask
+
+def signature_table():
+    """
+    Build a table identifying every digit from its signature, which is unaffected by
+    which wires lead to which segments: the number of segments it lights, and how many
+    of these it shares with 1 and with 4, the digits lighting 2 and 4 segments.
+
+    Returns
+    -------
+    table : array of int
+        Digit with each signature, indexed by 64*lit + 8*shared_with_1 + shared_with_4,
+        or -1 where no digit has the signature.
+
+    """
+    masks = [segment_mask(pattern) for pattern in SEGMENTS]
+    table = np.full(512, -1, dtype=np.int64)
+    for digit, mask in enumerate(masks):
+        signature = (64*int(POPCOUNT[mask]) + 8*int(POPCOUNT[mask & masks[1]])
+                     + int(POPCOUNT[mask & masks[4]]))
+        table[signature] = digit
+    return table
+
+SIGNATURES = signature_table()
+
+def encode_entries(text):
+    """
+    Encode every pattern in a list of display entries as a 7-bit mask, all at once. Each
+    entry is a line of ten patterns, one for each digit, then '|' and four output
+    patterns. The bits of the letters in each pattern are combined with one
+    np.bitwise_or.reduceat over the letters of every pattern.
+
+    Parameters
+    ----------
+    text : bytes
+        Display entries, one per line.
+
+    Returns
+    -------
+    masks : array of np.uint8
+        Array with one row of 14 masks per entry, the ten patterns then the four outputs.
+
+    """
+    data = np.frombuffer(text, dtype=np.uint8)
+    is_letter = (data >= ord('a')) & (data <= ord('g'))
+    # Every pattern starts with a letter following a character which is not a letter
+    starts = is_letter & ~np.concatenate(([False], is_letter[:-1]))
+
+    bits = np.left_shift(1, data[is_letter] - ord('a')).astype(np.uint8)
+    if len(bits) == 0:
+        return np.zeros((0, 14), dtype=np.uint8)
+    masks = np.bitwise_or.reduceat(bits, np.flatnonzero(starts[is_letter]))
+    return masks.reshape(-1, 14)
+
+def decode_entries(masks):
+    """
+    Decode the output digits of many display entries at once. The patterns lighting 2
+    and 4 segments in each entry are 1 and 4, so every output digit is identified from
+    the signature of its pattern in SIGNATURES.
+
+    Parameters
+    ----------
+    masks : array of np.uint8
+        Array with one row of 14 masks per entry, the ten patterns then the four outputs.
+
+    Returns
+    -------
+    digits : array of int
+        Array with one row of the four output digits per entry.
+
+    """
+    patterns, outputs = masks[:, :10], masks[:, 10:]
+    lit = POPCOUNT[patterns]
+    entries = np.arange(len(masks))
+    one = patterns[entries, np.argmax(lit == 2, axis=1)][:, None]
+    four = patterns[entries, np.argmax(lit == 4, axis=1)][:, None]
+
+    signatures = (64*POPCOUNT[outputs].astype(np.int64) + 8*POPCOUNT[outputs & one]
+                  + POPCOUNT[outputs & four])
+    digits = SIGNATURES[signatures]
+    return digits
+
+def read_entries(filename):
+    """
+    Read display entries from an input file, or from its whitespace-separated tokens.
+
+    Parameters
+    ----------
+    filename : str or list of lists of str
+        Input file giving the display entries, or the whitespace-separated tokens on
+        each line of such a file.
+
+    Returns
+    -------
+    text : bytes
+        Display entries, one per line.
+
+    """
+    if loader.is_filename(filename):
+        with open(filename, 'rb') as f:
+            return f.read()
+    return '\n'.join(' '.join(line) for line in filename).encode()
+
+def summarise_entries(masks):
+    """
+    Calculate both puzzle answers for a set of encoded display entries.
+
+    Parameters
+    ----------
+    masks : array of np.uint8
+        Array with one row of 14 masks per entry, the ten patterns then the four outputs.
+
+    Returns
+    -------
+    unique_length_digits : int
+        The number of times 1, 4, 7 or 8 appear in the output numbers.
+    output_sum : int
+        The sum of the output values.
+
+    """
+    # 1, 4, 7 and 8 are the only digits lighting 2, 4, 3 and 7 segments
+    lit = POPCOUNT[masks[:, 10:]]
+    unique_length_digits = int(np.count_nonzero((lit <= 4) | (lit == 7)))
+    output_sum = int((decode_entries(masks) @ np.array([1000, 100, 10, 1])).sum())
+    return unique_length_digits, output_sum
+
+def chunk_ranges(filename, chunk_size=2**26):
+    """
+    Split a file into byte ranges of about a given size, each ending at the end of a line.
+
+    Parameters
+    ----------
+    filename : str
+        Input file.
+    chunk_size : int, optional
+        Approximate number of bytes in each range.
+        The default is 2**26.
+
+    Returns
+    -------
+    ranges : list of tuple (int, int)
+        (start, end) of every range, with the end exclusive.
+
+    """
+    size = os.path.getsize(filename)
+    boundaries = [0]
+    with open(filename, 'rb') as f:
+        while boundaries[-1] + chunk_size < size:
+            # Move the boundary on to the start of the next line
+            f.seek(boundaries[-1] + chunk_size)
+            f.readline()
+            if f.tell() >= size:
+                break
+            boundaries.append(f.tell())
+    boundaries.append(size)
+    return list(zip(boundaries[:-1], boundaries[1:]))
+
+def decode_range(filename, start, end):
+    """
+    Calculate both puzzle answers for the display entries in a byte range of a file.
+
+    Parameters
+    ----------
+    filename : str
+        Input file giving the display entries.
+    start, end : int
+        Start and (exclusive) end of the byte range, at line boundaries.
+
+    Returns
+    -------
+    unique_length_digits : int
+        The number of times 1, 4, 7 or 8 appear in the output numbers in the range.
+    output_sum : int
+        The sum of the output values in the range.
+
+    """
+    with open(filename, 'rb') as f:
+        f.seek(start)
+        text = f.read(end - start)
+    return summarise_entries(encode_entries(text))
 
 def Day8_Part1(filename='Inputs/Day8_Inputs.txt'):
     """
@@ -9,10 +216,10 @@ def Day8_Part1(filename='Inputs/Day8_Inputs.txt'):
 
     Parameters
     ----------
-    filename : str, optional
+    filename : str or list of lists of str, optional
         Input file giving the letters which correspond to each of the ten possible
         numbers on the seven segment display, followed by letters specifying four
-        output numbers.
+        output numbers, or the whitespace-separated tokens on each line of such a file.
         The default is 'Inputs/Day8_Inputs.txt'.
 
     Returns
@@ -21,28 +228,9 @@ def Day8_Part1(filename='Inputs/Day8_Inputs.txt'):
         The number of times 1, 4, 7 or 8 appear in the output numbers.
 
     """
-    file = open(filename)
-    digits = []
-    for line in file:
-        line = line.strip()
-        line = shlex.split(line)
-        if len(line) > 0:
-            digits.append(line)
-    file.close()
-    
-    all_digits, output = [], []
-    for digit_set in digits:
-        for i in range(len(digit_set)):
-            if digit_set[i] == '|':
-                all_digits.append(digit_set[:i])
-                output.append(digit_set[i+1:])
-                
-    unique_length_digits = 0
-    for output_set in output:
-        for output_digit in output_set:
-            if len(output_digit) <= 4 or len(output_digit) == 7:
-                unique_length_digits += 1
-            
+    masks = encode_entries(read_entries(filename))
+
+    unique_length_digits, _ = summarise_entries(masks)
     return unique_length_digits
 
 def Day8_Part2(filename='Inputs/Day8_Inputs.txt'):
@@ -51,6 +239,32 @@ def Day8_Part2(filename='Inputs/Day8_Inputs.txt'):
     each value is represented by up to 7 letters, each of which represent a segment on
     a seven-segment display, but the position of each letter on the display is not known.
 
+    Parameters
+    ----------
+    filename : str or list of lists of str, optional
+        Input file giving the letters which correspond to each of the ten possible
+        numbers on the seven segment display, followed by letters specifying four
+        output numbers, or the whitespace-separated tokens on each line of such a file.
+        The default is 'Inputs/Day8_Inputs.txt'.
+
+    Returns
+    -------
+    output_sum : int
+        The sum of the output values.
+
+    """
+    digits = decode_entries(encode_entries(read_entries(filename)))
+
+    output_sum = int((digits @ np.array([1000, 100, 10, 1])).sum())
+    return output_sum
+
+def Day8_Parallel(filename='Inputs/Day8_Inputs.txt', workers=None, chunk_size=2**26):
+    """
+    Calculates both the number of times the digits 1, 4, 7, or 8 appear in the output
+    values given in an input file, and the sum of these output values, for logs too large
+    to read at once. The file is split into byte ranges at line boundaries, which are
+    decoded independently in a pool of processes, and the partial answers are summed.
+
     Parameters
     ----------
     filename : str, optional
@@ -58,112 +272,30 @@ def Day8_Part2(filename='Inputs/Day8_Inputs.txt'):
         numbers on the seven segment display, followed by letters specifying four
         output numbers.
         The default is 'Inputs/Day8_Inputs.txt'.
+    workers : int or None, optional
+        Number of worker processes, or None for one per CPU. With 1 worker the ranges
+        are decoded in this process.
+        The default is None.
+    chunk_size : int, optional
+        Approximate number of bytes decoded at a time by each worker.
+        The default is 2**26.
 
     Returns
     -------
+    unique_length_digits : int
+        The number of times 1, 4, 7 or 8 appear in the output numbers.
     output_sum : int
         The sum of the output values.
 
     """
-    file = open(filename)
-    digits = []
-    for line in file:
-        line = line.strip()
-        line = shlex.split(line)
-        if len(line) > 0:
-            digits.append(line)
-    file.close()
-    
-    all_digits, output = [], []
-    for digit_set in digits:
-        for i in range(len(digit_set)):
-            if digit_set[i] == '|':
-                all_digits.append(digit_set[:i])
-                output.append(digit_set[i+1:])
-    
-    output_sum = 0
-    for index, digit_set in enumerate(all_digits):
-        possible_digits = ['a', 'b', 'c', 'd', 'e', 'f', 'g']
-        digit_nums = [0, 0, 0, 0, 0, 0, 0]
-        for n, digit in enumerate(digit_set):
-            for char in digit:
-                digit_nums[possible_digits.index(char)] += 1
-            if len(digit) == 2:
-                one = n
-            if len(digit) == 3:
-                seven = n
-            if len(digit) == 4:
-                four = n
-            if len(digit) == 7:
-                eight = n  
-                
-        top_left = possible_digits[digit_nums.index(6)]
-        possible_digits.pop(digit_nums.index(6))
-        digit_nums.pop(digit_nums.index(6))
-        bottom_left = possible_digits[digit_nums.index(4)]
-        possible_digits.pop(digit_nums.index(4))
-        digit_nums.pop(digit_nums.index(4))
-        bottom_right = possible_digits[digit_nums.index(9)]
-        possible_digits.pop(digit_nums.index(9))
-        digit_nums.pop(digit_nums.index(9))
-        
-        for char in digit_set[seven]:
-            if digit_set[one].find(char) < 0:
-                top = char
-                digit_nums.pop(possible_digits.index(top))
-                possible_digits.pop(possible_digits.index(top))
-        
-        top_right = possible_digits[digit_nums.index(8)]
-        possible_digits.pop(digit_nums.index(8))
-        digit_nums.pop(digit_nums.index(8))
-        
-        for char in digit_set[four]:
-            if digit_set[one].find(char) < 0:
-                try:
-                    middle = possible_digits.pop(possible_digits.index(char))
-                    break
-                except:
-                    continue
-        
-        bottom = possible_digits[0]
-        
-        possible_numbers = ['0', '1', '2', '3', '4', '5', '6', '7', '8', '9']
-        number_segments = []
-        #0
-        zero = top + top_right + bottom_right + bottom + bottom_left + top_left
-        number_segments.append(''.join(sorted(zero)))
-        #1
-        one = top_right + bottom_right
-        number_segments.append(''.join(sorted(one)))
-        #2
-        two = top + top_right + middle + bottom_left + bottom
-        number_segments.append(''.join(sorted(two)))
-        #3
-        three = top + top_right + middle + bottom_right + bottom
-        number_segments.append(''.join(sorted(three)))
-        #4
-        four = top_left + middle + top_right + bottom_right
-        number_segments.append(''.join(sorted(four)))
-        #5
-        five = top + top_left + middle + bottom_right + bottom
-        number_segments.append(''.join(sorted(five)))
-        #6
-        six = top + top_left + bottom_left + bottom + bottom_right + middle
-        number_segments.append(''.join(sorted(six)))
-        #7
-        seven = top + top_right + bottom_right
-        number_segments.append(''.join(sorted(seven)))
-        #8
-        eight = top + top_right + bottom_right + bottom + bottom_left + top_left + middle
-        number_segments.append(''.join(sorted(eight)))
-        #9
-        nine = top + top_left + middle + top_right + bottom_right + bottom
-        number_segments.append(''.join(sorted(nine)))
-        
-        output_number = ''
-        for output_digit in output[index]:
-            output_number += possible_numbers[number_segments.index(''.join(sorted(output_digit)))]
-        
-        output_sum += int(output_number)
-        
-    return output_sum
\ No newline at end of file
+    ranges = chunk_ranges(filename, chunk_size)
+    starts, ends = [start for start, _ in ranges], [end for _, end in ranges]
+    if workers == 1:
+        partials = list(map(decode_range, [filename]*len(ranges), starts, ends))
+    else:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as pool:
+            partials = list(pool.map(decode_range, [filename]*len(ranges), starts, ends))
+
+    unique_length_digits = sum(unique for unique, _ in partials)
+    output_sum = sum(total for _, total in partials)
+    return unique_length_digits, output_sum
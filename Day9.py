@@ -1,85 +1,6 @@
-import shlex
 import numpy as np
-
-class Coordinates:
-    """
-    Class to define a pair of coordinates (x, y)
-    """
-    def __init__(self, pos):
-        """
-        Initialise the class with one parameter.
-
-        Parameters
-        ----------
-        pos : list of int
-            Coordinates in the form [x, y].
-            
-        Returns
-        -------
-        None.
-
-        """
-        self.x = pos[0]
-        self.y = pos[1]
-    
-    def __repr__(self):
-        """
-        Return the representation of a Coordinates object.
-
-        Returns
-        -------
-        str
-            Representation.
-
-        """
-        return f'{self.__class__.__name__}({self.x}, {self.y})'
-    
-    def __hash__(self):
-        """
-        Override the hash function for a Coordinates object.
-
-        Returns
-        -------
-        int
-            The hash of the Coordinates.
-
-        """
-        return hash((self.x, self.y))
-
-    def __eq__(self, other):
-        """
-        Overrides the == operator for a Coordinates object.
-
-        Parameters
-        ----------
-        other : Coordinates
-            The Coordinates object to which we are comparing.
-
-        Returns
-        -------
-        bool
-            Whether the two Coordinates are equivalent or not.
-
-        """
-        return (self.x, self.y) == (other.x, other.y)
-
-    def __ne__(self, other):
-        """
-        Overrides the != operator for a Coordinates object.
-
-        Parameters
-        ----------
-        other : Coordinates
-            The Coordinates object to which we are comparing.
-
-        Returns
-        -------
-        bool
-            Whether the two Coordinates are different or not.
-
-        """
-        return not(self == other)
-
+import loader
+from grid import Grid
 
 def Day9_Part1(filename='Inputs/Day9_Inputs.txt'):
     """
@@ -88,8 +9,9 @@ def Day9_Part1(filename='Inputs/Day9_Inputs.txt'):
 
     Parameters
     ----------
-    filename : str, optional
-        Input file giving the heights of all points on the map.
+    filename : str or array of int, optional
+        Input file giving the heights of all points on the map, or a 2D array of these
+        heights.
         The default is 'Inputs/Day9_Inputs.txt'.
 
     Returns
@@ -99,75 +21,61 @@ def Day9_Part1(filename='Inputs/Day9_Inputs.txt'):
         factor is 1 more than the height of a point.
 
     """
-    file = open(filename)
-    points, line_num = {}, 0
-    for line in file:
-        line = line.strip()
-        line = shlex.split(line)
-        if len(line) > 0:
-            for n, height in enumerate(line[0]):
-                points[Coordinates([n, line_num])] = int(height)
-            line_num += 1
-    file.close()
-    
-    risk_sum = 0
-    for point in points:
-        x, y = point.x, point.y
-        lowest = True
-        for pos in [[x-1, y], [x+1, y], [x, y-1], [x, y+1]]:
-            try:
-                if points[Coordinates(pos)] <= points[point]:
-                    lowest = False
-            except:
-                pass
-        
-        if lowest:
-            risk_sum += points[point] + 1
-    
+    heights = np.asarray(loader.load(filename, loader.read_digit_grid))
+
+    _, risk_sum = low_points(heights)
+
     return risk_sum
 
-def check_adjacent(point, points, basin=0):
+def low_points(heights, band_rows=2**10):
     """
-    Recursive function to calculate the number of points on a map which are in a basin
-    containing the given point, where a basin is a group of points with heights less than
-    9, surrounded by points with a height of 9, or the edge of the map. Points exist on a
-    map.
+    Finds the points on a map which are lower than all adjacent points (not including
+    diagonally adjacent points). The map is padded with heights above any on the map,
+    acting as +inf, so every point can be compared with four shifted views of the padded
+    map, one band of rows at a time so that only one band of comparisons is held in
+    memory at once, however large the map.
 
     Parameters
     ----------
-    point : Coordinates
-        Starting point for the search for all points in the current basin.
-    points : map {Coordinates : int}
-        Map of all points, with the Coordinates of a point as the key and the height of a
-        point as the value.
-    basin : int, optional
-        The number of points in the basin. The default is 0 as this is the starting value
-        of basin.
+    heights : array of int or float
+        2D array of the heights of all points on the map.
+    band_rows : int, optional
+        Number of rows of the map to compare at a time.
+        The default is 2**10.
 
     Returns
     -------
-    basin : int
-        The total number of points in the current basin.
-    points : map {Coordinates : int}
-        The map of points with the heights of all counted points for the given basin
-        changed to 10 (required to avoid double counting).
+    lowest : array of bool
+        Whether each point is a low point.
+    risk_sum : int
+        The sum of the risk factors of all the low points, where the risk factor is 1
+        more than the height of a point.
 
     """
-    x, y = point.x, point.y
-    if basin == 0:
-        basin += 1
-    points[point] = 10
-    for pos in [[x-1, y], [x+1, y], [x, y-1], [x, y+1]]:
-        try:
-            if points[Coordinates(pos)] >= 9:
-                pass
-            else:
-                basin += 1
-                basin, points = check_adjacent(Coordinates(pos), points, basin)
-        except:
-            pass
-    
-    return basin, points
+    heights = np.asarray(heights)
+    if np.issubdtype(heights.dtype, np.integer):
+        # The padding must be higher than every point, so widen maps reaching the maximum
+        if heights.size and heights.max() == np.iinfo(heights.dtype).max:
+            heights = heights.astype(np.float64)
+    fill = np.inf if np.issubdtype(heights.dtype, np.floating) else np.iinfo(heights.dtype).max
+    padded = Grid(heights, fill=fill).data
+
+    rows = heights.shape[0]
+    lowest = np.empty(heights.shape, dtype=bool)
+    risk_sum = 0
+    for start in range(0, rows, band_rows):
+        stop = min(start + band_rows, rows)
+        # Band of padded rows including the rows above and below it
+        band = padded[start:stop+2]
+        centre = band[1:-1, 1:-1]
+        low = lowest[start:stop]
+        np.less(centre, band[:-2, 1:-1], out=low)
+        low &= centre < band[2:, 1:-1]
+        low &= centre < band[1:-1, :-2]
+        low &= centre < band[1:-1, 2:]
+        risk_sum += int(centre[low].sum()) + int(np.count_nonzero(low))
+
+    return lowest, risk_sum
 
 def Day9_Part2(filename='Inputs/Day9_Inputs.txt'):
     """
@@ -177,8 +85,9 @@ def Day9_Part2(filename='Inputs/Day9_Inputs.txt'):
 
     Parameters
     ----------
-    filename : str, optional
-        Input file giving the heights of all points on the map.
+    filename : str or array of int, optional
+        Input file giving the heights of all points on the map, or a 2D array of these
+        heights.
         The default is 'Inputs/Day9_Inputs.txt'.
 
     Returns
@@ -187,25 +96,14 @@ def Day9_Part2(filename='Inputs/Day9_Inputs.txt'):
         The product of the sizes of the three largest basins on the map.
 
     """
-    file = open(filename)
-    points, line_num = {}, 0
-    for line in file:
-        line = line.strip()
-        line = shlex.split(line)
-        if len(line) > 0:
-            for n, height in enumerate(line[0]):
-                points[Coordinates([n, line_num])] = int(height)
-            line_num += 1
-    file.close()
-    
-    basins = []
-    for point in points:
-        if points[point] < 9:
-            basin_next, points = check_adjacent(point, points)
-            basins.append(basin_next)
-            
+    heights = Grid(loader.load(filename, loader.read_digit_grid), fill=9, dtype=np.uint8)
+
+    # Label every basin, as the regions of points lower than 9, and count the points in each
+    labels = heights.label_regions(heights.values < 9)
+    basins = np.bincount(labels[labels >= 0])
+
     basin_product = 1
-    for i in range(3):
-        basin_product *= basins.pop(np.argmax(basins))
-            
-    return basin_product
\ No newline at end of file
+    for basin in np.sort(basins)[-3:]:
+        basin_product *= int(basin)
+
+    return basin_product
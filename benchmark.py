@@ -0,0 +1,539 @@
+"""
+Benchmark harness for the DayN_PartM solutions. Every puzzle input format has a generator which
+emits a synthetic input at a controllable scale, and the harness times the solutions across a
+sweep of scales and fits empirical complexity curves to the timings.
+
+Usage: python -m benchmark [-d DAY [DAY ...]] [-p PART [PART ...]] [-s SIZE [SIZE ...]]
+                           [-r REPEATS] [--seed SEED] [--json]
+"""
+import argparse
+import json
+import math
+import os
+import tempfile
+import numpy as np
+import runner
+from Day19 import rotations
+
+###################################################################################################
+#
+# Each generator takes a size and a random number generator and returns the text of an input file.
+# The meaning of size depends on the puzzle, as given in each docstring. Days 21, 23 and 24 have
+# fixed-size inputs, so their generators ignore size and only randomise the contents.
+#
+###################################################################################################
+
+def generate_day1(size: int, rng: np.random.Generator) -> str:
+    """
+    Generate a list of 'size' sonar depths, following a random walk.
+    """
+    depths = 100 + np.cumsum(rng.integers(-5, 15, size))
+    return '\n'.join(map(str, depths.tolist())) + '\n'
+
+def generate_day2(size: int, rng: np.random.Generator) -> str:
+    """
+    Generate 'size' submarine commands.
+    """
+    directions = rng.choice(['forward', 'down', 'up'], size, p=[0.5, 0.3, 0.2])
+    magnitudes = rng.integers(1, 10, size)
+    return ''.join(f'{d} {m}\n' for d, m in zip(directions, magnitudes.tolist()))
+
+def generate_day3(size: int, rng: np.random.Generator) -> str:
+    """
+    Generate a diagnostic report of 'size' unique binary numbers, with at least 12 bits.
+    """
+    bits = max(12, math.ceil(math.log2(size)) + 1)
+    numbers = rng.choice(2**bits, size, replace=False) if bits < 63 else \
+        np.unique(rng.integers(0, 2**62, size))
+    return ''.join(f'{n:0{bits}b}\n' for n in numbers.tolist())
+
+def generate_day4(size: int, rng: np.random.Generator) -> str:
+    """
+    Generate 'size' 5x5 bingo cards, with every number from 0-99 called in a random order.
+    """
+    calls = ','.join(map(str, rng.permutation(100).tolist()))
+    cards = [rng.choice(100, 25, replace=False).reshape(5, 5).tolist() for _ in range(size)]
+    cards = ['\n'.join(' '.join(f'{n:2d}' for n in row) for row in card) for card in cards]
+    return calls + '\n\n' + '\n\n'.join(cards) + '\n'
+
+def generate_day5(size: int, rng: np.random.Generator, extent: int=1000) -> str:
+    """
+    Generate 'size' lines of vents, split evenly between horizontal, vertical and diagonal lines,
+    in a square area of side 'extent'.
+    """
+    x1, y1 = rng.integers(0, extent, size), rng.integers(0, extent, size)
+    length = rng.integers(0, extent // 4, size)
+    kind = rng.integers(0, 3, size)
+    sign_x, sign_y = rng.choice([-1, 1], size), rng.choice([-1, 1], size)
+    x2 = np.clip(x1 + (kind != 1)*sign_x*length, 0, extent - 1)
+    y2 = np.clip(y1 + (kind != 0)*sign_y*length, 0, extent - 1)
+    # Diagonal lines need equal extents in x and y after clipping
+    diagonal = kind == 2
+    shortest = np.minimum(abs(x2 - x1), abs(y2 - y1))
+    x2[diagonal] = (x1 + np.sign(x2 - x1)*shortest)[diagonal]
+    y2[diagonal] = (y1 + np.sign(y2 - y1)*shortest)[diagonal]
+    return ''.join(f'{a},{b} -> {c},{d}\n' for a, b, c, d in zip(x1.tolist(), y1.tolist(),
+                                                                 x2.tolist(), y2.tolist()))
+
+def generate_day6(size: int, rng: np.random.Generator) -> str:
+    """
+    Generate the internal timers of 'size' lanternfish.
+    """
+    return ','.join(map(str, rng.integers(1, 6, size).tolist())) + '\n'
+
+def generate_day7(size: int, rng: np.random.Generator) -> str:
+    """
+    Generate the positions of 'size' crab submarines.
+    """
+    return ','.join(map(str, rng.integers(0, 2000, size).tolist())) + '\n'
+
+# Segments lit for each digit on a seven-segment display
+SEGMENTS = ['abcefg', 'cf', 'acdeg', 'acdfg', 'bcdf', 'abdfg', 'abdefg', 'acf', 'abcdefg', 'abcdfg']
+
+def generate_day8(size: int, rng: np.random.Generator) -> str:
+    """
+    Generate 'size' seven-segment display entries, each with randomly scrambled wiring.
+    """
+    lines = []
+    for _ in range(size):
+        wiring = dict(zip('abcdefg', rng.permutation(list('abcdefg'))))
+        patterns = [''.join(rng.permutation([wiring[s] for s in seg])) for seg in SEGMENTS]
+        output = [patterns[d] for d in rng.integers(0, 10, 4)]
+        lines.append(' '.join(rng.permutation(patterns)) + ' | ' + ' '.join(output))
+    return '\n'.join(lines) + '\n'
+
+def digit_grid(width: int, height: int, rng: np.random.Generator, p_nine: float=0.0) -> str:
+    """
+    Generate a grid of random digits from 0-8, with each digit replaced by 9 with probability
+    'p_nine'.
+    """
+    grid = rng.integers(0, 9, (height, width))
+    grid[rng.random((height, width)) < p_nine] = 9
+    return '\n'.join(''.join(map(str, row)) for row in grid.tolist()) + '\n'
+
+def generate_day9(size: int, rng: np.random.Generator) -> str:
+    """
+    Generate a 'size' x 'size' heightmap, with enough 9s to split it into many basins.
+    """
+    return digit_grid(size, size, rng, 0.35)
+
+def generate_day10(size: int, rng: np.random.Generator) -> str:
+    """
+    Generate 'size' lines of navigation subsystem brackets, roughly half corrupted and half
+    incomplete.
+    """
+    openers, closers = '([{<', ')]}>'
+    lines = []
+    for _ in range(size):
+        line, stack = [], []
+        for _ in range(rng.integers(20, 110)):
+            if stack and rng.random() < 0.45:
+                line.append(closers[stack.pop()])
+            else:
+                stack.append(rng.integers(0, 4))
+                line.append(openers[stack[-1]])
+        if rng.random() < 0.5 and stack:
+            # Corrupt the line with a closing character not matching the last opener
+            line.append(closers[(stack[-1] + rng.integers(1, 4)) % 4])
+        else:
+            # Ensure the line is incomplete
+            line.append(openers[rng.integers(0, 4)])
+        lines.append(''.join(line))
+    return '\n'.join(lines) + '\n'
+
+def octopus_sync_step(energy: np.ndarray, max_steps: int=2000) -> int:
+    """
+    Find the first step in which every octopus in a grid flashes simultaneously, or None if this
+    doesn't happen within 'max_steps' steps.
+    """
+    energy, (height, width) = energy.copy(), energy.shape
+    for step in range(1, max_steps + 1):
+        energy += 1
+        flashed = np.zeros(energy.shape, dtype=bool)
+        while (new := (energy > 9) & ~flashed).any():
+            flashed |= new
+            padded = np.pad(new, 1).astype(int)
+            energy += sum(padded[1+dy:1+dy+height, 1+dx:1+dx+width] \
+                          for dy in (-1, 0, 1) for dx in (-1, 0, 1) if dy or dx)
+        energy[flashed] = 0
+        if flashed.all():
+            return step
+    return None
+
+def generate_day11(size: int, rng: np.random.Generator, max_attempts: int=1000) -> str:
+    """
+    Generate a 'size' x 'size' grid of octopus energy levels (size >= 10). Random grids often never
+    synchronise, which would make Part 2 run forever, so grids are rejection sampled until one
+    does.
+    """
+    size = max(size, 10)
+    for _ in range(max_attempts):
+        energy = rng.integers(0, 10, (size, size))
+        if octopus_sync_step(energy) is not None:
+            return '\n'.join(''.join(map(str, row)) for row in energy.tolist()) + '\n'
+    raise ValueError(f'No synchronising {size} x {size} grid found in {max_attempts} attempts')
+
+def generate_day12(size: int, rng: np.random.Generator) -> str:
+    """
+    Generate a cave system with 'size' small caves and size // 3 + 1 big caves. Big caves are
+    never linked to each other, so the number of paths is finite.
+    """
+    small = [chr(ord('a') + i // 26) + chr(ord('a') + i % 26) for i in range(size)]
+    big = [name.upper() for name in small[:size // 3 + 1]]
+    links = set()
+    for cave in small + big:
+        for other in rng.choice(small, min(2, size), replace=False):
+            if cave != other:
+                links.add(tuple(sorted((cave, str(other)))))
+    for end in ['start', 'end']:
+        for other in rng.choice(small + big, 2, replace=False):
+            links.add((end, str(other)))
+    return ''.join(f'{a}-{b}\n' for a, b in links)
+
+def generate_day13(size: int, rng: np.random.Generator) -> str:
+    """
+    Generate 'size' dots on a sheet of transparent paper, with folds halving it down to a
+    40 x 6 grid.
+    """
+    width, height, folds = 1311, 895, []
+    while width > 40 or height > 6:
+        if width > 40:
+            width //= 2
+            folds.append(f'fold along x={width}')
+        if height > 6:
+            height //= 2
+            folds.append(f'fold along y={height}')
+    dots = zip(rng.integers(0, 1311, size).tolist(), rng.integers(0, 895, size).tolist())
+    return ''.join(f'{x},{y}\n' for x, y in dots) + '\n' + '\n'.join(folds) + '\n'
+
+def generate_day14(size: int, rng: np.random.Generator) -> str:
+    """
+    Generate a polymer template of length 'size', with an insertion rule for every pair of 10
+    elements.
+    """
+    elements = list('BCFHKNOPSV')
+    template = ''.join(rng.choice(elements, max(size, 2)))
+    rules = ''.join(f'{a}{b} -> {rng.choice(elements)}\n' for a in elements for b in elements)
+    return template + '\n\n' + rules
+
+def generate_day15(size: int, rng: np.random.Generator) -> str:
+    """
+    Generate a 'size' x 'size' grid of risk levels from 1-9.
+    """
+    grid = rng.integers(1, 10, (size, size))
+    return '\n'.join(''.join(map(str, row)) for row in grid.tolist()) + '\n'
+
+def generate_day16(size: int, rng: np.random.Generator) -> str:
+    """
+    Generate a BITS transmission with 'size' literal values, grouped under nested sum, minimum and
+    maximum operators.
+    """
+    def literal(value):
+        groups = f'{value:b}'.zfill(4*math.ceil(len(f'{value:b}')/4))
+        groups = [groups[i:i+4] for i in range(0, len(groups), 4)]
+        return f'{rng.integers(0, 8):03b}100' + ''.join(('1' if i < len(groups) - 1 else '0') + g \
+                                                       for i, g in enumerate(groups))
+
+    def operator(type_id, children):
+        return f'{rng.integers(0, 8):03b}{type_id:03b}1{len(children):011b}' + ''.join(children)
+
+    packets = [literal(int(v)) for v in rng.integers(0, 2**16, size)]
+    # Group packets under operators with at most 8 sub-packets each, until one packet remains
+    while len(packets) > 1:
+        packets = [operator(int(rng.choice([0, 2, 3])), packets[i:i+8]) \
+                   for i in range(0, len(packets), 8)]
+    packet = operator(0, packets)
+    packet += '0'*(-len(packet) % 4)
+    return ''.join(f'{int(packet[i:i+4], 2):X}' for i in range(0, len(packet), 4)) + '\n'
+
+def generate_day17(size: int, rng: np.random.Generator) -> str:
+    """
+    Generate a target area whose extent in x and y scales with 'size'.
+    """
+    x1, y1 = int(rng.integers(size, 2*size)), int(rng.integers(-3*size, -2*size))
+    return f'target area: x={x1}..{x1 + size}, y={y1}..{y1 + size}\n'
+
+def generate_day18(size: int, rng: np.random.Generator) -> str:
+    """
+    Generate 'size' reduced snailfish numbers.
+    """
+    def snail_num(depth):
+        if depth > 1 and (depth == 4 or rng.random() < 0.3):
+            return str(rng.integers(0, 10))
+        return f'[{snail_num(depth + 1)},{snail_num(depth + 1)}]'
+
+    return ''.join(snail_num(1) + '\n' for _ in range(size))
+
+def generate_day19(size: int, rng: np.random.Generator) -> str:
+    """
+    Generate the beacon reports of 'size' scanners in a chain, where consecutive scanners share
+    at least 12 beacons, each scanner reporting in a random orientation.
+    """
+    positions = np.zeros((max(size, 2), 3), dtype=int)
+    positions[1:, 0] = np.cumsum(rng.integers(1000, 1200, len(positions) - 1))
+    positions[1:, 1:] = rng.integers(-100, 100, (len(positions) - 1, 2))
+    beacons = [rng.integers(-1000, 1000, (10, 3)) + positions[0]]
+    for a, b in zip(positions[:-1], positions[1:]):
+        # Place 12 beacons in the volume seen by both scanners, and 10 more near the second
+        low, high = np.maximum(a, b) - 1000, np.minimum(a, b) + 1000
+        beacons.append(rng.integers(low, high + 1, (12, 3)))
+        beacons.append(rng.integers(-1000, 1000, (10, 3)) + b)
+    beacons = np.unique(np.concatenate(beacons), axis=0)
+    reports = []
+    for n, position in enumerate(positions):
+        seen = beacons[(abs(beacons - position) <= 1000).all(axis=1)] - position
+        seen = seen.dot(rotations[rng.integers(0, 24)].T) if n else seen
+        reports.append(f'--- scanner {n} ---\n' + '\n'.join(','.join(map(str, b)) \
+                                                             for b in seen.tolist()))
+    return '\n\n'.join(reports) + '\n'
+
+def generate_day20(size: int, rng: np.random.Generator) -> str:
+    """
+    Generate an image enhancement algorithm and a 'size' x 'size' input image.
+    """
+    algorithm = ''.join(rng.choice(['.', '#'], 512))
+    algorithm = '#' + algorithm[1:-1] + '.'
+    image = '\n'.join(''.join(rng.choice(['.', '#'], size)) for _ in range(size))
+    return algorithm + '\n\n' + image + '\n'
+
+def generate_day21(size: int, rng: np.random.Generator) -> str:
+    """
+    Generate random starting positions for both players (fixed-size format).
+    """
+    return ''.join(f'Player {p} starting position: {rng.integers(1, 11)}\n' for p in [1, 2])
+
+def generate_day22(size: int, rng: np.random.Generator) -> str:
+    """
+    Generate 'size' reboot steps, the first fifth within the initialization procedure area and the
+    rest spread over the whole reactor.
+    """
+    lines = []
+    for n in range(size):
+        extent, length = (50, 50) if n < size // 5 else (100000, 40000)
+        low = rng.integers(-extent, extent, 3)
+        high = low + rng.integers(0, length, 3)
+        state = 'on' if n == 0 or rng.random() < 0.6 else 'off'
+        lines.append(f'{state} ' + ','.join(f'{axis}={a}..{b}' for axis, a, b in \
+                                             zip('xyz', low.tolist(), high.tolist())))
+    return '\n'.join(lines) + '\n'
+
+def generate_day23(size: int, rng: np.random.Generator) -> str:
+    """
+    Generate a random starting layout of 8 amphipods (fixed-size format).
+    """
+    amphipods = rng.permutation(list('AABBCCDD'))
+    return '#############\n#...........#\n###{}#{}#{}#{}###\n  #{}#{}#{}#{}#\n  #########\n' \
+        .format(*amphipods)
+
+def generate_day24(size: int, rng: np.random.Generator) -> str:
+    """
+    Generate a random MONAD program with 14 rounds of instructions, which accepts at least one
+    model number (fixed-size format).
+    """
+    template = ['inp w', 'mul x 0', 'add x z', 'mod x 26', 'div z {}', 'add x {}', 'eql x w',
+                'eql x 0', 'mul y 0', 'add y 25', 'mul y x', 'add y 1', 'mul z y', 'mul y 0',
+                'add y w', 'add y {}', 'mul y x', 'add z y']
+    # Randomly order 7 pushes (v2 == 1) and 7 pops (v2 == 26) so the stack never underflows
+    rounds, stack, pushes = [], [], 7
+    for i in range(14):
+        if pushes and (not stack or rng.random() < 0.5):
+            v3 = int(rng.integers(1, 17))
+            stack.append(v3)
+            rounds.append((1, int(rng.integers(10, 16)), v3))
+            pushes -= 1
+        else:
+            dw = int(rng.integers(-8, 9))
+            rounds.append((26, dw - stack.pop(), int(rng.integers(1, 17))))
+    program = []
+    for v2, v1, v3 in rounds:
+        program += template[:4] + [template[4].format(v2), template[5].format(v1)] + \
+            template[6:15] + [template[15].format(v3)] + template[16:]
+    return '\n'.join(program) + '\n'
+
+def generate_day25(size: int, rng: np.random.Generator) -> str:
+    """
+    Generate a 'size' x 'size' grid of sea cucumbers.
+    """
+    grid = rng.choice(['.', '>', 'v'], (size, size), p=[0.5, 0.25, 0.25])
+    return '\n'.join(''.join(row) for row in grid.tolist()) + '\n'
+
+GENERATORS = {day: globals()[f'generate_day{day}'] for day in range(1, 26)}
+
+# Default sweep of sizes for each day, chosen to keep the slower solutions within a few seconds
+DEFAULT_SIZES = {1: [10**3, 10**4, 10**5], 2: [10**3, 10**4, 10**5], 3: [10**3, 10**4, 10**5],
+                 4: [10, 30, 100], 5: [100, 300, 1000], 6: [10**3, 10**4, 10**5],
+                 7: [100, 300, 1000], 8: [10**2, 10**3, 10**4], 9: [20, 40, 80],
+                 10: [10**2, 10**3, 10**4], 11: [10, 12, 14], 12: [3, 5, 7],
+                 13: [10**2, 10**3, 10**4], 14: [10, 100, 1000], 15: [5, 10, 15],
+                 16: [10, 100, 1000], 17: [10, 20, 40], 18: [10, 20, 40], 19: [2, 3, 4],
+                 20: [10, 20, 40], 21: [1], 22: [20, 40, 80, 160], 23: [1], 24: [1],
+                 25: [10, 20, 40]}
+
+# Candidate complexity classes
+MODELS = {'O(1)': lambda n: np.ones_like(n),
+          'O(log n)': lambda n: np.log(n),
+          'O(n)': lambda n: n,
+          'O(n log n)': lambda n: n*np.log(n),
+          'O(n^2)': lambda n: n**2,
+          'O(n^3)': lambda n: n**3}
+
+def fit_complexity(sizes: list, times: list) -> dict:
+    """
+    Fit empirical complexity curves to a set of timings. A power law t = c*n^k is fitted in log
+    space, and each candidate class in MODELS is fitted as t = c*f(n) minimising the relative
+    error, with the best fitting class reported.
+
+    Parameters
+    ----------
+    sizes : list(int)
+        Input sizes.
+    times : list(float)
+        Corresponding run times.
+
+    Returns
+    -------
+    fit : dict
+        Dictionary of the fitted power law exponent ('exponent'), best fitting complexity class
+        ('model') and relative RMS error of each class ('errors'), or None entries if there are
+        fewer than two distinct sizes.
+
+    """
+    n, t = np.array(sizes, dtype=float), np.array(times, dtype=float)
+    if len(set(sizes)) < 2 or (t <= 0).any():
+        return {'exponent': None, 'model': None, 'errors': None}
+
+    exponent = np.polyfit(np.log(n), np.log(t), 1)[0]
+    errors = {}
+    for name, model in MODELS.items():
+        # Least squares scaling of f(n)/t onto 1, i.e. minimising relative error
+        f = model(n)/t
+        c = f.sum()/(f**2).sum()
+        errors[name] = float(np.sqrt(np.mean((c*f - 1)**2)))
+
+    return {'exponent': float(exponent), 'model': min(errors, key=errors.get), 'errors': errors}
+
+def benchmark(day: int, parts: list=None, sizes: list=None, repeats: int=1, seed: int=0,
+              directory: str=None) -> list:
+    """
+    Time the DayN_PartM functions for a given day across a sweep of synthetic input sizes, and fit
+    complexity curves to the results.
+
+    Parameters
+    ----------
+    day : int
+        Day number.
+    parts : list(int) or None, optional
+        Parts to benchmark, or None for both parts.
+        The default is None.
+    sizes : list(int) or None, optional
+        Input sizes to generate, or None to use DEFAULT_SIZES.
+        The default is None.
+    repeats : int, optional
+        Number of times to run each part at each size, keeping the fastest time.
+        The default is 1.
+    seed : int, optional
+        Seed for the random number generator used to generate inputs.
+        The default is 0.
+    directory : str or None, optional
+        Directory to write generated inputs to, or None to use a temporary directory.
+        The default is None.
+
+    Returns
+    -------
+    results : list(dict)
+        One dictionary per part with the day, part, function, sizes, best wall times (None where
+        a run failed), errors and complexity fit as returned by fit_complexity.
+
+    """
+    sizes = sizes or DEFAULT_SIZES[day]
+    rng = np.random.default_rng(seed)
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = directory or tmp
+        # Generate every input up front so all parts run on identical inputs
+        inputs = []
+        for size in sizes:
+            inputs.append(os.path.join(directory, f'Day{day}_{size}.txt'))
+            with open(inputs[-1], 'w') as f:
+                f.write(GENERATORS[day](size, rng))
+
+        results = []
+        for _, part, name in runner.discover([day], parts):
+            times, errors = [], []
+            for input_file in inputs:
+                runs = [runner.run_part(day, part, name, input_file, track_memory=False) \
+                        for _ in range(repeats)]
+                errors.append(next((r['error'] for r in runs if r['error']), None))
+                times.append(None if errors[-1] else min(r['wall_time'] for r in runs))
+            ok = [i for i, t in enumerate(times) if t is not None]
+            results.append({'day': day, 'part': part, 'function': name, 'sizes': sizes,
+                            'times': times, 'errors': errors,
+                            'fit': fit_complexity([sizes[i] for i in ok], [times[i] for i in ok])})
+
+    return results
+
+def format_table(results: list) -> str:
+    """
+    Format a list of results from benchmark as a text table.
+
+    Parameters
+    ----------
+    results : list(dict)
+        Results as returned by benchmark.
+
+    Returns
+    -------
+    table : str
+        The formatted table.
+
+    """
+    lines = []
+    for r in results:
+        fit = r['fit']
+        summary = 'insufficient data' if fit['model'] is None else \
+            f"~n^{fit['exponent']:.2f}, best fit {fit['model']}"
+        lines.append(f"Day {r['day']} Part {r['part']}: {summary}")
+        for size, time, error in zip(r['sizes'], r['times'], r['errors']):
+            lines.append(f'    n = {size:<10} ' + (f'{time:.4f} s' if error is None else \
+                                                    f'ERROR {error}'))
+    return '\n'.join(lines)
+
+def main(argv: list=None) -> list:
+    """
+    Run the benchmark harness from the command line and print the results.
+
+    Parameters
+    ----------
+    argv : list(str) or None, optional
+        Command line arguments, or None to use sys.argv.
+        The default is None.
+
+    Returns
+    -------
+    results : list(dict)
+        Results as returned by benchmark, for every selected day.
+
+    """
+    parser = argparse.ArgumentParser(prog='python -m benchmark',
+                                     description='Benchmark the DayN_PartM solutions on '
+                                                 'synthetic inputs of increasing size.')
+    parser.add_argument('-d', '--days', type=int, nargs='+', default=list(GENERATORS),
+                        help='days to benchmark (default: all)')
+    parser.add_argument('-p', '--parts', type=int, nargs='+', choices=[1, 2],
+                        help='parts to benchmark (default: both)')
+    parser.add_argument('-s', '--sizes', type=int, nargs='+',
+                        help='input sizes to sweep (default: per-day defaults)')
+    parser.add_argument('-r', '--repeats', type=int, default=1,
+                        help='runs per size, keeping the fastest (default: 1)')
+    parser.add_argument('--seed', type=int, default=0, help='random seed (default: 0)')
+    parser.add_argument('--json', action='store_true', help='print results as JSON')
+    args = parser.parse_args(argv)
+
+    results = []
+    for day in args.days:
+        results += benchmark(day, args.parts, args.sizes, args.repeats, args.seed)
+
+    print(json.dumps(results, indent=2) if args.json else format_table(results))
+    return results
+
+if __name__ == '__main__':
+    main()
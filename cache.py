@@ -0,0 +1,275 @@
+"""
+Content-addressed on-disk cache of DayN_PartM results, keyed by a hash of the solution's source
+code, function name, arguments and input file contents, with size-bounded LRU eviction.
+"""
+import hashlib
+import json
+import os
+import re
+import tempfile
+
+# Directory containing the DayN modules
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+# Default cache location, following the XDG base directory convention
+DEFAULT_DIR = os.path.join(os.environ.get('XDG_CACHE_HOME', os.path.expanduser('~/.cache')),
+                           'advent-of-code-2021')
+
+# Digest of the source files of every module already hashed in this process, in the form
+# {module: bytes}, as the sources do not change while a run is in progress
+_source_digests = {}
+
+def module_sources(module: str) -> list:
+    """
+    Find the source files of a module and every local module it imports, directly or indirectly,
+    so that changing any of them invalidates the cached results.
+
+    Parameters
+    ----------
+    module : str
+        Name of a module in the repository, e.g. 'Day23'.
+
+    Returns
+    -------
+    paths : list(str)
+        Sorted list of paths to the source files.
+
+    """
+    paths, to_check = set(), [module]
+    while to_check:
+        path = os.path.join(ROOT, f'{to_check.pop()}.py')
+        if path in paths or not os.path.isfile(path):
+            continue
+        paths.add(path)
+        with open(path) as f:
+            to_check.extend(re.findall(r'^\s*(?:from|import)\s+(\w+)', f.read(), re.MULTILINE))
+
+    return sorted(paths)
+
+def source_digest(module: str) -> bytes:
+    """
+    Hash the source files of a module and every local module it imports, once per process.
+
+    Parameters
+    ----------
+    module : str
+        Name of a module in the repository, e.g. 'Day23'.
+
+    Returns
+    -------
+    digest : bytes
+        SHA-256 digest of the source files.
+
+    """
+    if module not in _source_digests:
+        digest = hashlib.sha256()
+        for path in module_sources(module):
+            with open(path, 'rb') as f:
+                digest.update(f.read())
+        _source_digests[module] = digest.digest()
+    return _source_digests[module]
+
+def make_key(module: str, name: str, args: tuple, input_file: str) -> str:
+    """
+    Hash everything that determines the result of a DayN_PartM function into a cache key. The
+    source digest is computed once per process, but the input file is hashed on every call, so
+    each lookup takes time proportional to the size of the input file.
+
+    Parameters
+    ----------
+    module : str
+        Name of the module containing the function.
+    name : str
+        Name of the function.
+    args : tuple
+        Additional positional arguments passed to the function before the input file.
+    input_file : str
+        Path to the input file.
+
+    Returns
+    -------
+    key : str
+        Hex digest identifying the result.
+
+    """
+    digest = hashlib.sha256(source_digest(module))
+    digest.update(f'\0{name}\0{args!r}\0'.encode())
+    with open(input_file, 'rb') as f:
+        digest.update(hashlib.file_digest(f, 'sha256').digest())
+    return digest.hexdigest()
+
+class ResultCache:
+    """
+    Class describing an on-disk cache of results, stored as one JSON file per entry. Entries are
+    evicted least recently used first, based on their modification times which are updated on
+    every hit, whenever the total size exceeds a limit. The total size is estimated from the
+    entries this object has written, so the directory is only scanned once the estimate exceeds
+    the limit, and other processes writing to the same directory can push it over the limit
+    until then.
+    """
+    def __init__(self, directory: str=DEFAULT_DIR, max_bytes: int=64*2**20) -> None:
+        """
+        Initialise the class with two parameters, the cache directory and its maximum size.
+
+        Parameters
+        ----------
+        directory : str, optional
+            Directory to store the cache entries in, created if it does not exist.
+            The default is DEFAULT_DIR.
+        max_bytes : int, optional
+            Maximum total size of the cache entries in bytes.
+            The default is 64 MiB.
+
+        Returns
+        -------
+        None.
+
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        # Estimated total size of the entries, found by scanning the directory on the first put
+        self.size = None
+        os.makedirs(directory, exist_ok=True)
+
+    def __repr__(self) -> str:
+        """
+        Return the representation of a ResultCache object.
+
+        Returns
+        -------
+        repr : str
+            Representation.
+
+        """
+        return f'{self.__class__.__name__}({self.directory!r}, max_bytes={self.max_bytes})'
+
+    def path(self, key: str) -> str:
+        """
+        Return the path of the file storing a cache entry.
+
+        Parameters
+        ----------
+        key : str
+            Cache key.
+
+        Returns
+        -------
+        path : str
+            Path to the entry file.
+
+        """
+        return os.path.join(self.directory, f'{key}.json')
+
+    def get(self, key: str):
+        """
+        Look up a cache entry, marking it as recently used.
+
+        Parameters
+        ----------
+        key : str
+            Cache key.
+
+        Returns
+        -------
+        entry : any or None
+            The cached entry, or None if there is no entry for the key.
+
+        """
+        path = self.path(key)
+        try:
+            with open(path) as f:
+                entry = json.load(f)
+            os.utime(path)
+        except (OSError, ValueError):
+            # Missing, evicted by another process or corrupt entries are all misses
+            return None
+        return entry
+
+    def put(self, key: str, entry) -> None:
+        """
+        Store a cache entry, evicting the least recently used entries if the cache is full.
+
+        Parameters
+        ----------
+        key : str
+            Cache key.
+        entry : any
+            JSON serialisable entry to store.
+
+        Returns
+        -------
+        None.
+
+        """
+        # Write to a temporary file and move it into place, so concurrent readers never see a
+        # partially written entry
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(entry, f)
+            size = os.path.getsize(tmp_path)
+            try:
+                replaced = os.path.getsize(self.path(key))
+            except OSError:
+                replaced = 0
+            os.replace(tmp_path, self.path(key))
+        except BaseException:
+            # Never leave partially written entries behind
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+
+        if self.size is None:
+            self.evict()
+        else:
+            self.size += size - replaced
+            if self.size > self.max_bytes:
+                self.evict()
+
+    def evict(self) -> None:
+        """
+        Remove the least recently used entries until the cache is within its size limit, scanning
+        the whole directory, and reset the estimated total size.
+
+        Returns
+        -------
+        None.
+
+        """
+        entries = []
+        with os.scandir(self.directory) as it:
+            for e in it:
+                if e.name.endswith('.json'):
+                    try:
+                        stat = e.stat()
+                    except OSError:
+                        continue
+                    entries.append((stat.st_mtime, stat.st_size, e.path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            total -= size
+        self.size = total
+
+    def clear(self) -> None:
+        """
+        Remove every entry from the cache.
+
+        Returns
+        -------
+        None.
+
+        """
+        with os.scandir(self.directory) as it:
+            for e in it:
+                if e.name.endswith('.json'):
+                    os.remove(e.path)
+        self.size = 0
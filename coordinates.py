@@ -0,0 +1,187 @@
+class Coordinates(tuple):
+    """
+    Class to define an immutable set of coordinates (x, y) or (x, y, z), shared by all of the
+    grid and point based puzzles. Subclassing tuple with no instance dictionary keeps each point
+    as small as a plain tuple, with hashing and equality done by tuple itself, so a point can be
+    used interchangeably with a tuple of the same values as a dictionary key.
+
+    Coordinates are created from any iterable of integers, e.g. Coordinates([x, y]), in the same
+    way as a tuple. NumPy arrays should be converted with tolist() first, so that components are
+    plain Python integers which are faster to hash.
+    """
+    __slots__ = ()
+
+    def __repr__(self):
+        """
+        Return the representation of a Coordinates object.
+
+        Returns
+        -------
+        str
+            Representation.
+
+        """
+        return f"{self.__class__.__name__}({', '.join(str(i) for i in self)})"
+
+    def __getnewargs__(self):
+        """
+        Return the arguments needed to recreate the Coordinates when unpickling.
+
+        Returns
+        -------
+        tuple
+            Arguments to pass to __new__.
+
+        """
+        return (tuple(self),)
+
+    @property
+    def x(self):
+        """
+        int : The 'x' component of the Coordinates.
+        """
+        return self[0]
+
+    @property
+    def y(self):
+        """
+        int : The 'y' component of the Coordinates.
+        """
+        return self[1]
+
+    @property
+    def z(self):
+        """
+        int : The 'z' component of the Coordinates, only defined for 3D Coordinates.
+        """
+        return self[2]
+
+    def __add__(self, other):
+        """
+        Overrides the + operator to add two sets of Coordinates component-wise.
+
+        Parameters
+        ----------
+        other : Coordinates or sequence of int
+            The Coordinates to add, with the same number of dimensions.
+
+        Raises
+        ------
+        ValueError
+            If the Coordinates have different numbers of dimensions.
+
+        Returns
+        -------
+        Coordinates
+            The sum of the two Coordinates.
+
+        """
+        return self.__class__([a + b for a, b in zip(self, other, strict=True)])
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        """
+        Overrides the - operator to subtract two sets of Coordinates component-wise.
+
+        Parameters
+        ----------
+        other : Coordinates or sequence of int
+            The Coordinates to subtract, with the same number of dimensions.
+
+        Raises
+        ------
+        ValueError
+            If the Coordinates have different numbers of dimensions.
+
+        Returns
+        -------
+        Coordinates
+            The difference of the two Coordinates.
+
+        """
+        return self.__class__([a - b for a, b in zip(self, other, strict=True)])
+
+    def __rsub__(self, other):
+        """
+        Overrides the - operator when the Coordinates are on the right hand side.
+
+        Parameters
+        ----------
+        other : sequence of int
+            The Coordinates being subtracted from, with the same number of dimensions.
+
+        Raises
+        ------
+        ValueError
+            If the Coordinates have different numbers of dimensions.
+
+        Returns
+        -------
+        Coordinates
+            The difference of the two Coordinates.
+
+        """
+        return self.__class__([b - a for a, b in zip(self, other, strict=True)])
+
+    def __mul__(self, scale):
+        """
+        Overrides the * operator to scale the Coordinates by an integer.
+
+        Parameters
+        ----------
+        scale : int
+            Factor to multiply every component by.
+
+        Returns
+        -------
+        Coordinates
+            The scaled Coordinates.
+
+        """
+        return self.__class__([a*scale for a in self])
+
+    __rmul__ = __mul__
+
+    def __neg__(self):
+        """
+        Overrides the unary - operator to negate every component.
+
+        Returns
+        -------
+        Coordinates
+            The negated Coordinates.
+
+        """
+        return self.__class__([-a for a in self])
+
+    def __pos__(self):
+        """
+        Return the Coordinates, which being immutable never need to be copied.
+        """
+        return self
+
+    def manhattan(self, other=None):
+        """
+        Calculate the Manhattan distance to another set of Coordinates, or to the origin.
+
+        Parameters
+        ----------
+        other : Coordinates or sequence of int or None, optional
+            The Coordinates to measure the distance to, or None to use the origin.
+            The default is None.
+
+        Raises
+        ------
+        ValueError
+            If the Coordinates have different numbers of dimensions.
+
+        Returns
+        -------
+        int
+            The Manhattan distance.
+
+        """
+        if other is None:
+            return sum(abs(a) for a in self)
+        return sum(abs(a - b) for a, b in zip(self, other, strict=True))
@@ -0,0 +1,239 @@
+"""
+Parallel executor for the DayN_PartM solutions, running each day in its own worker process so a
+full run takes roughly as long as the slowest day rather than the sum of all of them.
+
+Usage: python -m executor [-d DAY [DAY ...]] [-p PART [PART ...]] [--input-dir DIR]
+                          [-w WORKERS] [--timeout SECONDS] [--json] [--memory]
+                          [--no-cache] [--refresh] [--cache-dir DIR] [--log FILE]
+                          [--profile DIR]
+"""
+import argparse
+import concurrent.futures
+import glob
+import json
+import os
+import sys
+import cache as result_cache
+import runner
+
+def day_inputs(day: int, input_dir: str='Inputs') -> list:
+    """
+    Find every input file for a given day in a directory, i.e. every file named DayN_*.txt, so a
+    whole corpus of inputs for that day can be run in one go.
+
+    Parameters
+    ----------
+    day : int
+        Day number.
+    input_dir : str, optional
+        Directory containing the input files.
+        The default is 'Inputs'.
+
+    Returns
+    -------
+    input_files : list(str)
+        Sorted list of paths to the input files for the day.
+
+    """
+    return sorted(glob.glob(os.path.join(input_dir, f'Day{day}_*.txt')))
+
+def run_day(day: int, tasks: list, input_files: list, timeout: float=None,
+            track_memory: bool=False, cache_dir: str=None, refresh: bool=False,
+            log_file: str=None, profile_dir: str=None) -> list:
+    """
+    Run every selected part of a single day on every one of its input files, in the calling
+    process. This is the unit of work handed to each worker process.
+
+    Parameters
+    ----------
+    day : int
+        Day number.
+    tasks : list(tuple(int, str))
+        List of (part, function_name) to run, as found by runner.discover.
+    input_files : list(str)
+        Paths to the input files to run every part on.
+    timeout : float or None, optional
+        Time limit in seconds for each part on each input, or None for no limit.
+        The default is None.
+    track_memory : bool, optional
+        Whether or not to trace memory allocations to find the peak memory.
+        The default is False.
+    cache_dir : str or None, optional
+        Directory of the result cache to use, or None to always run the functions.
+        The default is None.
+    refresh : bool, optional
+        Whether or not to run the functions even if their answers are cached.
+        The default is False.
+    log_file : str or None, optional
+        Path to a JSON Lines file to append a summary of each instrumented run to, or None.
+        The default is None.
+    profile_dir : str or None, optional
+        Directory to dump cProfile statistics of each run to, or None.
+        The default is None.
+
+    Returns
+    -------
+    results : list(dict)
+        Results as returned by runner.run_part, ordered by part then input file.
+
+    """
+    # Worker processes may not share the parent's working directory or sys.path
+    if runner.ROOT not in sys.path:
+        sys.path.insert(0, runner.ROOT)
+
+    cache = None if cache_dir is None else result_cache.ResultCache(cache_dir)
+    return [runner.run_part(day, part, name, input_file, track_memory, timeout=timeout,
+                            cache=cache, refresh=refresh, log_file=log_file,
+                            profile_dir=profile_dir) \
+            for part, name in tasks for input_file in input_files]
+
+def execute(days: list=None, parts: list=None, input_dir: str='Inputs', workers: int=None,
+            timeout: float=None, track_memory: bool=False, cache_dir: str=None,
+            refresh: bool=False, log_file: str=None, profile_dir: str=None) -> list:
+    """
+    Run the selected DayN_PartM functions across a pool of worker processes, with one task per
+    day covering all of its parts and input files. Days without any input files are run on their
+    default input file, so a missing file is reported as an error rather than silently skipped.
+
+    Parameters
+    ----------
+    days : list(int) or None, optional
+        Days to run, or None to run every day.
+        The default is None.
+    parts : list(int) or None, optional
+        Parts to run, or None to run both.
+        The default is None.
+    input_dir : str, optional
+        Directory containing the input files, named DayN_*.txt.
+        The default is 'Inputs'.
+    workers : int or None, optional
+        Maximum number of worker processes, or None to use one per CPU.
+        The default is None.
+    timeout : float or None, optional
+        Time limit in seconds for each part on each input, or None for no limit.
+        The default is None.
+    track_memory : bool, optional
+        Whether or not to trace memory allocations to find the peak memory.
+        The default is False.
+    cache_dir : str or None, optional
+        Directory of the result cache to use, or None to always run the functions.
+        The default is None.
+    refresh : bool, optional
+        Whether or not to run the functions even if their answers are cached.
+        The default is False.
+    log_file : str or None, optional
+        Path to a JSON Lines file to append a summary of each instrumented run to, or None.
+        The default is None.
+    profile_dir : str or None, optional
+        Directory to dump cProfile statistics of each run to, or None.
+        The default is None.
+
+    Returns
+    -------
+    results : list(dict)
+        Results as returned by runner.run_part, ordered by day, part and input file regardless of
+        the order in which the workers finish.
+
+    """
+    # Group the selected parts by day
+    tasks = {}
+    for day, part, name in runner.discover(days, parts):
+        tasks.setdefault(day, []).append((part, name))
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as pool:
+        # Submit one task per day, with every input file for that day handled by the same worker
+        futures = [pool.submit(run_day, day, day_tasks,
+                               day_inputs(day, input_dir) or [runner.default_input(day, input_dir)],
+                               timeout, track_memory, cache_dir, refresh, log_file,
+                               profile_dir) \
+                   for day, day_tasks in tasks.items()]
+        # Collect in submission order to keep the results ordered
+        results = []
+        for (day, day_tasks), future in zip(tasks.items(), futures):
+            try:
+                results.extend(future.result())
+            except Exception as e:
+                # The worker itself failed, e.g. it was killed, so record an error for every part
+                results.extend({'day': day, 'part': part, 'function': name, 'input': input_dir,
+                                'answer': None, 'wall_time': None, 'cpu_time': None,
+                                'peak_memory': None, 'error': repr(e), 'cached': False,
+                                'counters': None} \
+                               for part, name in day_tasks)
+
+    return results
+
+def parse_args(argv: list=None) -> argparse.Namespace:
+    """
+    Parse the command line arguments of the executor.
+
+    Parameters
+    ----------
+    argv : list(str) or None, optional
+        Arguments to parse, or None to use sys.argv.
+        The default is None.
+
+    Returns
+    -------
+    args : argparse.Namespace
+        Parsed arguments.
+
+    """
+    parser = argparse.ArgumentParser(prog='python -m executor',
+                                     description='Run the DayN_PartM solutions in parallel, one '
+                                                 'worker process per day.')
+    parser.add_argument('-d', '--days', type=int, nargs='+', help='days to run (default: all)')
+    parser.add_argument('-p', '--parts', type=int, nargs='+', choices=[1, 2],
+                        help='parts to run (default: both)')
+    parser.add_argument('--input-dir', default='Inputs',
+                        help='directory containing the DayN_*.txt input files (default: Inputs)')
+    parser.add_argument('-w', '--workers', type=int,
+                        help='number of worker processes (default: one per CPU)')
+    parser.add_argument('--timeout', type=float,
+                        help='time limit in seconds for each part on each input (default: none)')
+    parser.add_argument('--json', action='store_true', help='print results as JSON')
+    parser.add_argument('--memory', action='store_true',
+                        help='trace peak memory, which slows down the solutions')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='do not look up or store answers in the result cache')
+    parser.add_argument('--refresh', action='store_true',
+                        help='rerun every part and overwrite its cached answer')
+    parser.add_argument('--cache-dir', default=result_cache.DEFAULT_DIR,
+                        help=f'directory of the result cache (default: {result_cache.DEFAULT_DIR})')
+    parser.add_argument('--log', metavar='FILE',
+                        help='instrument the solutions, appending the spans and counters of each '
+                             'run to a JSON Lines file (cached parts are not rerun unless '
+                             '--refresh is given)')
+    parser.add_argument('--profile', metavar='DIR',
+                        help='instrument and profile the solutions, dumping pstats files to DIR')
+    return parser.parse_args(argv)
+
+def main(argv: list=None) -> list:
+    """
+    Run the selected DayN_PartM functions in parallel and print the results.
+
+    Parameters
+    ----------
+    argv : list(str) or None, optional
+        Command line arguments, or None to use sys.argv.
+        The default is None.
+
+    Returns
+    -------
+    results : list(dict)
+        Results as returned by runner.run_part.
+
+    """
+    args = parse_args(argv)
+    results = execute(args.days, args.parts, args.input_dir, args.workers, args.timeout,
+                      args.memory, None if args.no_cache else args.cache_dir, args.refresh,
+                      args.log, args.profile)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print(runner.format_table(results))
+
+    return results
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,292 @@
+import numpy as np
+
+# Neighbour offsets (row, column) for 4- and 8-connectivity, in row-major order
+OFFSETS = {4: ((-1, 0), (0, -1), (0, 1), (1, 0)),
+           8: ((-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1))}
+
+class Grid:
+    """
+    Class describing a dense 2D grid of values, stored as a NumPy array surrounded by a border of
+    padding cells. The padding lets the neighbours of every cell be read as shifted views of the
+    array, without bounds checks or copying, and acts as a sentinel for searches over the grid.
+    """
+    def __init__(self, values, pad: int=1, fill=0, dtype=None) -> None:
+        """
+        Initialise the class with up to four parameters, the values in the grid and how to pad it.
+
+        Parameters
+        ----------
+        values : array_like
+            2D array of values in the form values[row][column].
+        pad : int, optional
+            Width of the border of padding cells on every side.
+            The default is 1.
+        fill : scalar, optional
+            Value of the padding cells.
+            The default is 0.
+        dtype : data-type or None, optional
+            Data type of the grid, or None to infer it from the values.
+            The default is None.
+
+        Returns
+        -------
+        None.
+
+        """
+        values = np.asarray(values, dtype=dtype)
+        if values.ndim != 2:
+            raise ValueError(f'Grid values must be 2D, not {values.ndim}D')
+        self.pad = pad
+        self.fill = fill
+        self.data = np.pad(values, pad, constant_values=fill)
+
+    @classmethod
+    def from_lines(cls, lines: list, symbols: str, pad: int=1, fill=0):
+        """
+        Create a grid from lines of text, where each character is one of a set of symbols and the
+        value of a cell is the index of its symbol, e.g. symbols='.#' gives 0 for '.' and 1 for
+        '#'.
+
+        Parameters
+        ----------
+        lines : list(str)
+            Lines of the grid, all of the same length.
+        symbols : str
+            Symbols which may appear in the grid, in order of value.
+        pad : int, optional
+            Width of the border of padding cells on every side.
+            The default is 1.
+        fill : int, optional
+            Value of the padding cells.
+            The default is 0.
+
+        Returns
+        -------
+        grid : Grid
+            The grid of symbol indices, as unsigned 8-bit integers.
+
+        """
+        # Look up every byte in a table mapping each symbol to its index
+        table = np.zeros(256, dtype=np.uint8)
+        table[np.frombuffer(symbols.encode(), dtype=np.uint8)] = np.arange(len(symbols))
+        codes = table[np.frombuffer(''.join(lines).encode(), dtype=np.uint8)]
+        return cls(codes.reshape(len(lines), -1), pad, fill)
+
+    def __repr__(self) -> str:
+        """
+        Return the representation of a Grid object.
+
+        Returns
+        -------
+        repr : str
+            Representation.
+
+        """
+        return f'{self.__class__.__name__}(shape={self.shape}, pad={self.pad}, fill={self.fill!r})'
+
+    @property
+    def shape(self) -> tuple:
+        """
+        tuple(int) : Shape of the grid in the form (rows, columns), excluding padding.
+        """
+        return tuple(n - 2*self.pad for n in self.data.shape)
+
+    @property
+    def values(self) -> np.ndarray:
+        """
+        np.ndarray : Writable view of the grid values, excluding padding.
+        """
+        return self.shifted(0, 0)
+
+    def shifted(self, dr: int, dc: int) -> np.ndarray:
+        """
+        Return a view of the grid shifted by a given offset, so that element [r, c] of the view
+        is the value of the cell at [r+dr, c+dc], or the padding if that is outside the grid.
+
+        Parameters
+        ----------
+        dr : int
+            Row offset, at most the padding width in magnitude.
+        dc : int
+            Column offset, at most the padding width in magnitude.
+
+        Raises
+        ------
+        ValueError
+            If the offset reaches beyond the padding.
+
+        Returns
+        -------
+        view : np.ndarray
+            View of the padded array with the same shape as the grid.
+
+        """
+        if abs(dr) > self.pad or abs(dc) > self.pad:
+            raise ValueError(f'Offset ({dr}, {dc}) is larger than the padding of {self.pad}')
+        rows, columns = self.shape
+        return self.data[self.pad+dr:self.pad+dr+rows, self.pad+dc:self.pad+dc+columns]
+
+    def neighbours(self, connectivity: int=4) -> list:
+        """
+        Return views of the neighbouring values of every cell, one per neighbour direction.
+
+        Parameters
+        ----------
+        connectivity : int, optional
+            Either 4 to include only orthogonal neighbours, or 8 to include diagonal ones too.
+            The default is 4.
+
+        Returns
+        -------
+        views : list(np.ndarray)
+            Shifted views of the grid, in the order given by OFFSETS[connectivity].
+
+        """
+        return [self.shifted(dr, dc) for dr, dc in OFFSETS[connectivity]]
+
+    def count_neighbours(self, connectivity: int=4) -> np.ndarray:
+        """
+        Sum the values of the neighbours of every cell, e.g. to count the neighbours for which a
+        boolean grid is True.
+
+        Parameters
+        ----------
+        connectivity : int, optional
+            Either 4 to include only orthogonal neighbours, or 8 to include diagonal ones too.
+            The default is 4.
+
+        Returns
+        -------
+        counts : np.ndarray(int)
+            Sum of the neighbouring values of every cell, with the same shape as the grid.
+
+        """
+        return sum(view.astype(np.int64) for view in self.neighbours(connectivity))
+
+    def rolled(self, dr: int, dc: int) -> np.ndarray:
+        """
+        Return the grid values shifted by a given offset with wrap-around, so that element [r, c]
+        of the result is the value of the cell at [(r+dr) % rows, (c+dc) % columns]. This treats
+        the grid as a torus, ignoring the padding.
+
+        Parameters
+        ----------
+        dr : int
+            Row offset.
+        dc : int
+            Column offset.
+
+        Returns
+        -------
+        rolled : np.ndarray
+            Copy of the grid values, rolled by the offset.
+
+        """
+        return np.roll(self.values, (-dr, -dc), axis=(0, 1))
+
+    def flat_index(self, row: int, column: int) -> int:
+        """
+        Return the index of a cell in the flattened padded array, data.ravel().
+
+        Parameters
+        ----------
+        row : int
+            Row of the cell, excluding padding.
+        column : int
+            Column of the cell, excluding padding.
+
+        Returns
+        -------
+        index : int
+            Index into the flattened padded array.
+
+        """
+        return (row + self.pad)*self.data.shape[1] + column + self.pad
+
+    def flat_offsets(self, connectivity: int=4) -> list:
+        """
+        Return the differences in flat index between a cell and each of its neighbours, for
+        walking the flattened padded array in graph searches. Neighbours of edge cells are
+        padding cells, so no bounds checks are needed as long as the padding is never entered.
+
+        Parameters
+        ----------
+        connectivity : int, optional
+            Either 4 to include only orthogonal neighbours, or 8 to include diagonal ones too.
+            The default is 4.
+
+        Returns
+        -------
+        offsets : list(int)
+            Flat index offsets, in the order given by OFFSETS[connectivity].
+
+        """
+        return [dr*self.data.shape[1] + dc for dr, dc in OFFSETS[connectivity]]
+
+    def label_regions(self, mask: np.ndarray, connectivity: int=4) -> np.ndarray:
+        """
+        Label the connected regions of cells for which a mask is True. Uses a vectorised
+        union-find, hooking the root of every connected pair of cells onto the smaller of the two
+        roots and then compressing paths by pointer jumping, until no roots change.
+
+        Parameters
+        ----------
+        mask : np.ndarray(bool)
+            Cells to include in the regions, with the same shape as the grid.
+        connectivity : int, optional
+            Either 4 to connect only orthogonal neighbours, or 8 to connect diagonal ones too.
+            The default is 4.
+
+        Returns
+        -------
+        labels : np.ndarray(int)
+            Label of the region containing each cell, as the flat index of one of the cells in
+            that region, or -1 for cells outside the mask.
+
+        """
+        mask = np.asarray(mask, dtype=bool)
+        rows, columns = mask.shape
+        parent = np.arange(rows*columns).reshape(rows, columns)
+        # Collect every pair of connected cells, considering each pair once
+        pairs = []
+        for dr, dc in OFFSETS[connectivity][len(OFFSETS[connectivity])//2:]:
+            here = (slice(0, rows - dr), slice(max(0, -dc), columns - max(0, dc)))
+            there = (slice(dr, rows), slice(max(0, dc), columns - max(0, -dc)))
+            connected = mask[here] & mask[there]
+            pairs.append((parent[here][connected], parent[there][connected]))
+        first = np.concatenate([p[0] for p in pairs])
+        second = np.concatenate([p[1] for p in pairs])
+
+        parent = parent.ravel()
+        while True:
+            # Hook the larger root of every pair onto the smaller one
+            root_first, root_second = parent[first], parent[second]
+            unequal = root_first != root_second
+            if not unequal.any():
+                break
+            low = np.minimum(root_first[unequal], root_second[unequal])
+            high = np.maximum(root_first[unequal], root_second[unequal])
+            np.minimum.at(parent, high, low)
+            # Compress paths until every cell points directly at its root
+            while not np.array_equal(grandparent := parent[parent], parent):
+                parent = grandparent
+
+        return np.where(mask, parent.reshape(rows, columns), -1)
+
+    def to_lines(self, symbols: str) -> list:
+        """
+        Convert the grid to lines of text, replacing each value with the symbol at that index.
+
+        Parameters
+        ----------
+        symbols : str
+            Symbols for each value, in order of value.
+
+        Returns
+        -------
+        lines : list(str)
+            Lines of the grid, excluding padding.
+
+        """
+        table = np.array(list(symbols))
+        return [''.join(row) for row in table[self.values]]
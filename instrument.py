@@ -0,0 +1,183 @@
+"""
+Opt-in instrumentation for the DayN_PartM solutions. Solutions mark phases of work with named
+spans and count events in their hot paths, which are recorded only while a session is active,
+so the calls cost next to nothing otherwise. Each session can also profile the code it runs with
+cProfile, and writes a summary as one JSON object per line to a structured log.
+
+Usage:
+    with instrument.span('parse'):
+        data = get_input(input_file)
+    instrument.count('nodes_expanded')
+"""
+import contextlib
+import cProfile
+import datetime
+import json
+import os
+import time
+
+# Currently active session, or None when instrumentation is disabled
+_session = None
+
+class Session:
+    """
+    Class describing a single instrumented run, accumulating the time spent in every named span
+    and the total of every counter.
+    """
+    def __init__(self, name: str) -> None:
+        """
+        Initialise the class with one parameter, the name of the run.
+
+        Parameters
+        ----------
+        name : str
+            Name of the run, e.g. the function being run.
+
+        Returns
+        -------
+        None.
+
+        """
+        self.name = name
+        # Spans in the form {path: {'calls': int, 'wall_time': float, 'cpu_time': float}}, where
+        # the path of a nested span includes the names of the spans enclosing it, e.g. solve/search
+        self.spans = {}
+        self.counters = {}
+        self.stack = []
+
+    def __repr__(self) -> str:
+        """
+        Return the representation of a Session object.
+
+        Returns
+        -------
+        repr : str
+            Representation.
+
+        """
+        return f'{self.__class__.__name__}({self.name!r}, spans={len(self.spans)}, ' \
+               f'counters={self.counters})'
+
+    def to_dict(self) -> dict:
+        """
+        Return the spans and counters of the session as a JSON serialisable dictionary.
+
+        Returns
+        -------
+        summary : dict
+            Dictionary of the name, spans and counters of the session.
+
+        """
+        return {'name': self.name, 'spans': self.spans, 'counters': self.counters}
+
+def enabled() -> bool:
+    """
+    Return whether a session is active, for solutions which want to skip gathering expensive
+    statistics when nobody is recording them.
+
+    Returns
+    -------
+    bool
+        Whether instrumentation is enabled.
+
+    """
+    return _session is not None
+
+def count(name: str, n: int=1) -> None:
+    """
+    Add to a named counter in the active session, if there is one. Hot loops should count
+    locally and call this once with the total.
+
+    Parameters
+    ----------
+    name : str
+        Name of the counter.
+    n : int, optional
+        Amount to add to the counter.
+        The default is 1.
+
+    Returns
+    -------
+    None.
+
+    """
+    if _session is not None:
+        _session.counters[name] = _session.counters.get(name, 0) + n
+
+@contextlib.contextmanager
+def span(name: str):
+    """
+    Context manager recording the wall time and CPU time spent in the enclosed block under a
+    given name in the active session, if there is one.
+
+    Parameters
+    ----------
+    name : str
+        Name of the span, e.g. 'parse', 'solve' or 'output'.
+
+    """
+    session = _session
+    if session is None:
+        yield
+        return
+
+    session.stack.append(name)
+    path = '/'.join(session.stack)
+    wall, cpu = time.perf_counter(), time.process_time()
+    try:
+        yield
+    finally:
+        record = session.spans.setdefault(path, {'calls': 0, 'wall_time': 0.0, 'cpu_time': 0.0})
+        record['calls'] += 1
+        record['wall_time'] += time.perf_counter() - wall
+        record['cpu_time'] += time.process_time() - cpu
+        session.stack.pop()
+
+@contextlib.contextmanager
+def session(name: str, log_file: str=None, profile_file: str=None, **fields):
+    """
+    Context manager enabling instrumentation for the enclosed block, optionally profiling it, and
+    appending a summary of the spans and counters recorded to a structured log on exit.
+
+    Parameters
+    ----------
+    name : str
+        Name of the run.
+    log_file : str or None, optional
+        Path to a JSON Lines file to append the summary to, or None to not write one.
+        The default is None.
+    profile_file : str or None, optional
+        Path to dump cProfile statistics to, readable with pstats.Stats, or None to not profile.
+        The default is None.
+    **fields
+        Additional JSON serialisable fields to include in the summary, e.g. the input file.
+
+    Yields
+    ------
+    session : Session
+        The active session, whose spans and counters are complete once the block exits.
+
+    """
+    global _session
+    previous, _session = _session, Session(name)
+    current = _session
+    profiler = cProfile.Profile() if profile_file else None
+    started = datetime.datetime.now(datetime.timezone.utc).isoformat()
+    try:
+        with span('total'):
+            if profiler:
+                profiler.enable()
+            try:
+                yield current
+            finally:
+                if profiler:
+                    profiler.disable()
+    finally:
+        _session = previous
+        if profiler:
+            os.makedirs(os.path.dirname(os.path.abspath(profile_file)), exist_ok=True)
+            profiler.dump_stats(profile_file)
+        if log_file:
+            record = {'started': started, **fields, **current.to_dict(), 'profile': profile_file}
+            with open(log_file, 'a') as f:
+                f.write(json.dumps(record) + '\n')
@@ -0,0 +1,223 @@
+import os
+import re
+import numpy as np
+
+def is_filename(input_file) -> bool:
+    """
+    Determine whether a given input refers to a file on disk, rather than data which has already
+    been parsed from one.
+
+    Parameters
+    ----------
+    input_file : str, bytes, os.PathLike or any
+        Input to check.
+
+    Returns
+    -------
+    bool
+        Whether the input is a path to an input file.
+
+    """
+    return isinstance(input_file, (str, bytes, os.PathLike))
+
+def load(input_file, reader, **kwargs):
+    """
+    Parse an input file with the given reader, or pass the input straight through if it has
+    already been parsed. This allows every DayN_PartM function to accept either a filename or
+    the output of the corresponding reader.
+
+    Parameters
+    ----------
+    input_file : str or any
+        Path to input file, or the already-parsed contents of one.
+    reader : func
+        Function used to parse the input file, called as reader(input_file, **kwargs).
+    **kwargs
+        Additional keyword arguments passed to the reader.
+
+    Returns
+    -------
+    data : any
+        The parsed contents of the input file.
+
+    """
+    if is_filename(input_file):
+        return reader(input_file, **kwargs)
+    return input_file
+
+def read_text(input_file: str) -> str:
+    """
+    Read the entire contents of an input file in a single call.
+
+    Parameters
+    ----------
+    input_file : str
+        Path to input file.
+
+    Returns
+    -------
+    text : str
+        Contents of the input file.
+
+    """
+    with open(input_file) as f:
+        text = f.read()
+    return text
+
+def read_lines(input_file: str) -> list:
+    """
+    Parse an input file into a list of its non-empty lines, with surrounding whitespace removed.
+
+    Parameters
+    ----------
+    input_file : str
+        Path to input file.
+
+    Returns
+    -------
+    lines : list(str)
+        List of non-empty lines in the input file.
+
+    """
+    return [stripped for line in read_text(input_file).split('\n') if (stripped := line.strip())]
+
+def read_tokens(input_file: str) -> list:
+    """
+    Parse an input file into a list of its non-empty lines, with each line split on whitespace.
+
+    Parameters
+    ----------
+    input_file : str
+        Path to input file.
+
+    Returns
+    -------
+    tokens : list(list(str))
+        List of the whitespace-separated tokens on each non-empty line of the input file.
+
+    """
+    return [tokens for line in read_text(input_file).split('\n') if (tokens := line.split())]
+
+def read_ints(input_file: str) -> np.ndarray:
+    """
+    Parse an input file containing a whitespace-separated list of integers, usually one per line.
+
+    Parameters
+    ----------
+    input_file : str
+        Path to input file.
+
+    Returns
+    -------
+    ints : np.ndarray(int)
+        1D array of integers in the input file.
+
+    """
+    return np.array(read_text(input_file).split(), dtype=np.int64)
+
+def read_comma_ints(input_file: str) -> np.ndarray:
+    """
+    Parse an input file containing a comma-separated list of integers.
+
+    Parameters
+    ----------
+    input_file : str
+        Path to input file.
+
+    Returns
+    -------
+    ints : np.ndarray(int)
+        1D array of integers in the input file.
+
+    """
+    return np.array(read_text(input_file).replace(',', ' ').split(), dtype=np.int64)
+
+def read_int_table(input_file: str) -> np.ndarray:
+    """
+    Parse an input file where every non-empty line contains the same number of integers,
+    separated by any other characters, e.g. '0,9 -> 5,9'.
+
+    Parameters
+    ----------
+    input_file : str
+        Path to input file.
+
+    Returns
+    -------
+    table : np.ndarray(int)
+        2D array of integers with one row per non-empty line of the input file.
+
+    """
+    text = read_text(input_file)
+    num_lines = sum(1 for line in text.split('\n') if line.strip())
+    return np.array(re.findall(r'-?\d+', text), dtype=np.int64).reshape(num_lines, -1)
+
+def read_digit_grid(input_file: str) -> np.ndarray:
+    """
+    Parse an input file containing a rectangular grid of single digits, e.g. a heightmap.
+
+    Parameters
+    ----------
+    input_file : str
+        Path to input file.
+
+    Returns
+    -------
+    grid : np.ndarray(np.uint8)
+        2D array of digits in the form grid[row][column].
+
+    """
+    with open(input_file, 'rb') as f:
+        rows = f.read().split()
+    grid = np.frombuffer(b''.join(rows), dtype=np.uint8) - ord('0')
+    return grid.reshape(len(rows), -1)
+
+def read_sections(input_file: str) -> list:
+    """
+    Parse an input file made up of sections separated by blank lines.
+
+    Parameters
+    ----------
+    input_file : str
+        Path to input file.
+
+    Returns
+    -------
+    sections : list(list(str))
+        List of sections, each given as a list of its lines with surrounding whitespace removed.
+
+    """
+    text = read_text(input_file).strip()
+    return [[line.strip() for line in section.strip().split('\n')] \
+            for section in re.split(r'\n\s*\n', text) if section.strip()]
+
+def iter_int_chunks(input_file: str, chunk_size: int=2**20):
+    """
+    Lazily parse an input file containing a whitespace-separated list of integers in chunks,
+    so that arbitrarily long inputs can be processed in constant memory.
+
+    Parameters
+    ----------
+    input_file : str
+        Path to input file.
+    chunk_size : int, optional
+        Number of bytes to read from the file at a time.
+        The default is 2**20.
+
+    Yields
+    ------
+    ints : np.ndarray(int)
+        1D array of the integers in the next chunk of the file, which may be empty.
+
+    """
+    remainder = b''
+    with open(input_file, 'rb') as f:
+        while block := f.read(chunk_size):
+            block = remainder + block
+            # Hold back any integer which may continue into the next block
+            cut = max(block.rfind(b'\n'), block.rfind(b' '), block.rfind(b'\t'),
+                      block.rfind(b'\r'))
+            block, remainder = block[:cut+1], block[cut+1:]
+            yield np.array(block.split(), dtype=np.int64)
+    if remainder.strip():
+        yield np.array(remainder.split(), dtype=np.int64)
@@ -0,0 +1,386 @@
+"""
+Command line runner for the DayN_PartM solutions, reporting the answer, wall time, CPU time and
+peak memory of every part run.
+
+Usage: python -m runner [-d DAY [DAY ...]] [-p PART [PART ...]] [-i FILE [FILE ...]]
+                        [--input-dir DIR] [--json] [--no-memory] [--show-output]
+                        [--timeout SECONDS] [--no-cache] [--refresh] [--cache-dir DIR]
+                        [--log FILE] [--profile DIR]
+"""
+import argparse
+import contextlib
+import glob
+import importlib
+import io
+import json
+import os
+import re
+import signal
+import sys
+import threading
+import time
+import tracemalloc
+import numpy as np
+import cache as result_cache
+import instrument
+
+# Directory containing the DayN modules
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+# Additional positional arguments required by certain parts, in the form {(day, part): args}
+PUZZLE_ARGS = {(6, 1): (80,), (6, 2): (256,),
+               (11, 1): (100,),
+               (14, 1): (10,), (14, 2): (40,),
+               (20, 1): (2,), (20, 2): (50,)}
+
+def discover(days: list=None, parts: list=None) -> list:
+    """
+    Find every DayN_PartM function in the DayN modules, optionally restricted to a selection of
+    days and parts. Functions solving both parts at once (DayN_Part1and2) are listed once for each
+    part.
+
+    Parameters
+    ----------
+    days : list(int) or None, optional
+        Days to include, or None to include every day.
+        The default is None.
+    parts : list(int) or None, optional
+        Parts to include, or None to include every part.
+        The default is None.
+
+    Returns
+    -------
+    tasks : list(tuple(int, int, str))
+        List of (day, part, function_name) sorted by day and part.
+
+    """
+    tasks = []
+    for path in glob.glob(os.path.join(ROOT, 'Day*.py')):
+        # Extract day number from module name
+        day = int(re.fullmatch(r'Day(\d+)\.py', os.path.basename(path)).group(1))
+        if days and day not in days:
+            continue
+        # Search module source for solution functions, to avoid importing unselected modules
+        with open(path) as f:
+            source = f.read()
+        for name in re.findall(rf'^def (Day{day}_Part(\w+))\(', source, re.MULTILINE):
+            for part in (int(p) for p in name[1].split('and')):
+                if not parts or part in parts:
+                    tasks.append((day, part, name[0]))
+
+    return sorted(tasks)
+
+def default_input(day: int, input_dir: str='Inputs') -> str:
+    """
+    Return the default input file for a given day.
+
+    Parameters
+    ----------
+    day : int
+        Day number.
+    input_dir : str, optional
+        Directory containing the input files.
+        The default is 'Inputs'.
+
+    Returns
+    -------
+    input_file : str
+        Path to the input file.
+
+    """
+    return os.path.join(input_dir, f'Day{day}_Inputs.txt')
+
+def to_jsonable(obj):
+    """
+    Convert an answer returned by a DayN_PartM function into a JSON serialisable form.
+
+    Parameters
+    ----------
+    obj : any
+        Object to convert.
+
+    Returns
+    -------
+    any
+        JSON serialisable equivalent of obj, falling back to its string representation.
+
+    """
+    if isinstance(obj, (bool, int, float, str)) or obj is None:
+        return obj
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, (list, tuple, set, np.ndarray)):
+        return [to_jsonable(o) for o in obj]
+    if isinstance(obj, dict):
+        return {str(k): to_jsonable(v) for k, v in obj.items()}
+    return repr(obj)
+
+@contextlib.contextmanager
+def time_limit(seconds: float=None):
+    """
+    Context manager raising a TimeoutError in the enclosed block once a given number of seconds has
+    passed. Relies on SIGALRM, so it has no effect on platforms without it or outside of the main
+    thread.
+
+    Many of the solutions use bare except clauses, which would swallow a single TimeoutError and
+    carry on with corrupted state, so the error is raised again every 10 ms until it escapes, and
+    is raised on exit if the block still managed to finish after the time limit.
+
+    Parameters
+    ----------
+    seconds : float or None, optional
+        Time limit in seconds, or None for no limit.
+        The default is None.
+
+    """
+    if not seconds or not hasattr(signal, 'SIGALRM') or \
+        threading.current_thread() is not threading.main_thread():
+        yield
+        return
+
+    # Track whether the limit is still being enforced and whether it has been reached
+    active, expired = [True], []
+
+    def handler(signum, frame):
+        if active:
+            expired.append(True)
+            raise TimeoutError(f'Timed out after {seconds} seconds')
+
+    previous = signal.signal(signal.SIGALRM, handler)
+    signal.setitimer(signal.ITIMER_REAL, seconds, 0.01)
+    try:
+        yield
+    finally:
+        active.clear()
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+    if expired:
+        raise TimeoutError(f'Timed out after {seconds} seconds')
+
+def run_part(day: int, part: int, name: str, input_file: str, track_memory: bool=True,
+             show_output: bool=False, timeout: float=None, cache: result_cache.ResultCache=None,
+             refresh: bool=False, log_file: str=None, profile_dir: str=None) -> dict:
+    """
+    Run a single DayN_PartM function on an input file, measuring its wall time, CPU time and peak
+    memory allocated. If a cache is given, a previous answer for the same source code, arguments
+    and input file contents is returned instead of running the function again, in which case the
+    times measured are those of the cache lookup. Instrumentation is enabled if a structured log
+    or profile is requested, recording the spans and counters of the run.
+
+    Parameters
+    ----------
+    day : int
+        Day number.
+    part : int
+        Part number.
+    name : str
+        Name of the function to run.
+    input_file : str
+        Path to input file.
+    track_memory : bool, optional
+        Whether or not to trace memory allocations to find the peak memory, which slows down the
+        function being run.
+        The default is True.
+    show_output : bool, optional
+        Whether or not to let anything the function prints through to stdout.
+        The default is False.
+    timeout : float or None, optional
+        Time limit in seconds after which the function is stopped and a TimeoutError recorded, or
+        None for no limit.
+        The default is None.
+    cache : cache.ResultCache or None, optional
+        Cache to look answers up in and store them to, or None to always run the function.
+        The default is None.
+    refresh : bool, optional
+        Whether or not to run the function even if its answer is cached, updating the cache.
+        The default is False.
+    log_file : str or None, optional
+        Path to a JSON Lines file to append a summary of the instrumented run to, or None.
+        The default is None.
+    profile_dir : str or None, optional
+        Directory to dump cProfile statistics of the run to, as DayN_PartM_INPUT.pstats, or None.
+        The default is None.
+
+    Returns
+    -------
+    result : dict
+        Dictionary of the day, part, function, input file, answer, wall time (s), CPU time (s),
+        peak memory (bytes, or None if not tracked), error (or None if successful), whether
+        the answer came from the cache and the instrumentation counters (or None if not
+        instrumented).
+
+    """
+    result = {'day': day, 'part': part, 'function': name, 'input': input_file, 'answer': None,
+              'wall_time': None, 'cpu_time': None, 'peak_memory': None, 'error': None,
+              'cached': False, 'counters': None}
+    args = PUZZLE_ARGS.get((day, part), ())
+
+    key = None
+    if cache is not None:
+        wall, cpu = time.perf_counter(), time.process_time()
+        try:
+            key = result_cache.make_key(f'Day{day}', name, args, input_file)
+        except OSError:
+            # Unreadable input, so run the function anyway to report the error
+            pass
+        if key and not refresh and (entry := cache.get(key)) is not None:
+            result.update(answer=entry['answer'], wall_time=time.perf_counter() - wall,
+                          cpu_time=time.process_time() - cpu, cached=True)
+            return result
+
+    try:
+        func = getattr(importlib.import_module(f'Day{day}'), name)
+    except Exception as e:
+        result['error'] = repr(e)
+        return result
+
+    output = contextlib.nullcontext() if show_output else contextlib.redirect_stdout(io.StringIO())
+    if log_file or profile_dir:
+        profile_file = None
+        if profile_dir:
+            stem = os.path.splitext(os.path.basename(input_file))[0]
+            profile_file = os.path.join(profile_dir, f'Day{day}_Part{part}_{stem}.pstats')
+        instrumented = instrument.session(name, log_file, profile_file, day=day, part=part,
+                                          input=input_file)
+    else:
+        instrumented = contextlib.nullcontext()
+    session = None
+    if track_memory:
+        tracemalloc.start()
+    try:
+        # Open the session outside the time limit, so the alarm cannot interrupt writing its
+        # profile and log once the limit has passed
+        with output, instrumented as session, time_limit(timeout):
+            wall, cpu = time.perf_counter(), time.process_time()
+            answer = func(*args, input_file)
+            result['wall_time'] = time.perf_counter() - wall
+            result['cpu_time'] = time.process_time() - cpu
+        result['answer'] = to_jsonable(answer)
+    except Exception as e:
+        result['error'] = repr(e)
+    finally:
+        if session is not None:
+            result['counters'] = session.counters
+        if track_memory:
+            result['peak_memory'] = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+
+    if key and not result['error']:
+        cache.put(key, {'answer': result['answer']})
+
+    return result
+
+def format_table(results: list) -> str:
+    """
+    Format a list of results from run_part as a text table.
+
+    Parameters
+    ----------
+    results : list(dict)
+        Results as returned by run_part.
+
+    Returns
+    -------
+    table : str
+        The formatted table.
+
+    """
+    header = ('Day', 'Part', 'Input', 'Wall (s)', 'CPU (s)', 'Peak (MiB)', 'Answer')
+    rows = [header]
+    for r in results:
+        rows.append((str(r['day']), str(r['part']), os.path.basename(r['input']),
+                     '-' if r['wall_time'] is None else f"{r['wall_time']:.4f}",
+                     '-' if r['cpu_time'] is None else f"{r['cpu_time']:.4f}",
+                     '-' if r['peak_memory'] is None else f"{r['peak_memory']/2**20:.2f}",
+                     f"ERROR {r['error']}" if r['error'] else \
+                     str(r['answer'])[:60] + (' (cached)' if r.get('cached') else '')))
+    # Pad every column but the last to its widest entry
+    widths = [max(len(row[i]) for row in rows) for i in range(len(header) - 1)]
+    return '\n'.join('  '.join([c.ljust(w) for c, w in zip(row, widths)] + [row[-1]]) \
+                     for row in rows)
+
+def parse_args(argv: list=None) -> argparse.Namespace:
+    """
+    Parse the command line arguments of the runner.
+
+    Parameters
+    ----------
+    argv : list(str) or None, optional
+        Arguments to parse, or None to use sys.argv.
+        The default is None.
+
+    Returns
+    -------
+    args : argparse.Namespace
+        Parsed arguments.
+
+    """
+    parser = argparse.ArgumentParser(prog='python -m runner',
+                                     description='Run and time the DayN_PartM solutions.')
+    parser.add_argument('-d', '--days', type=int, nargs='+', help='days to run (default: all)')
+    parser.add_argument('-p', '--parts', type=int, nargs='+', choices=[1, 2],
+                        help='parts to run (default: both)')
+    parser.add_argument('-i', '--input', nargs='+', dest='inputs', metavar='FILE',
+                        help='input files to run every selected day against '
+                             '(default: INPUT_DIR/DayN_Inputs.txt)')
+    parser.add_argument('--input-dir', default='Inputs',
+                        help='directory containing the default input files (default: Inputs)')
+    parser.add_argument('--json', action='store_true', help='print results as JSON')
+    parser.add_argument('--no-memory', action='store_true',
+                        help='do not trace peak memory, which slows down the solutions')
+    parser.add_argument('--show-output', action='store_true',
+                        help='show anything printed by the solutions')
+    parser.add_argument('--timeout', type=float,
+                        help='time limit in seconds for each part (default: none)')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='do not look up or store answers in the result cache')
+    parser.add_argument('--refresh', action='store_true',
+                        help='rerun every part and overwrite its cached answer')
+    parser.add_argument('--cache-dir', default=result_cache.DEFAULT_DIR,
+                        help=f'directory of the result cache (default: {result_cache.DEFAULT_DIR})')
+    parser.add_argument('--log', metavar='FILE',
+                        help='instrument the solutions, appending the spans and counters of each '
+                             'run to a JSON Lines file (cached parts are not rerun unless '
+                             '--refresh is given)')
+    parser.add_argument('--profile', metavar='DIR',
+                        help='instrument and profile the solutions, dumping pstats files to DIR')
+    return parser.parse_args(argv)
+
+def main(argv: list=None) -> list:
+    """
+    Run the selected DayN_PartM functions on the selected input files and print the results.
+
+    Parameters
+    ----------
+    argv : list(str) or None, optional
+        Command line arguments, or None to use sys.argv.
+        The default is None.
+
+    Returns
+    -------
+    results : list(dict)
+        Results as returned by run_part.
+
+    """
+    args = parse_args(argv)
+    # Make the DayN modules importable regardless of the working directory
+    if ROOT not in sys.path:
+        sys.path.insert(0, ROOT)
+
+    cache = None if args.no_cache else result_cache.ResultCache(args.cache_dir)
+    results = []
+    for day, part, name in discover(args.days, args.parts):
+        for input_file in args.inputs or [default_input(day, args.input_dir)]:
+            results.append(run_part(day, part, name, input_file, not args.no_memory,
+                                    args.show_output, args.timeout, cache, args.refresh,
+                                    args.log, args.profile))
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print(format_table(results))
+
+    return results
+
+if __name__ == '__main__':
+    main()